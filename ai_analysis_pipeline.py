@@ -6,18 +6,35 @@ Kenneth AI analysis pipeline for local audio files.
 from __future__ import annotations
 
 from dataclasses import dataclass
+import math
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence
 import wave
 
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from whisper_transcription import WhisperConfig, transcribe_audio_file
 from alert_dispatcher import send_stress_alert
 from keyword_threat_detection import detect_threats
 
 HIGH_STRESS_THRESHOLD = 70
 
+# Stress features (F0, ZCR, energy) need nothing above an 8 kHz Nyquist
+STRESS_FEATURE_SAMPLE_RATE = 16000
+
+# Whole-clip RMS below this is dead air: skip feature extraction entirely
+SILENCE_RMS_THRESHOLD = 1e-3
+
+# Speech F0 band searched by both pitch trackers
+PITCH_FMIN_HZ = 70.0
+PITCH_FMAX_HZ = 450.0
+
 DEFAULT_FLAGGED_TERMS = (
     "mayday",
     "pan-pan",
@@ -36,6 +53,20 @@ DEFAULT_FLAGGED_TERMS = (
 )
 
 
+# (feature, baseline, span, weight): each feature maps linearly onto 0-100
+# between baseline and baseline + span, and the weighted sum is the score.
+# Pitch variance: typical stressed speech variance is 1–10 Hz² (YIN returns
+# Hz values; variance of a 2-octave sweep ≈ 2–8 Hz²). The previous normalizer
+# (/1500) was calibrated for raw autocorrelation estimates and made this
+# component near-zero for librosa outputs.
+STRESS_COMPONENTS = (
+    ("pitch_variance_hz2", 0.0, 6.0, 0.45),
+    ("zero_crossing_rate", 0.03, 0.17, 0.25),
+    ("speech_rate_per_sec", 0.3, 2.5, 0.20),
+    ("rms_energy", 0.0, 0.25, 0.10),
+)
+
+
 @dataclass
 class StressFeatures:
     pitch_variance_hz2: float
@@ -53,8 +84,12 @@ def _load_audio_mono(audio_file_path: str | Path) -> tuple[np.ndarray, int]:
     try:
         import soundfile as sf
 
-        data, sample_rate = sf.read(str(path), always_2d=False)
-        audio = np.asarray(data, dtype=np.float32)
+        # Decode straight into one preallocated float32 buffer
+        with sf.SoundFile(str(path)) as sound_file:
+            frames, channels = sound_file.frames, sound_file.channels
+            buffer = np.empty((frames, channels) if channels > 1 else frames, dtype=np.float32)
+            audio = sound_file.read(dtype="float32", out=buffer)
+            sample_rate = sound_file.samplerate
         if audio.ndim > 1:
             audio = np.mean(audio, axis=1)
         return audio, int(sample_rate)
@@ -85,15 +120,70 @@ def _load_audio_mono(audio_file_path: str | Path) -> tuple[np.ndarray, int]:
     return samples, int(sample_rate)
 
 
+def _downsample_for_features(audio: np.ndarray, sample_rate: int) -> tuple[np.ndarray, int]:
+    target_rate = STRESS_FEATURE_SAMPLE_RATE
+    if sample_rate <= target_rate or audio.size == 0:
+        return audio, sample_rate
+    try:
+        from scipy.signal import resample_poly
+    except ImportError:
+        return audio, sample_rate
+
+    divisor = math.gcd(target_rate, sample_rate)
+    resampled = resample_poly(audio, target_rate // divisor, sample_rate // divisor)
+    return resampled.astype(np.float32, copy=False), target_rate
+
+
 def _frame_audio(audio: np.ndarray, frame_size: int, hop_size: int) -> np.ndarray:
+    # Read-only strided view: the frames share memory with ``audio``.
     if audio.size < frame_size:
         return np.empty((0, frame_size), dtype=np.float32)
-    frame_count = 1 + (audio.size - frame_size) // hop_size
-    frames = np.empty((frame_count, frame_size), dtype=np.float32)
-    for index in range(frame_count):
-        start = index * hop_size
-        frames[index] = audio[start : start + frame_size]
-    return frames
+    windows = np.lib.stride_tricks.sliding_window_view(audio, frame_size)
+    return windows[::hop_size]
+
+
+if NUMBA_AVAILABLE:
+    # No signed-zero or NaN assumptions: the sign test must see -0.0 as negative
+    @njit(cache=True, fastmath={"reassoc", "contract"})
+    def _frame_energy_crossings_kernel(audio, frame_size, hop_size, frame_rms):
+        """Fill frame_rms and return the summed in-frame sign changes, one pass per frame"""
+        crossings = 0
+        for k in range(frame_rms.size):
+            start = k * hop_size
+            first = audio[start]
+            energy = first * first
+            prev_negative = math.copysign(1.0, first) < 0.0
+            for j in range(start + 1, start + frame_size):
+                x = audio[j]
+                energy += x * x
+                negative = math.copysign(1.0, x) < 0.0
+                crossings += negative != prev_negative
+                prev_negative = negative
+            frame_rms[k] = math.sqrt(energy / frame_size)
+        return crossings
+
+
+def _frame_energy_and_crossings(
+    audio: np.ndarray, frames: np.ndarray, frame_size: int, hop_size: int
+) -> tuple[np.ndarray, int]:
+    """Per-frame RMS and the total count of sign changes inside the frames."""
+    if NUMBA_AVAILABLE:
+        frame_rms = np.empty(frames.shape[0], dtype=np.float32)
+        crossings = _frame_energy_crossings_kernel(
+            np.ascontiguousarray(audio, dtype=np.float32), frame_size, hop_size, frame_rms
+        )
+        return frame_rms, int(crossings)
+
+    # Row-wise dot products stay float32 and avoid a frames-sized temporary.
+    frame_rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / np.float32(frame_size))
+    # Sign changes are found once per sample; a prefix sum then gives each
+    # frame's count without materialising the overlapping frames.
+    sign_bits = np.signbit(audio)
+    changes = np.zeros(audio.size, dtype=np.int64)
+    np.cumsum(sign_bits[1:] != sign_bits[:-1], out=changes[1:])
+    starts = np.arange(frames.shape[0]) * hop_size
+    frame_crossings = changes[starts + frame_size - 1] - changes[starts]
+    return frame_rms, int(frame_crossings.sum())
 
 
 def _estimate_pitch_hz(frame: np.ndarray, sample_rate: int) -> float:
@@ -120,6 +210,10 @@ def extract_stress_features(audio_file_path: str | Path) -> StressFeatures:
     audio, sample_rate = _load_audio_mono(audio_file_path)
     if audio.size == 0:
         return StressFeatures(0.0, 0.0, 0.0, 0.0, 0.0)
+    clip_rms = float(np.sqrt(np.mean(audio * audio)))
+    if clip_rms < SILENCE_RMS_THRESHOLD:
+        return StressFeatures(0.0, 0.0, 0.0, clip_rms, 0.0)
+    audio, sample_rate = _downsample_for_features(audio, sample_rate)
 
     frame_size = max(256, int(0.03 * sample_rate))
     hop_size = max(128, int(0.01 * sample_rate))
@@ -128,46 +222,47 @@ def extract_stress_features(audio_file_path: str | Path) -> StressFeatures:
         rms = float(np.sqrt(np.mean(audio * audio)))
         return StressFeatures(0.0, 0.0, 0.0, rms, 0.0)
 
-    frame_rms = np.sqrt(np.mean(frames * frames, axis=1))
+    frame_rms, crossings = _frame_energy_and_crossings(audio, frames, frame_size, hop_size)
     rms_energy = float(np.mean(frame_rms))
 
     voiced_mask = frame_rms > max(0.02, float(np.median(frame_rms) * 0.75))
-    voiced_pitches: List[float] = []
-    for frame, voiced in zip(frames, voiced_mask):
-        if not voiced:
-            continue
-        pitch = _estimate_pitch_hz(frame, sample_rate)
-        if 70.0 <= pitch <= 450.0:
-            voiced_pitches.append(pitch)
-
-    pitch_variance = float(np.var(voiced_pitches)) if len(voiced_pitches) > 1 else 0.0
     voiced_ratio = float(np.mean(voiced_mask)) if voiced_mask.size else 0.0
-    zcr = float(np.mean(np.abs(np.diff(np.signbit(audio)).astype(np.float32))))
-
-    try:
-        import librosa
-
-        # Prefer librosa for robust pitch + ZCR extraction.
-        f0, _, _ = librosa.pyin(
-            audio,
-            fmin=librosa.note_to_hz("C2"),
-            fmax=librosa.note_to_hz("C7"),
-            sr=sample_rate,
-            frame_length=frame_size,
-            hop_length=hop_size,
-        )
-        voiced_f0 = f0[np.isfinite(f0)] if f0 is not None else np.array([])
-        if voiced_f0.size > 1:
-            pitch_variance = float(np.var(voiced_f0))
-
-        zcr_matrix = librosa.feature.zero_crossing_rate(
-            y=audio, frame_length=frame_size, hop_length=hop_size
-        )
-        if zcr_matrix.size:
-            zcr = float(np.mean(zcr_matrix))
-    except Exception:
+    # Zero-crossing rate over the same frames used for RMS and pitch.
+    zcr = float(crossings / frames.size)
+
+    # YIN only reads F0 on voiced frames, so skip it when there are none.
+    pitch_variance: Optional[float] = None
+    if voiced_mask.any():
+        try:
+            import librosa
+
+            # Prefer librosa for robust pitch extraction. Plain YIN (no pyin
+            # HMM decoding) is enough for an F0 variance; frames are uncentered so
+            # they line up with voiced_mask, which supplies the voicing decision.
+            f0 = librosa.yin(
+                audio,
+                fmin=PITCH_FMIN_HZ,
+                fmax=PITCH_FMAX_HZ,
+                sr=sample_rate,
+                frame_length=frame_size,
+                hop_length=hop_size,
+                center=False,
+            )
+            voiced_f0 = f0[: voiced_mask.size][voiced_mask[: f0.size]]
+            voiced_f0 = voiced_f0[np.isfinite(voiced_f0)].astype(np.float32, copy=False)
+            if voiced_f0.size > 1:
+                pitch_variance = float(np.var(voiced_f0))
+        except Exception:
+            pass
+
+    if pitch_variance is None:
         # Fallback to numpy/autocorrelation-derived features.
-        pass
+        voiced_pitches: List[float] = []
+        for frame in frames[voiced_mask]:
+            pitch = _estimate_pitch_hz(frame, sample_rate)
+            if PITCH_FMIN_HZ <= pitch <= PITCH_FMAX_HZ:
+                voiced_pitches.append(pitch)
+        pitch_variance = float(np.var(voiced_pitches)) if len(voiced_pitches) > 1 else 0.0
 
     # Approximate speech rate by counting voiced onsets per second.
     onsets = np.logical_and(voiced_mask[1:], np.logical_not(voiced_mask[:-1]))
@@ -198,23 +293,10 @@ def score_stress(audio_features: StressFeatures | Dict[str, float]) -> int:
             voiced_ratio=float(audio_features.get("voiced_ratio", 0.0)),
         )
 
-    # Normalize pitch variance: typical stressed speech variance is 1–10 Hz²
-    # (librosa pyin returns Hz values; variance of a 2-octave sweep ≈ 2–8 Hz²).
-    # The previous normalizer (/1500) was calibrated for raw autocorrelation
-    # estimates and made this component near-zero for librosa outputs.
-    pitch_component = min(100.0, (features.pitch_variance_hz2 / 6.0) * 100.0)
-    zcr_component = min(100.0, max(0.0, ((features.zero_crossing_rate - 0.03) / 0.17) * 100.0))
-    speech_component = min(
-        100.0, max(0.0, ((features.speech_rate_per_sec - 0.3) / 2.5) * 100.0)
-    )
-    energy_component = min(100.0, (features.rms_energy / 0.25) * 100.0)
-
-    raw_score = (
-        0.45 * pitch_component
-        + 0.25 * zcr_component
-        + 0.20 * speech_component
-        + 0.10 * energy_component
-    )
+    raw_score = 0.0
+    for field, baseline, span, weight in STRESS_COMPONENTS:
+        component = (getattr(features, field) - baseline) / span * 100.0
+        raw_score += weight * min(100.0, max(0.0, component))
     bounded = int(round(min(100.0, max(0.0, raw_score))))
     return bounded
 
@@ -224,6 +306,24 @@ def compute_stress_score(audio_file_path: str | Path) -> int:
     return score_stress(features)
 
 
+def compute_stress_scores(
+    audio_file_paths: Iterable[str | Path],
+    max_workers: Optional[int] = None,
+) -> List[int]:
+    """
+    Stress scores for many files, one file per worker process.
+    Scores are returned in input order.
+    """
+    paths = [str(path) for path in audio_file_paths]
+    if len(paths) <= 1 or max_workers == 1:
+        return [compute_stress_score(path) for path in paths]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(compute_stress_score, paths, chunksize=4))
+
+
 def classify_threat_keywords(
     text: str,
     flagged_terms: Optional[Sequence[str]] = None,
@@ -321,6 +421,7 @@ __all__ = [
     "analyse_transmission",
     "classify_threat_keywords",
     "compute_stress_score",
+    "compute_stress_scores",
     "extract_stress_features",
     "find_audio_files",
     "score_stress",
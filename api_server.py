@@ -34,6 +34,7 @@ import wave
 import shlex
 import urllib.request
 import urllib.error
+from functools import lru_cache
 from pathlib import Path
 from api_maritime_aviation import add_maritime_aviation_routes
 from alert_dispatcher import send_stress_alert
@@ -478,12 +479,18 @@ def _decode_audio_samples(audio_bytes: bytes, filename: str) -> Tuple[np.ndarray
                 sample_rate = wav.getframerate()
                 sample_width = wav.getsampwidth()
                 frames = wav.readframes(wav.getnframes())
+                # One bulk read, then a single float32 allocation per decode:
+                # the scale is applied by in-place ops, not a second temporary.
                 if sample_width == 1:
-                    samples = np.frombuffer(frames, dtype=np.uint8).astype(np.float32)
-                    samples = (samples - 128.0) / 128.0
+                    samples = np.subtract(
+                        np.frombuffer(frames, dtype=np.uint8), np.float32(128.0), dtype=np.float32
+                    )
+                    samples *= np.float32(1.0 / 128.0)
                 elif sample_width == 2:
-                    samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
-                    samples = samples / 32768.0
+                    # WAV PCM is little-endian regardless of the host
+                    samples = np.multiply(
+                        np.frombuffer(frames, dtype="<i2"), np.float32(1.0 / 32768.0), dtype=np.float32
+                    )
                 else:
                     samples = np.frombuffer(frames, dtype=np.int8).astype(np.float32) / 128.0
 
@@ -497,12 +504,12 @@ def _decode_audio_samples(audio_bytes: bytes, filename: str) -> Tuple[np.ndarray
     return samples, 8000
 
 
-def _safe_cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
-    denom = np.linalg.norm(a) * np.linalg.norm(b)
-    if denom <= 0:
-        return 0.0
-    score = float(np.dot(a, b) / denom)
-    return max(0.0, min(1.0, (score + 1.0) / 2.0))
+@lru_cache(maxsize=8)
+def _rfft_frequencies(n_fft: int, sample_rate: int) -> np.ndarray:
+    """Frequency grid for an ``n_fft`` rfft, built once per (n_fft, rate)."""
+    freqs = np.fft.rfftfreq(n_fft, d=1.0 / sample_rate)
+    freqs.setflags(write=False)
+    return freqs
 
 
 def _extract_speaker_features(audio_bytes: bytes, filename: str) -> Dict[str, Any]:
@@ -526,14 +533,18 @@ def _extract_speaker_features(audio_bytes: bytes, filename: str) -> Dict[str, An
     fft_window = samples[: min(4096, samples.size)]
     fft_mag = np.abs(np.fft.rfft(fft_window))
     fft_mag_sum = float(np.sum(fft_mag) + 1e-8)
-    freqs = np.fft.rfftfreq(fft_window.size, d=1.0 / sample_rate)
-    centroid_hz = float(np.sum(freqs * fft_mag) / fft_mag_sum)
+    freqs = _rfft_frequencies(fft_window.size, int(sample_rate))
+    centroid_hz = float(np.dot(freqs, fft_mag) / fft_mag_sum)
 
     # Autocorrelation F0 estimate with sane speech bounds.
     ac_window = samples[: min(8192, samples.size)]
     centered = ac_window - np.mean(ac_window)
     if np.max(np.abs(centered)) > 1e-6:
-        autocorr = np.correlate(centered, centered, mode="full")[centered.size - 1 :]
+        # Wiener-Khinchin: |FFT|^2 of the zero-padded window gives the linear
+        # autocorrelation in O(N log N) instead of np.correlate's O(N^2).
+        n_fft = 1 << (2 * centered.size - 1).bit_length()
+        spectrum = np.fft.rfft(centered, n_fft)
+        autocorr = np.fft.irfft(spectrum.real**2 + spectrum.imag**2, n_fft)[: centered.size]
         min_lag = max(1, int(sample_rate / 300))
         max_lag = min(autocorr.size - 1, int(sample_rate / 70))
         if max_lag > min_lag:
@@ -607,15 +618,31 @@ def _load_speaker_profiles() -> None:
 
 
 def _find_best_speaker_match(embedding: np.ndarray) -> Dict[str, Any]:
-    best_id = None
-    best_score = 0.0
-    for speaker_id, profile in SPEAKER_PROFILES.items():
-        current = np.array(profile.embedding, dtype=np.float32)
-        score = _safe_cosine_similarity(embedding, current)
-        if score > best_score:
-            best_score = score
-            best_id = speaker_id
-    return {"speaker_id": best_id, "similarity": best_score}
+    """
+    Score the capture against every speaker centroid in one matrix-vector product.
+
+    Each profile keeps a single running centroid, so the cost grows with the
+    number of speakers, not captures. Cosine similarity is mapped onto [0, 1];
+    a zero-norm centroid scores 0.
+    """
+    if not SPEAKER_PROFILES:
+        return {"speaker_id": None, "similarity": 0.0}
+
+    speaker_ids = list(SPEAKER_PROFILES)
+    centroids = np.array(
+        [SPEAKER_PROFILES[speaker_id].embedding for speaker_id in speaker_ids],
+        dtype=np.float32,
+    )
+    denom = np.linalg.norm(centroids, axis=1) * np.linalg.norm(embedding)
+    cosine = np.divide(
+        centroids @ embedding, denom, out=np.full(len(speaker_ids), -1.0), where=denom > 0
+    )
+    scores = np.clip((cosine + 1.0) / 2.0, 0.0, 1.0)
+
+    best = int(np.argmax(scores))
+    if scores[best] <= 0.0:
+        return {"speaker_id": None, "similarity": 0.0}
+    return {"speaker_id": speaker_ids[best], "similarity": float(scores[best])}
 
 
 def _normalize_frequency_mhz(payload: AlertCreate) -> Optional[float]:
@@ -824,14 +851,30 @@ def _stress_payload(audio_path: Path) -> Dict[str, Any]:
     }
 
 
-def _post_json(url: str, payload: Dict[str, Any], headers: Dict[str, str], timeout: int) -> None:
+def _post_json_blocking(
+    url: str, payload: Dict[str, Any], headers: Dict[str, str], timeout: int
+) -> None:
     data = json.dumps(payload).encode("utf-8")
     request = urllib.request.Request(url, data=data, headers=headers, method="POST")
     with urllib.request.urlopen(request, timeout=timeout) as response:
         response.read()
 
 
-def _dispatch_alert_to_mission_control(alert: AlertRecord) -> None:
+async def _post_json(url: str, payload: Dict[str, Any], headers: Dict[str, str], timeout: int) -> None:
+    # urllib blocks, so each POST runs on a worker thread off the event loop
+    await asyncio.to_thread(_post_json_blocking, url, payload, headers, timeout)
+
+
+async def _post_mission_control_webhook(
+    url: str, payload: Dict[str, Any], headers: Dict[str, str], timeout: int
+) -> None:
+    try:
+        await _post_json(url, payload, headers, timeout)
+    except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError):
+        pass
+
+
+async def _dispatch_alert_to_mission_control(alert: AlertRecord) -> None:
     conversation_url = os.getenv("MC_CONVERSATION_WEBHOOK_URL")
     kanban_url = os.getenv("MC_KANBAN_WEBHOOK_URL")
     token = os.getenv("MC_WEBHOOK_BEARER_TOKEN")
@@ -849,19 +892,17 @@ def _dispatch_alert_to_mission_control(alert: AlertRecord) -> None:
         "alert": alert.dict(),
     }
 
+    # The two webhooks are independent; send them concurrently.
+    posts = []
     if conversation_url:
         payload = {**base_payload, "channel": "conversation"}
-        try:
-            _post_json(conversation_url, payload, headers, timeout)
-        except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError):
-            pass
+        posts.append(_post_mission_control_webhook(conversation_url, payload, headers, timeout))
 
     if kanban_url:
         payload = {**base_payload, "channel": "kanban"}
-        try:
-            _post_json(kanban_url, payload, headers, timeout)
-        except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError):
-            pass
+        posts.append(_post_mission_control_webhook(kanban_url, payload, headers, timeout))
+
+    await asyncio.gather(*posts)
 
 
 async def _broadcast_alert(alert: AlertRecord) -> None:
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the ElevenLabs upload scripts: preparing captures and playing results
+"""
+
+import io
+import os
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+
+def float_to_int16(audio_data):
+    """
+    Scale float audio by 32767 and saturate into int16, truncating like
+    np.clip(audio * 32767, -32768, 32767).astype(np.int16) but with a single
+    float temporary: the clip writes straight into the int16 output.
+    """
+    scaled = np.multiply(audio_data, 32767)
+    audio_16bit = np.empty(scaled.shape, dtype=np.int16)
+    np.clip(scaled, -32768, 32767, out=audio_16bit, casting='unsafe')
+    return audio_16bit
+
+
+@lru_cache(maxsize=16)
+def _int16_wav_bytes(path):
+    audio_data, sample_rate = sf.read(path)
+    audio_16bit = float_to_int16(audio_data)
+    buffer = io.BytesIO()
+    sf.write(buffer, audio_16bit, sample_rate, format='WAV')
+    return buffer.getvalue()
+
+
+def load_wav_as_int16_bytes(path):
+    """16-bit PCM WAV bytes for an audio file, encoded once per path and reused"""
+    return _int16_wav_bytes(str(Path(path).resolve()))
+
+
+def play_audio(path):
+    """Play a file with afplay, only when KENNETH_INTERACTIVE=1 (never under CI)"""
+    if os.getenv('KENNETH_INTERACTIVE') != '1':
+        print(f"   (playback skipped; set KENNETH_INTERACTIVE=1 to hear {Path(path).name})")
+        return
+    subprocess.run(['afplay', str(path)], check=False)
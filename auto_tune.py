@@ -123,7 +123,8 @@ def _mean_power_dbfs(iq_samples: np.ndarray) -> float:
     """Compute relative dBFS estimate from complex IQ samples."""
     if iq_samples.size == 0:
         return -200.0
-    power = float(np.mean(np.abs(iq_samples) ** 2))
+    # vdot(x, x) = sum(|x|^2) in one pass, without an |x| temporary or per-sample sqrt
+    power = float(np.vdot(iq_samples, iq_samples).real) / iq_samples.size
     return 10.0 * math.log10(power + 1e-20)
 
 
@@ -7,24 +7,124 @@ Can run for hours, locks onto active frequencies, comprehensive logging
 
 import subprocess
 import time
+import wave
 import numpy as np
-import soundfile as sf
 from pathlib import Path
 from datetime import datetime, timedelta
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import json
 import logging
+import math
+import scipy.fft
 from scipy import signal
 import queue
 import os
+from dataclasses import dataclass
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from scan_config import demod_mode_by_frequency_hz, load_scan_config
+from voice_analysis import decimate_for_analysis, rfft_envelope
 from whisper_transcription import (
     WhisperConfig,
     WhisperDependencyError,
     transcribe_audio_file,
 )
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath={"reassoc", "contract"})
+    def _sample_statistics_kernel(audio, envelope):
+        """Sample sum/energy, |sign(x[i]) - sign(x[i-1])| total and envelope moments"""
+        total = 0.0
+        energy = 0.0
+        for i in range(audio.size):
+            x = np.float64(audio[i])
+            total += x
+            energy += x * x
+        # Stateless sign terms keep this loop free of a carried dependency
+        sign_changes = 0
+        for i in range(1, audio.size):
+            current = np.int64(audio[i] > 0.0) - np.int64(audio[i] < 0.0)
+            previous = np.int64(audio[i - 1] > 0.0) - np.int64(audio[i - 1] < 0.0)
+            sign_changes += abs(current - previous)
+        env_total = 0.0
+        env_energy = 0.0
+        for i in range(envelope.size):
+            e = np.float64(envelope[i])
+            env_total += e
+            env_energy += e * e
+        return total, energy, sign_changes, env_total, env_energy
+
+
+def _sample_statistics(audio_data, envelope):
+    """RMS, variance, zero-crossing rate and envelope modulation depth of a sample"""
+    n = len(audio_data)
+    if NUMBA_AVAILABLE:
+        total, energy, sign_changes, env_total, env_energy = _sample_statistics_kernel(
+            audio_data, envelope
+        )
+        mean = total / n
+        rms = math.sqrt(energy / n)
+        variance = max(energy / n - mean * mean, 0.0)
+        if envelope.size:
+            envelope_mean = env_total / envelope.size
+            envelope_std = math.sqrt(max(env_energy / envelope.size - envelope_mean ** 2, 0.0))
+        else:
+            envelope_mean = envelope_std = 0.0
+    else:
+        rms = np.sqrt(np.mean(audio_data**2))
+        variance = np.var(audio_data)
+        sign_changes = np.sum(np.abs(np.diff(np.sign(audio_data))))
+        envelope_mean = np.mean(envelope) if envelope.size else 0.0
+        envelope_std = np.std(envelope) if envelope.size else 0.0
+    modulation_depth = envelope_std / (envelope_mean + 1e-10)
+    return rms, variance, sign_changes / (n - 1), modulation_depth
+
+@dataclass(frozen=True)
+class ScanEntry:
+    """One slot in the hunt schedule, with its MHz value worked out up front."""
+
+    comm_type: str
+    name: str
+    frequency_hz: float
+    freq_mhz: float
+
+
+# Voice band (300-3400 Hz) analysis only needs a 16 kHz copy of each sample
+ANALYSIS_SAMPLE_RATE = 16000
+
+
+def write_pcm16_wav(path, audio_data, sample_rate):
+    """
+    Write float audio as 16-bit PCM WAV: clip/round into one int16 buffer and
+    hand it to a 1 MiB buffered file in a single writeframes call
+    """
+    scaled = np.multiply(audio_data, 32767, dtype=np.float32)
+    np.rint(scaled, out=scaled)
+    pcm16 = np.empty(scaled.shape, dtype='<i2')
+    np.clip(scaled, -32768, 32767, out=pcm16, casting='unsafe')
+
+    with open(path, 'wb', buffering=1 << 20) as raw, wave.open(raw, 'wb') as wav_file:
+        wav_file.setnchannels(pcm16.shape[1] if pcm16.ndim > 1 else 1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(int(sample_rate))
+        wav_file.writeframes(pcm16.tobytes())
+
+
+def _first_name_by_frequency(frequencies):
+    """Map each frequency to the first channel name that uses it."""
+    names = {}
+    for name, frequency_hz in frequencies.items():
+        names.setdefault(frequency_hz, name)
+    return names
+
+
 class AutonomousVoiceHunter:
     """Extended autonomous scanner for real RF voice communications"""
     
@@ -168,6 +268,17 @@ class AutonomousVoiceHunter:
         # Priority levels for intelligent scanning
         self.high_priority_maritime = ['CH16', 'CH13', 'CH09', 'CH22A', 'CH21A']
         self.high_priority_aviation = ['EMERGENCY_121.5', 'GUARD_243.0', 'ATC_118.1', 'ATC_119.1', 'CTAF_122.9']
+        # Priority lookups by frequency, so create_rf_sample needs no reverse dict search
+        self._priority_maritime_hz = frozenset(
+            freq for freq, name in _first_name_by_frequency(self.maritime_frequencies).items()
+            if name in self.high_priority_maritime
+        )
+        self._priority_aviation_hz = frozenset(
+            freq for freq, name in _first_name_by_frequency(self.aviation_frequencies).items()
+            if name in self.high_priority_aviation
+        )
+        # Weighted scan order, built once; hunts iterate it cycle after cycle
+        self.scan_schedule = self.build_scan_schedule()
         
         # Voice detection parameters
         self.quick_sample_duration = 8    # Quick samples to detect voice
@@ -203,6 +314,11 @@ class AutonomousVoiceHunter:
         self.transcripts_dir.mkdir(parents=True, exist_ok=True)
         self.transcriptions = []
         self.whisper_model_size = os.getenv("KENNETH_WHISPER_MODEL", "large-v3")
+        # Transcribe each capture as it is saved. KENNETH_DEFER_TRANSCRIPTION=1
+        # queues them instead; run_autonomous_hunt flushes the queue at every
+        # progress summary and at the end of the hunt.
+        self.defer_transcription = os.getenv("KENNETH_DEFER_TRANSCRIPTION", "0") == "1"
+        self.pending_transcriptions = []
         
         self.logger.info(f"🎯 Autonomous Voice Hunter initialized")
         self.logger.info(f"Session: {session_name}")
@@ -231,7 +347,7 @@ class AutonomousVoiceHunter:
 
     def _write_wav_with_metadata(self, audio_file: Path, audio_data, sample_rate: int, metadata: dict) -> None:
         """Persist WAV plus forensic metadata sidecar."""
-        sf.write(audio_file, audio_data, sample_rate)
+        write_pcm16_wav(audio_file, audio_data, sample_rate)
         merged = dict(metadata)
         merged["audio_file"] = str(audio_file)
         merged["sample_rate_hz"] = int(sample_rate)
@@ -249,8 +365,10 @@ class AutonomousVoiceHunter:
         text_file = self.transcripts_dir / f"{transcript_stem}.txt"
         json_file = self.transcripts_dir / f"{transcript_stem}.json"
 
-        text_file.write_text((transcript.get("text") or "").strip() + "\n", encoding="utf-8")
-        json_file.write_text(json.dumps(transcript, indent=2), encoding="utf-8")
+        # Serialise once and write raw bytes: one encode per artifact. The JSON
+        # sidecar is read by people, so it stays indented.
+        text_file.write_bytes(((transcript.get("text") or "").strip() + "\n").encode("utf-8"))
+        json_file.write_bytes(json.dumps(transcript, indent=2, ensure_ascii=False).encode("utf-8"))
         return text_file, json_file
 
     def _auto_transcribe_capture(self, audio_file: Path, freq_name: str, frequency_hz: float):
@@ -283,6 +401,35 @@ class AutonomousVoiceHunter:
         except Exception as exc:
             self.logger.error(f"   ❌ Transcription failed: {exc}")
         return None
+
+    def _queue_transcription(self, audio_file: Path, freq_name: str, frequency_hz: float, capture_info=None):
+        """Transcribe now, or queue the capture for transcribe_pending_captures()."""
+        if self.defer_transcription:
+            self.pending_transcriptions.append((audio_file, freq_name, frequency_hz, capture_info))
+            return None
+        transcript = self._auto_transcribe_capture(audio_file, freq_name, frequency_hz)
+        if transcript and capture_info is not None:
+            capture_info["transcript"] = transcript.get("text", "")
+            capture_info["transcript_language"] = transcript.get("language")
+        return transcript
+
+    def transcribe_pending_captures(self):
+        """Batch-transcribe queued captures; the Whisper model loads once for the whole pass."""
+        if not self.pending_transcriptions:
+            return 0
+
+        pending, self.pending_transcriptions = self.pending_transcriptions, []
+        self.logger.info(f"\n📝 Transcribing {len(pending)} queued captures...")
+        transcribed = 0
+        for audio_file, freq_name, frequency_hz, capture_info in pending:
+            transcript = self._auto_transcribe_capture(audio_file, freq_name, frequency_hz)
+            if not transcript:
+                continue
+            transcribed += 1
+            if capture_info is not None:
+                capture_info["transcript"] = transcript.get("text", "")
+                capture_info["transcript_language"] = transcript.get("language")
+        return transcribed
         
     def create_rf_sample(self, frequency_hz, duration, gain=40):
         """Create realistic RF sample based on frequency characteristics"""
@@ -302,15 +449,13 @@ class AutonomousVoiceHunter:
             # Maritime more active during daytime
             voice_probability = 0.4 if 8 <= current_hour <= 18 else 0.2
             # Higher probability on key channels
-            freq_name = [name for name, freq in self.maritime_frequencies.items() if freq == frequency_hz]
-            if freq_name and freq_name[0] in self.high_priority_maritime:
+            if frequency_hz in self._priority_maritime_hz:
                 voice_probability *= 2
                 
         elif 118 <= freq_mhz <= 137:  # Aviation
             # Aviation active most of the day
             voice_probability = 0.5 if 6 <= current_hour <= 22 else 0.1
-            freq_name = [name for name, freq in self.aviation_frequencies.items() if freq == frequency_hz]
-            if freq_name and freq_name[0] in self.high_priority_aviation:
+            if frequency_hz in self._priority_aviation_hz:
                 voice_probability *= 1.5
         else:
             voice_probability = 0.05
@@ -446,34 +591,38 @@ class AutonomousVoiceHunter:
         
         if len(audio_data) < 1000:
             return False, 0.0, 0.0, self._voice_ratio_threshold_for_frequency(frequency_hz)
+        
+        # Keep Welch, the envelope and the reductions in single precision
+        audio_data = np.asarray(audio_data, dtype=np.float32)
             
         # Multiple voice detection metrics
         
-        # 1. RMS energy
-        rms = np.sqrt(np.mean(audio_data**2))
-        
-        # 2. Spectral voice band analysis
-        freqs, psd = signal.welch(audio_data, sample_rate, nperseg=min(1024, len(audio_data)//4))
+        # 1. RMS energy, variance, zero crossing rate and modulation depth
+        # (speech has high modulation), gathered in one pass where Numba is available
+        try:
+            envelope = rfft_envelope(audio_data)
+        except Exception:
+            envelope = np.empty(0, dtype=np.float32)
+        rms, total_power, zcr, modulation_depth = _sample_statistics(audio_data, envelope)
+        
+        # 2. Spectral voice band analysis on a 16 kHz copy, normalized by the
+        # full-rate variance
+        analysis_audio, analysis_rate = decimate_for_analysis(
+            audio_data, sample_rate, ANALYSIS_SAMPLE_RATE
+        )
+        # Long captures split into many segments; let pocketfft spread them over all cores
+        with scipy.fft.set_workers(-1):
+            freqs, psd = signal.welch(
+                analysis_audio, analysis_rate, nperseg=min(1024, len(analysis_audio)//4)
+            )
         voice_band = (freqs >= 300) & (freqs <= 3400)
         if np.any(voice_band):
-            voice_power = np.sum(psd[voice_band])
-            total_power = np.sum(psd)
+            voice_power = np.sum(psd[voice_band]) * (freqs[1] - freqs[0])
             voice_ratio = voice_power / (total_power + 1e-10)
         else:
             voice_ratio = 0
             
-        # 3. Modulation depth (speech has high modulation)
-        try:
-            envelope = np.abs(signal.hilbert(audio_data))
-            envelope_mean = np.mean(envelope)
-            envelope_std = np.std(envelope)
-            modulation_depth = envelope_std / (envelope_mean + 1e-10)
-        except:
-            modulation_depth = 0
-            
-        # 4. Zero crossing rate (voice has moderate ZCR)
-        zero_crossings = np.sum(np.abs(np.diff(np.sign(audio_data))))
-        zcr = zero_crossings / (len(audio_data) - 1)
+        # 3. Zero crossing rate score (voice has moderate ZCR)
         zcr_score = 1 - abs(zcr - 0.1) / 0.1  # Optimal around 0.1
         zcr_score = max(0, zcr_score)
         
@@ -502,8 +651,12 @@ class AutonomousVoiceHunter:
         rms_dbfs = 20.0 * np.log10(max(rms, 1e-12))
         return rms >= self.noise_gate_rms, rms_dbfs, rms
     
-    def scan_frequency(self, freq_name, frequency_hz):
-        """Scan single frequency for voice activity"""
+    def scan_frequency(self, freq_name, frequency_hz, prefetched=None):
+        """Scan single frequency for voice activity
+
+        prefetched is an optional future for this frequency's quick sample,
+        captured in the background while the previous scan was analysed.
+        """
         
         freq_mhz = frequency_hz / 1e6
         timestamp = datetime.now()
@@ -512,10 +665,13 @@ class AutonomousVoiceHunter:
         
         try:
             # Create quick sample for voice detection
-            audio_sample, has_voice_sim = self.create_rf_sample(
-                frequency_hz, 
-                self.quick_sample_duration
-            )
+            if prefetched is not None:
+                audio_sample, has_voice_sim = prefetched.result()
+            else:
+                audio_sample, has_voice_sim = self.create_rf_sample(
+                    frequency_hz, 
+                    self.quick_sample_duration
+                )
             sample_rate = 48000
             
             # Analyze for voice activity
@@ -532,8 +688,14 @@ class AutonomousVoiceHunter:
                 self.logger.info(f"   ✅ HUMAN SPEECH DETECTED!")
                 self.stats['voice_detections'] += 1
                 
-                # Extended capture when voice found
-                return self.extended_voice_capture(freq_name, frequency_hz, timestamp)
+                # Extended capture when voice found; the quick-scan features go
+                # into its metadata sidecar
+                detection = {
+                    "voice_score": float(voice_score),
+                    "voice_ratio": float(voice_ratio),
+                    "voice_ratio_threshold": float(ratio_threshold),
+                }
+                return self.extended_voice_capture(freq_name, frequency_hz, timestamp, detection)
             else:
                 self.logger.info(f"   ❌ No voice - just carrier/noise")
                 return None, 0
@@ -543,8 +705,12 @@ class AutonomousVoiceHunter:
             self.stats['errors'] += 1
             return None, 0
     
-    def extended_voice_capture(self, freq_name, frequency_hz, start_time):
-        """Extended capture when voice is detected"""
+    def extended_voice_capture(self, freq_name, frequency_hz, start_time, detection=None):
+        """Extended capture when voice is detected
+
+        detection holds the quick-scan features that triggered the capture and
+        is recorded in its metadata sidecar.
+        """
         
         freq_mhz = frequency_hz / 1e6
         self.logger.info(f"\n🎯 VOICE LOCKED - Extended Capture")
@@ -583,6 +749,7 @@ class AutonomousVoiceHunter:
                     "frequency_hz": int(round(frequency_hz)),
                     "demod_mode": demod_mode,
                     "capture_type": "extended",
+                    "detection": detection,
                 },
             )
             
@@ -607,10 +774,7 @@ class AutonomousVoiceHunter:
                 'type': comm_type
             }
             self.voice_captures.append(capture_info)
-            transcript = self._auto_transcribe_capture(filepath, freq_name, frequency_hz)
-            if transcript:
-                capture_info["transcript"] = transcript.get("text", "")
-                capture_info["transcript_language"] = transcript.get("language")
+            self._queue_transcription(filepath, freq_name, frequency_hz, capture_info)
             
             self.logger.info(f"   ✅ Extended capture complete!")
             self.logger.info(f"   📁 Saved: {filename}")
@@ -639,7 +803,7 @@ class AutonomousVoiceHunter:
             monitor_sample, _ = self.create_rf_sample(frequency_hz, 10)
             sample_rate = 48000
             
-            has_voice, voice_score, _, _ = self.detect_voice_activity(
+            has_voice, voice_score, voice_ratio, ratio_threshold = self.detect_voice_activity(
                 monitor_sample, sample_rate, frequency_hz
             )
             
@@ -665,11 +829,16 @@ class AutonomousVoiceHunter:
                             "frequency_hz": int(round(frequency_hz)),
                             "demod_mode": demod_mode,
                             "capture_type": "continued",
+                            "detection": {
+                                "voice_score": float(voice_score),
+                                "voice_ratio": float(voice_ratio),
+                                "voice_ratio_threshold": float(ratio_threshold),
+                            },
                         },
                     )
 
                     self.logger.info(f"   📁 Additional capture: {additional_filename}")
-                    self._auto_transcribe_capture(additional_filepath, freq_name, frequency_hz)
+                    self._queue_transcription(additional_filepath, freq_name, frequency_hz)
                 else:
                     consecutive_quiet_periods += 1
                     additional_time += 10
@@ -689,6 +858,37 @@ class AutonomousVoiceHunter:
         self.logger.info(f"   ✅ Frequency went quiet - resuming scan (monitored {additional_time}s additional)")
         return additional_time
     
+    def build_scan_schedule(self):
+        """Weighted scan order, built once per hunt: priority channels appear 3x"""
+        maritime = {
+            name: ScanEntry('Maritime', name, freq, freq / 1e6)
+            for name, freq in self.maritime_frequencies.items()
+        }
+        aviation = {
+            name: ScanEntry('Aviation', name, freq, freq / 1e6)
+            for name, freq in self.aviation_frequencies.items()
+        }
+
+        schedule = []
+        # High-priority maritime, then aviation, at 3x weight
+        for entries, priority_names in (
+            (maritime, self.high_priority_maritime),
+            (aviation, self.high_priority_aviation),
+        ):
+            for name in priority_names:
+                if name in entries:
+                    schedule.extend([entries[name]] * 3)
+
+        # Remaining maritime, then aviation, once each
+        for entries, priority_names in (
+            (maritime, self.high_priority_maritime),
+            (aviation, self.high_priority_aviation),
+        ):
+            schedule.extend(
+                entry for name, entry in entries.items() if name not in priority_names
+            )
+        return schedule
+
     def run_autonomous_hunt(self):
         """Main autonomous hunting loop"""
         
@@ -699,81 +899,72 @@ class AutonomousVoiceHunter:
         self.logger.info("=" * 80)
         
         start_time = datetime.now()
+        deadline = start_time + timedelta(hours=self.max_runtime_hours)
         next_summary = start_time + timedelta(minutes=self.summary_interval)
         
-        # Combine frequencies with priority weighting
-        all_frequencies = []
-        
-        # Add high-priority maritime
-        for name in self.high_priority_maritime:
-            if name in self.maritime_frequencies:
-                all_frequencies.extend([
-                    ('Maritime', name, self.maritime_frequencies[name])
-                ] * 3)  # 3x weight
-        
-        # Add high-priority aviation
-        for name in self.high_priority_aviation:
-            if name in self.aviation_frequencies:
-                all_frequencies.extend([
-                    ('Aviation', name, self.aviation_frequencies[name])
-                ] * 3)  # 3x weight
-        
-        # Add remaining maritime frequencies
-        for name, freq in self.maritime_frequencies.items():
-            if name not in self.high_priority_maritime:
-                all_frequencies.append(('Maritime', name, freq))
+        self.logger.info(f"📋 Total frequency entries (with priority weighting): {len(self.scan_schedule)}")
         
-        # Add remaining aviation frequencies  
-        for name, freq in self.aviation_frequencies.items():
-            if name not in self.high_priority_aviation:
-                all_frequencies.append(('Aviation', name, freq))
-        
-        self.logger.info(f"📋 Total frequency entries (with priority weighting): {len(all_frequencies)}")
+        # Each entry paired with the one after it, wrapping to the start of the next cycle
+        upcoming_entries = self.scan_schedule[1:] + self.scan_schedule[:1]
+        # One background worker captures the next quick sample while the
+        # current one is analysed, so the radio is not idle during detection
+        prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rf-prefetch")
+        pending = None
         
         try:
-            while True:
-                # Check runtime limit
-                elapsed = datetime.now() - start_time
-                if elapsed.total_seconds() > self.max_runtime_hours * 3600:
-                    self.logger.info(f"⏰ Maximum runtime reached ({self.max_runtime_hours} hours)")
-                    break
-                
+            while self.scan_schedule and datetime.now() < deadline:
                 # Scan through all frequencies
-                for comm_type, freq_name, frequency in all_frequencies:
+                for entry, upcoming in zip(self.scan_schedule, upcoming_entries):
                     current_time = datetime.now()
+                    if current_time >= deadline:
+                        break
                     
                     # Progress summary
                     if current_time >= next_summary:
-                        self.print_progress_summary(elapsed)
+                        # Flush deferred transcriptions so a killed session loses
+                        # at most one summary interval of them
+                        self.transcribe_pending_captures()
+                        self.print_progress_summary(current_time - start_time)
                         next_summary = current_time + timedelta(minutes=self.summary_interval)
                     
+                    if pending is None:
+                        pending = prefetcher.submit(
+                            self.create_rf_sample, entry.frequency_hz, self.quick_sample_duration
+                        )
+                    current, pending = pending, prefetcher.submit(
+                        self.create_rf_sample, upcoming.frequency_hz, self.quick_sample_duration
+                    )
+                    
                     # Scan frequency
-                    capture_file, capture_duration = self.scan_frequency(freq_name, frequency)
+                    capture_file, capture_duration = self.scan_frequency(
+                        entry.name, entry.frequency_hz, prefetched=current
+                    )
                     
                     if capture_file:
                         self.logger.info(f"   🎉 Voice capture successful - {capture_duration}s")
+                        # The lookahead sample predates the lock; take a fresh one
+                        pending.cancel()
+                        pending = None
                     
                     # Brief pause between frequencies (unless we just did extended capture)
                     if capture_duration == 0:
                         time.sleep(self.pause_between_freqs)
-                    
-                    # Check runtime again
-                    elapsed = datetime.now() - start_time
-                    if elapsed.total_seconds() > self.max_runtime_hours * 3600:
-                        break
-                
-                if elapsed.total_seconds() > self.max_runtime_hours * 3600:
-                    break
-                    
-                # End of cycle
-                self.logger.info(f"\n🔄 Completed full frequency cycle - starting next cycle...")
+                else:
+                    # End of cycle
+                    self.logger.info(f"\n🔄 Completed full frequency cycle - starting next cycle...")
+            
+            if datetime.now() >= deadline:
+                self.logger.info(f"⏰ Maximum runtime reached ({self.max_runtime_hours} hours)")
                 
         except KeyboardInterrupt:
             self.logger.info(f"\n👋 Hunt interrupted by user")
         except Exception as e:
             self.logger.error(f"❌ Hunt error: {e}")
+        finally:
+            prefetcher.shutdown(wait=True, cancel_futures=True)
             
-        # Final summary and processing
+        # Final transcription, summary and processing
+        self.transcribe_pending_captures()
         self.final_summary()
         self.process_all_captures()
         
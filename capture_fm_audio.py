@@ -60,9 +60,8 @@ def demodulate_fm(iq_file, sample_rate):
     
     print(f"📊 Loaded {len(iq_data)} samples")
     
-    # FM demodulation using phase difference
-    phase = np.angle(iq_data)
-    demod = np.diff(np.unwrap(phase))
+    # FM demodulation using phase difference (polar discriminator, no unwrap)
+    demod = np.angle(iq_data[1:] * np.conj(iq_data[:-1]))
     
     # Normalize
     demod = demod / np.max(np.abs(demod))
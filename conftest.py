@@ -0,0 +1,30 @@
+import sys
+import types
+
+import pytest
+
+# Isolate API tests from optional maritime capture dependencies. This has to
+# be in place before any test module imports api_server.
+api_maritime_aviation_stub = types.ModuleType("api_maritime_aviation")
+api_maritime_aviation_stub.add_maritime_aviation_routes = lambda app: app
+sys.modules["api_maritime_aviation"] = api_maritime_aviation_stub
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient over api_server.app shared by every API test."""
+    from fastapi.testclient import TestClient
+
+    import api_server
+
+    return TestClient(api_server.app)
+
+
+@pytest.fixture(autouse=True)
+def _reset_alert_state():
+    """Start every test with an empty alert log when api_server is loaded."""
+    api_server = sys.modules.get("api_server")
+    if api_server is not None:
+        api_server.ALERTS.clear()
+        api_server.ALERT_CLIENTS.clear()
+    yield
@@ -11,6 +11,16 @@ import base64
 import os
 from pathlib import Path
 import time
+from functools import lru_cache
+from scipy import signal
+
+@lru_cache(maxsize=None)
+def voice_bandpass_coefficients(sample_rate):
+    """300-3400 Hz Butterworth band-pass, designed once per sample rate"""
+    nyquist = sample_rate // 2
+    low_cutoff = 300 / nyquist
+    high_cutoff = 3400 / nyquist  # Typical voice range upper limit
+    return signal.butter(4, [low_cutoff, high_cutoff], btype='band')
 
 class ElevenLabsVoiceIsolator:
     def __init__(self):
@@ -123,15 +133,8 @@ class ElevenLabsVoiceIsolator:
             print(f"   📊 Processing {len(data):,} samples at {sr} Hz")
             
             # Simple voice isolation techniques
-            # 1. High-pass filter to remove low-frequency noise
-            from scipy import signal
-            
-            # Design high-pass filter (remove frequencies below 300 Hz)
-            nyquist = sr // 2
-            low_cutoff = 300 / nyquist
-            high_cutoff = 3400 / nyquist  # Typical voice range upper limit
-            
-            b, a = signal.butter(4, [low_cutoff, high_cutoff], btype='band')
+            # 1. Band-pass filter to remove low-frequency noise (coefficients cached per rate)
+            b, a = voice_bandpass_coefficients(sr)
             filtered_audio = signal.filtfilt(b, a, data)
             
             # 2. Spectral subtraction for noise reduction
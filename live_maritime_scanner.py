@@ -118,11 +118,9 @@ class LiveMaritimeScanner:
             print(f"   📊 Loaded {len(iq_data):,} IQ samples")
             
             # FM demodulation for marine VHF
-            # Calculate phase
-            phase = np.unwrap(np.angle(iq_data))
-            
-            # Differentiate to get instantaneous frequency (FM demod)
-            audio_signal = np.diff(phase)
+            # Instantaneous frequency from the phase step between samples
+            # (polar discriminator, so no cumulative unwrap drift)
+            audio_signal = np.angle(iq_data[1:] * np.conj(iq_data[:-1]))
             
             # Decimate to audio sample rate
             decimation = self.sample_rate // self.audio_sample_rate
@@ -175,7 +173,10 @@ class LiveMaritimeScanner:
         
         print(f"🎙️  Creating realistic {freq_name} communication...")
         
-        t = np.linspace(0, duration, int(self.audio_sample_rate * duration))
+        n_samples = int(self.audio_sample_rate * duration)
+        t = np.arange(n_samples, dtype=np.float32)
+        t *= np.float32(1.0 / self.audio_sample_rate)
+        two_pi = np.float32(2 * np.pi)
         
         # Maritime emergency call simulation
         segments = [
@@ -197,13 +198,13 @@ class LiveMaritimeScanner:
             
             if freq > 0:  # Voice segment
                 # Voice with harmonics
-                voice = (np.sin(2 * np.pi * freq * segment_t) * amp +
-                        np.sin(2 * np.pi * freq * 2.1 * segment_t) * amp * 0.6 +
-                        np.sin(2 * np.pi * freq * 3.1 * segment_t) * amp * 0.3)
+                voice = (np.sin(two_pi * np.float32(freq) * segment_t) * np.float32(amp) +
+                        np.sin(two_pi * np.float32(freq * 2.1) * segment_t) * np.float32(amp * 0.6) +
+                        np.sin(two_pi * np.float32(freq * 3.1) * segment_t) * np.float32(amp * 0.3))
                 
                 # Marine radio characteristics
-                voice *= (1 + 0.4 * np.sin(2 * np.pi * 3 * segment_t))  # Modulation
-                voice *= np.exp(-0.1 * np.abs(segment_t - np.mean(segment_t)))  # Envelope
+                voice *= 1 + np.float32(0.4) * np.sin(two_pi * np.float32(3) * segment_t)  # Modulation
+                voice *= np.exp(np.float32(-0.1) * np.abs(segment_t - segment_t.mean()))  # Envelope
                 
                 maritime_audio[start_idx:end_idx] = voice
                 
@@ -211,17 +212,16 @@ class LiveMaritimeScanner:
         
         # Add marine environment
         # VHF static
-        static = np.random.normal(0, 0.15, len(t))
+        final_signal = maritime_audio
+        final_signal += np.random.default_rng().normal(0, 0.15, n_samples).astype(np.float32)
         
         # Marine atmospheric noise
-        atmospheric = 0.1 * np.sin(2 * np.pi * 0.05 * t)
+        final_signal += np.float32(0.1) * np.sin(two_pi * np.float32(0.05) * t)
         
         # Radio equipment noise
-        equipment_noise = 0.05 * np.sin(2 * np.pi * 60 * t)  # 60Hz hum
+        final_signal += np.float32(0.05) * np.sin(two_pi * np.float32(60) * t)  # 60Hz hum
         
-        # Combine
-        final_signal = maritime_audio + static + atmospheric + equipment_noise
-        final_signal = final_signal / np.max(np.abs(final_signal)) * 0.8
+        final_signal *= np.float32(0.8) / np.max(np.abs(final_signal))
         
         # Save
         sf.write(wav_file, final_signal, self.audio_sample_rate)
@@ -191,19 +191,24 @@ class MaritimeAviationCapture:
                 self._write_stub_audio(out_path, seconds=5)
                 return str(out_path)
 
-            i = raw[0::2].astype(np.float32) - 127.5
-            q = raw[1::2].astype(np.float32) - 127.5
-            iq = i + 1j * q
+            # Keep I and Q as separate contiguous float32 arrays; no complex buffer
+            pairs = raw[: len(raw) // 2 * 2].reshape(-1, 2)
+            i = pairs[:, 0].astype(np.float32) - np.float32(127.5)
+            q = pairs[:, 1].astype(np.float32) - np.float32(127.5)
 
             if mode == "am":
-                audio = np.abs(iq)
-                audio = audio - np.mean(audio)
+                audio = np.hypot(i, q)
+                audio -= np.mean(audio)
             else:
-                if len(iq) < 2:
+                if len(i) < 2:
                     audio = np.array([], dtype=np.float32)
                 else:
-                    phase = np.unwrap(np.angle(iq))
-                    audio = np.diff(phase)
+                    # Polar discriminator angle(x[n] * conj(x[n-1])) on planar I/Q
+                    re = i[1:] * i[:-1]
+                    re += q[1:] * q[:-1]
+                    im = q[1:] * i[:-1]
+                    im -= i[1:] * q[:-1]
+                    audio = np.arctan2(im, re, out=im)
 
             if len(audio) == 0:
                 self._write_stub_audio(out_path, seconds=5)
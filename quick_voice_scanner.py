@@ -70,8 +70,7 @@ class VoiceActivityScanner:
                 return False
             
             # Simple FM demodulation
-            phase = np.unwrap(np.angle(iq_data))
-            audio = np.diff(phase)
+            audio = np.angle(iq_data[1:] * np.conj(iq_data[:-1]))
             
             # Voice activity indicators
             rms = np.sqrt(np.mean(audio**2))
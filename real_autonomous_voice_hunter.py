@@ -15,11 +15,14 @@ import threading
 import sys
 import json
 import logging
+import math
 from scipy import signal
 import queue
 import os
 import random
+from rtl_sdr_real_capture import uint8_iq_to_complex64
 from scan_config import demod_mode_by_frequency_hz
+from voice_analysis import WELCH_WINDOW, welch_voice_band
 from whisper_transcription import (
     WhisperConfig,
     WhisperDependencyError,
@@ -28,6 +31,9 @@ from whisper_transcription import (
 
 class RealAutonomousVoiceHunter:
     """Real autonomous scanner using actual SDRplay hardware"""
+
+    # IQ samples demodulated per block when streaming a capture file
+    DEMOD_BLOCK_SAMPLES = 1 << 20
     
     def __init__(self, session_name=None):
         # Session management
@@ -83,6 +89,9 @@ class RealAutonomousVoiceHunter:
         self.audio_sample_rate = 48000
         self.demod_audio_sample_rate = 16000
         self.configured_demod_modes = demod_mode_by_frequency_hz()
+        # Discriminator scratch buffers, grown to the longest capture seen and reused
+        self._demod_product = np.empty(0, dtype=np.complex64)
+        self._demod_phase = np.empty(0, dtype=np.float32)
         
         # Voice detection settings
         self.voice_threshold = 0.08  # Combined voice score threshold
@@ -199,23 +208,93 @@ class RealAutonomousVoiceHunter:
             resampled = resample_poly(audio, self.demod_audio_sample_rate, self.sample_rate)
         return resampled.astype(np.float32)
 
+    # The demodulators work in complex64/float32; FP64 buys nothing for 8-bit IQ.
     def demodulate_am(self, iq_samples):
-        envelope = np.abs(iq_samples)
+        envelope = np.abs(np.asarray(iq_samples, dtype=np.complex64))
         audio = envelope - np.mean(envelope)
         return self._resample_to_16k(audio)
 
+    def _phase_steps(self, iq_samples):
+        """angle(x[n] * conj(x[n-1])) computed in the reused scratch buffers; returns a view"""
+        iq_samples = np.asarray(iq_samples, dtype=np.complex64)
+        count = len(iq_samples) - 1
+        if self._demod_product.size < count:
+            self._demod_product = np.empty(count, dtype=np.complex64)
+            self._demod_phase = np.empty(count, dtype=np.float32)
+        product = self._demod_product[:count]
+        np.conjugate(iq_samples[:-1], out=product)
+        product *= iq_samples[1:]
+        phase = self._demod_phase[:count]
+        np.arctan2(product.imag, product.real, out=phase)
+        return phase
+
     def demodulate_nfm(self, iq_samples):
         if len(iq_samples) < 2:
             return np.array([], dtype=np.float32)
-        audio = np.angle(iq_samples[1:] * np.conj(iq_samples[:-1]))
-        return self._resample_to_16k(audio)
+        return self._resample_to_16k(self._phase_steps(iq_samples))
 
     def demodulate_fm(self, iq_samples):
         if len(iq_samples) < 2:
             return np.array([], dtype=np.float32)
-        phase = np.unwrap(np.angle(iq_samples))
-        audio = np.diff(phase)
-        return self._resample_to_16k(audio)
+        # Polar discriminator: per-sample phase step, no cumulative unwrap drift
+        return self._resample_to_16k(self._phase_steps(iq_samples))
+
+    def demodulate_iq_file(self, iq_file, demod_mode):
+        """
+        Demodulate an rtl_sdr uint8 IQ file to 16 kHz float32 audio, one block at
+        a time from a memory map, so a long lock never holds its full-rate IQ.
+
+        Blocks overlap by the resampler's filter length and only their interior
+        outputs are kept, which reproduces whole-capture resample_poly output.
+        """
+        raw_data = np.memmap(iq_file, dtype=np.uint8, mode='r')
+        try:
+            iq_count = len(raw_data) // 2
+            if demod_mode == "am":
+                total = iq_count
+                # First pass: the envelope mean, so the DC removal matches demodulate_am
+                envelope_sum = 0.0
+                for start in range(0, total, self.DEMOD_BLOCK_SAMPLES):
+                    stop = start + self.DEMOD_BLOCK_SAMPLES
+                    envelope_sum += float(
+                        np.abs(uint8_iq_to_complex64(raw_data[2 * start:2 * stop])).sum(dtype=np.float64)
+                    )
+                envelope_mean = np.float32(envelope_sum / max(total, 1))
+
+                def baseband(lo, hi):
+                    envelope = np.abs(uint8_iq_to_complex64(raw_data[2 * lo:2 * hi]))
+                    envelope -= envelope_mean
+                    return envelope
+            else:
+                total = max(0, iq_count - 1)
+
+                def baseband(lo, hi):
+                    # One extra IQ sample gives the phase step out of the block
+                    return self._phase_steps(uint8_iq_to_complex64(raw_data[2 * lo:2 * hi + 2]))
+
+            if total == 0:
+                return np.array([], dtype=np.float32)
+
+            common = math.gcd(int(self.demod_audio_sample_rate), int(self.sample_rate))
+            up = int(self.demod_audio_sample_rate) // common
+            down = int(self.sample_rate) // common
+            # resample_poly's default filter reaches 10 * max(up, down) input samples
+            # either side; round the overlap up to whole output periods
+            context = -(-10 * max(up, down) // down) * down
+            block = max(down, self.DEMOD_BLOCK_SAMPLES // down * down)
+
+            audio = np.empty(-(-total * up // down), dtype=np.float32)
+            for start in range(0, total, block):
+                lo = max(0, start - context)
+                hi = min(total, start + block + context)
+                resampled = signal.resample_poly(baseband(lo, hi), up, down)
+                out_lo = start * up // down
+                out_hi = min(len(audio), (start + block) * up // down)
+                skip = (start - lo) * up // down
+                audio[out_lo:out_hi] = resampled[skip:skip + out_hi - out_lo]
+        finally:
+            del raw_data
+        return audio
 
     # Backwards-compatible aliases for existing tests/callers.
     def _am_demodulate(self, iq_samples):
@@ -254,21 +333,11 @@ class RealAutonomousVoiceHunter:
                 self.logger.info(f"✅ REAL RF DATA: {file_size:,} bytes captured")
                 
                 # Convert IQ to audio
-                iq_samples = np.fromfile(iq_file, dtype=np.uint8)
-                
-                if len(iq_samples) > 2000:
-                    # Convert uint8 IQ to complex (-127.5 to +127.5)
-                    i_samples = iq_samples[::2].astype(float) - 127.5
-                    q_samples = iq_samples[1::2].astype(float) - 127.5
-                    iq_complex = i_samples + 1j * q_samples
-
+                if file_size > 2000:
+                    # Streamed from the file in blocks of complex64 in [-1, 1];
+                    # the audio is normalised below, so the scale does not matter
                     demod_mode = self._select_demod_mode(frequency_hz)
-                    if demod_mode == "am":
-                        audio_demod = self.demodulate_am(iq_complex)
-                    elif demod_mode == "nfm":
-                        audio_demod = self.demodulate_nfm(iq_complex)
-                    else:
-                        audio_demod = self.demodulate_fm(iq_complex)
+                    audio_demod = self.demodulate_iq_file(iq_file, demod_mode)
                     
                     # Audio processing for voice extraction
                     if len(audio_demod) > 0:
@@ -278,7 +347,9 @@ class RealAutonomousVoiceHunter:
                         # Voice band filter (300Hz - 3.4kHz for marine/aviation radio)
                         # Simple high-pass to remove low frequency noise
                         if len(audio_demod) > 200:
-                            audio_demod = audio_demod - np.convolve(audio_demod, np.ones(100)/100, mode='same')
+                            audio_demod = audio_demod - np.convolve(
+                                audio_demod, np.full(100, 0.01, dtype=np.float32), mode='same'
+                            )
                         
                         # Normalize 
                         if np.max(np.abs(audio_demod)) > 0:
@@ -509,11 +580,11 @@ class RealAutonomousVoiceHunter:
         
         # Spectral analysis for voice characteristics
         if len(audio_signal) > 1024:
-            freqs, psd = signal.welch(audio_signal, sample_rate, nperseg=1024)
+            freqs, psd = signal.welch(audio_signal, sample_rate, window=WELCH_WINDOW)
             
             # Voice band energy (300-3400 Hz)
-            voice_band_mask = (freqs >= 300) & (freqs <= 3400)
-            voice_energy = np.mean(psd[voice_band_mask]) if np.any(voice_band_mask) else 0
+            voice_lo, voice_hi = welch_voice_band(sample_rate)
+            voice_energy = np.mean(psd[voice_lo:voice_hi]) if voice_hi > voice_lo else 0
             
             # Total energy
             total_energy = np.mean(psd)
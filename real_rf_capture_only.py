@@ -12,6 +12,69 @@ from pathlib import Path
 from datetime import datetime
 import sys
 
+def normalize_audio(audio, peak=0.7):
+    """Remove DC and scale to ``peak`` in place, in two passes over the buffer"""
+    audio -= audio.mean()
+    max_abs = max(audio.max(), -audio.min())
+    if max_abs > 0:
+        audio *= peak / max_abs
+    return audio
+
+def split_iq(interleaved):
+    """Split interleaved I/Q values into contiguous float32 I and Q arrays"""
+    interleaved = np.asarray(interleaved)
+    pairs = interleaved[:len(interleaved) // 2 * 2].reshape(-1, 2)
+    i = np.ascontiguousarray(pairs[:, 0], dtype=np.float32)
+    q = np.ascontiguousarray(pairs[:, 1], dtype=np.float32)
+    return i, q
+
+def fm_discriminate(i, q):
+    """
+    Polar FM discriminator on split I/Q: angle(x[n] * conj(x[n-1])).
+    Works on plain float32 vectors, so no unwrap or complex deinterleave is needed.
+    """
+    re = i[1:] * i[:-1]
+    re += q[1:] * q[:-1]
+    im = q[1:] * i[:-1]
+    im -= i[1:] * q[:-1]
+    return np.arctan2(im, re, out=im)
+
+# IQ samples per readStream call; keeps the DSP working set cache-resident
+STREAM_CHUNK_SAMPLES = 65536
+
+class StreamingFMDemodulator:
+    """
+    Chunked FM discriminator + decimator.
+    Carries the last IQ sample and decimation phase across chunks so the
+    output matches demodulating the whole capture at once.
+    """
+    
+    def __init__(self, decimation, max_samples):
+        self.decimation = max(decimation, 1)
+        self.audio = np.empty(max_samples // self.decimation + 1, dtype=np.float32)
+        self.length = 0
+        self._offset = 0
+        self._last_iq = None
+    
+    def process(self, i, q):
+        """Demodulate one chunk of split I/Q and append the decimated audio"""
+        if len(i) == 0:
+            return
+        if self._last_iq is not None:
+            i = np.concatenate(([self._last_iq[0]], i))
+            q = np.concatenate(([self._last_iq[1]], q))
+        self._last_iq = (i[-1], q[-1])
+        
+        fm_demod = fm_discriminate(i, q)
+        picked = fm_demod[self._offset::self.decimation]
+        self.audio[self.length:self.length + len(picked)] = picked
+        self.length += len(picked)
+        self._offset = (self._offset - len(fm_demod)) % self.decimation
+    
+    def result(self):
+        """Audio produced so far"""
+        return self.audio[:self.length]
+
 class RealRFCapture:
     def __init__(self):
         self.device_detected = False
@@ -88,33 +151,29 @@ class RealRFCapture:
             rxStream = sdr.setupStream(SoapySDR.SOAPY_SDR_RX, SoapySDR.SOAPY_SDR_CF32)
             sdr.activateStream(rxStream)
             
-            # Capture
+            # Capture and demodulate chunk by chunk instead of buffering the whole capture
             samples_needed = int(2e6 * duration)
-            buff = np.array([0]*samples_needed, np.complex64)
+            demodulator = StreamingFMDemodulator(int(2e6 / 48000), samples_needed)
+            buff = np.empty(STREAM_CHUNK_SAMPLES, np.complex64)
+            received = 0
             
-            sr = sdr.readStream(rxStream, [buff], len(buff))
+            while received < samples_needed:
+                sr = sdr.readStream(rxStream, [buff], min(len(buff), samples_needed - received))
+                if sr.ret <= 0:
+                    break
+                demodulator.process(*split_iq(buff[:sr.ret].view(np.float32)))
+                received += sr.ret
             
             # Cleanup
             sdr.deactivateStream(rxStream)
             sdr.closeStream(rxStream)
             
-            if sr.ret > 1000:  # Got meaningful data
-                print(f"   ✅ Captured {sr.ret} IQ samples")
-                
-                # Simple FM demodulation for audio
-                phase = np.unwrap(np.angle(buff[:sr.ret]))
-                fm_demod = np.diff(phase)
-                
-                # Decimate to audio rate
-                decimation = int(2e6 / 48000)
-                if decimation > 1:
-                    audio = fm_demod[::decimation]
-                else:
-                    audio = fm_demod
+            if received > 1000:  # Got meaningful data
+                print(f"   ✅ Captured {received} IQ samples")
                 
-                # Normalize
-                if np.max(np.abs(audio)) > 0:
-                    audio = audio / np.max(np.abs(audio)) * 0.7
+                # Remove DC and normalize
+                audio = demodulator.result()
+                normalize_audio(audio)
                     
                 return audio[:int(48000 * duration)]  # Ensure correct length
             else:
@@ -147,23 +206,21 @@ class RealRFCapture:
             
             if result.returncode == 0 and Path(temp_file).exists():
                 # Read IQ data
-                iq_data = np.fromfile(temp_file, dtype=np.complex64)
+                i, q = split_iq(np.fromfile(temp_file, dtype=np.float32))
                 Path(temp_file).unlink()  # cleanup
                 
-                if len(iq_data) > 1000:
-                    print(f"   ✅ Captured {len(iq_data)} IQ samples with rx_sdr")
+                if len(i) > 1000:
+                    print(f"   ✅ Captured {len(i)} IQ samples with rx_sdr")
                     
                     # FM demodulate
-                    phase = np.unwrap(np.angle(iq_data))
-                    fm_demod = np.diff(phase)
+                    fm_demod = fm_discriminate(i, q)
                     
                     # To audio rate
                     decimation = int(2e6 / 48000)
                     audio = fm_demod[::decimation] if decimation > 1 else fm_demod
                     
-                    # Normalize
-                    if np.max(np.abs(audio)) > 0:
-                        audio = audio / np.max(np.abs(audio)) * 0.7
+                    # Remove DC and normalize
+                    normalize_audio(audio)
                         
                     return audio[:int(48000 * duration)]
                 else:
@@ -203,22 +260,19 @@ class RealRFCapture:
                 Path(temp_file).unlink()
                 
                 if len(raw_data) > 2000:
-                    # Convert to complex
-                    iq_data = raw_data[::2] + 1j * raw_data[1::2]
-                    iq_data = iq_data.astype(np.complex64) / 128.0
+                    # Split into I and Q (scale is irrelevant to the discriminator)
+                    i, q = split_iq(raw_data)
                     
-                    print(f"   ✅ HackRF captured {len(iq_data)} samples")
+                    print(f"   ✅ HackRF captured {len(i)} samples")
                     
                     # FM demodulate
-                    phase = np.unwrap(np.angle(iq_data))
-                    fm_demod = np.diff(phase)
+                    fm_demod = fm_discriminate(i, q)
                     
                     # To audio
                     decimation = int(2e6 / 48000)
                     audio = fm_demod[::decimation] if decimation > 1 else fm_demod
                     
-                    if np.max(np.abs(audio)) > 0:
-                        audio = audio / np.max(np.abs(audio)) * 0.7
+                    normalize_audio(audio)
                         
                     return audio[:int(48000 * duration)]
                 else:
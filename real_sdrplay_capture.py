@@ -119,8 +119,7 @@ sdr.closeStream(rxStream)
                         print(f"   📊 Loaded {len(iq_samples):,} real IQ samples")
                         
                         # FM demodulation for marine VHF
-                        phase = np.unwrap(np.angle(iq_samples))
-                        fm_demod = np.diff(phase)
+                        fm_demod = np.angle(iq_samples[1:] * np.conj(iq_samples[:-1]))
                         
                         # Decimate to audio rate
                         audio_rate = 48000
@@ -129,9 +128,10 @@ sdr.closeStream(rxStream)
                             fm_demod = fm_demod[::decimation]
                         
                         # Filter and normalize
-                        fm_demod = fm_demod - np.mean(fm_demod)  # Remove DC
-                        if np.max(np.abs(fm_demod)) > 0:
-                            fm_demod = fm_demod / np.max(np.abs(fm_demod)) * 0.8
+                        fm_demod -= fm_demod.mean()  # Remove DC
+                        peak = max(fm_demod.max(), -fm_demod.min())
+                        if peak > 0:
+                            fm_demod *= 0.8 / peak
                         
                         # Save audio
                         sf.write(wav_file, fm_demod, audio_rate)
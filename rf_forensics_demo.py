@@ -4,25 +4,91 @@ RF Digital Forensics Toolkit - Complete Pipeline Demo
 Demonstrates the end-to-end voice isolation and analysis workflow
 """
 
+import io
 import os
 import soundfile as sf
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must be selected before pyplot is imported
 import matplotlib.pyplot as plt
 from pathlib import Path
 import json
+import re
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Filename markers for the communication-type breakdown, matched in one pass
+COMM_TYPE_LABELS = {
+    'CH22A_(Coast_Guard)': 'Coast Guard',
+    'CH13_(Bridge-to-Bridge)': 'Bridge-to-Bridge',
+    'Approach_Control': 'Aviation ATC',
+    'Tower_Control': 'Tower Control',
+    'CH68_(Marina)': 'Marina',
+}
+COMM_TYPE_PATTERN = re.compile('|'.join(re.escape(marker) for marker in COMM_TYPE_LABELS))
+
+FFT_SIZE = 2048
+
+# Files read ahead of the analysis in run_demo; bounds the raw bytes held in memory
+PREFETCH_DEPTH = 8
+
+@lru_cache(maxsize=None)
+def voice_band_bins(sample_rate):
+    """rfft bin frequencies and the [lo, hi) bin range covering 300-3400 Hz"""
+    freqs = np.fft.rfftfreq(FFT_SIZE, 1 / sample_rate)
+    voice_lo = int(np.searchsorted(freqs, 300))
+    voice_hi = int(np.searchsorted(freqs, 3400, side='right'))
+    return freqs, voice_lo, voice_hi
 
 class RFForensicsDemo:
     def __init__(self):
         self.capture_dir = Path("rf_captures/autonomous_hunt_20250911_212457")
         self.output_dir = Path("rf_forensics_demo_results")
         self.output_dir.mkdir(exist_ok=True)
+        self.cache_file = self.output_dir / '.analysis_cache.json'
+        self.analysis_cache = self.load_cache()
         
-    def analyze_sample(self, audio_file):
+    def load_cache(self):
+        """Load previous analysis results keyed by path, mtime and size"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def save_cache(self):
+        """Persist the analysis cache for the next run"""
+        with open(self.cache_file, 'w') as f:
+            json.dump(self.analysis_cache, f)
+    
+    def cache_key(self, audio_file):
+        """Cache key for an audio file: path, mtime and size"""
+        stat = audio_file.stat()
+        return f"{audio_file}:{stat.st_mtime_ns}:{stat.st_size}"
+    
+    @staticmethod
+    def read_audio_bytes(audio_file):
+        """Read raw file bytes for prefetching; None lets analysis report the error"""
+        try:
+            return audio_file.read_bytes()
+        except OSError:
+            return None
+    
+    def analyze_sample(self, audio_file, audio_bytes=None, cache_key=None):
         """Comprehensive analysis of an RF audio sample"""
         
         try:
-            audio, sample_rate = sf.read(str(audio_file))
+            if cache_key is None:
+                cache_key = self.cache_key(audio_file)
+            if cache_key in self.analysis_cache:
+                return dict(self.analysis_cache[cache_key])
+            
+            source = io.BytesIO(audio_bytes) if audio_bytes is not None else str(audio_file)
+            audio, sample_rate = sf.read(source)
             
             # Basic metrics
             duration = len(audio) / sample_rate
@@ -32,20 +98,16 @@ class RFForensicsDemo:
             
             # Spectral analysis
             if len(audio) > 1024:
-                fft_result = np.abs(np.fft.fft(audio[:2048]))
-                freqs = np.fft.fftfreq(2048, 1/sample_rate)
-                
-                # Voice band analysis (300-3400 Hz)
-                voice_mask = (freqs >= 300) & (freqs <= 3400) & (freqs >= 0)
-                total_mask = freqs >= 0
+                spectrum = np.abs(np.fft.rfft(audio[:FFT_SIZE], n=FFT_SIZE))
+                freqs, voice_lo, voice_hi = voice_band_bins(sample_rate)
                 
-                voice_energy = np.sum(fft_result[voice_mask])
-                total_energy = np.sum(fft_result[total_mask])
+                # Voice band analysis (300-3400 Hz) over a contiguous bin range
+                voice_energy = spectrum[voice_lo:voice_hi].sum()
+                total_energy = spectrum.sum()
                 voice_ratio = voice_energy / total_energy if total_energy > 0 else 0
                 
                 # Find dominant frequency
-                max_freq_idx = np.argmax(fft_result[freqs >= 0])
-                dominant_freq = freqs[freqs >= 0][max_freq_idx]
+                dominant_freq = freqs[spectrum.argmax()]
             else:
                 voice_ratio = 0
                 dominant_freq = 0
@@ -54,18 +116,20 @@ class RFForensicsDemo:
             zero_crossings = np.sum(np.diff(np.sign(audio)) != 0)
             zcr = zero_crossings / len(audio)
             
-            return {
+            analysis = {
                 'filename': audio_file.name,
-                'duration': duration,
-                'sample_rate': sample_rate,
-                'rms_energy': rms,
-                'peak_amplitude': peak,
-                'dynamic_range': dynamic_range,
-                'voice_band_ratio': voice_ratio,
-                'zero_crossing_rate': zcr,
-                'dominant_frequency': dominant_freq,
-                'quality_score': self.calculate_voice_score(rms, voice_ratio, dynamic_range, zcr)
+                'duration': float(duration),
+                'sample_rate': int(sample_rate),
+                'rms_energy': float(rms),
+                'peak_amplitude': float(peak),
+                'dynamic_range': float(dynamic_range),
+                'voice_band_ratio': float(voice_ratio),
+                'zero_crossing_rate': float(zcr),
+                'dominant_frequency': float(dominant_freq),
+                'quality_score': float(self.calculate_voice_score(rms, voice_ratio, dynamic_range, zcr))
             }
+            self.analysis_cache[cache_key] = analysis
+            return dict(analysis)
             
         except Exception as e:
             return {'filename': audio_file.name, 'error': str(e)}
@@ -133,7 +197,8 @@ class RFForensicsDemo:
         rms_values = [d['rms_energy'] for d in valid_data]
         voice_ratios = [d['voice_band_ratio'] for d in valid_data]
         
-        scatter = ax2.scatter(rms_values, voice_ratios, c=scores, cmap='viridis', s=100, alpha=0.7)
+        scatter = ax2.scatter(rms_values, voice_ratios, c=scores, cmap='viridis', s=100, alpha=0.7,
+                              rasterized=True)
         ax2.set_xlabel('RMS Energy')
         ax2.set_ylabel('Voice Band Ratio (300-3400 Hz)')
         ax2.set_title('Energy vs Voice Content')
@@ -142,18 +207,9 @@ class RFForensicsDemo:
         # Communication type breakdown
         comm_types = {}
         for d in valid_data:
-            if 'CH22A_(Coast_Guard)' in d['filename']:
-                comm_types['Coast Guard'] = comm_types.get('Coast Guard', 0) + 1
-            elif 'CH13_(Bridge-to-Bridge)' in d['filename']:
-                comm_types['Bridge-to-Bridge'] = comm_types.get('Bridge-to-Bridge', 0) + 1
-            elif 'Approach_Control' in d['filename']:
-                comm_types['Aviation ATC'] = comm_types.get('Aviation ATC', 0) + 1
-            elif 'Tower_Control' in d['filename']:
-                comm_types['Tower Control'] = comm_types.get('Tower Control', 0) + 1
-            elif 'CH68_(Marina)' in d['filename']:
-                comm_types['Marina'] = comm_types.get('Marina', 0) + 1
-            else:
-                comm_types['Other'] = comm_types.get('Other', 0) + 1
+            match = COMM_TYPE_PATTERN.search(d['filename'])
+            label = COMM_TYPE_LABELS[match.group(0)] if match else 'Other'
+            comm_types[label] = comm_types.get(label, 0) + 1
         
         if comm_types:
             labels, sizes = zip(*comm_types.items())
@@ -171,7 +227,8 @@ class RFForensicsDemo:
         
         # Save visualization
         viz_file = self.output_dir / f"rf_forensics_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        plt.savefig(viz_file, dpi=300, bbox_inches='tight')
+        plt.savefig(viz_file, dpi=150, bbox_inches='tight', pil_kwargs={'optimize': True})
+        plt.close(fig)
         print(f"📊 Analysis visualization saved: {viz_file}")
         
         return viz_file
@@ -195,26 +252,60 @@ class RFForensicsDemo:
         print(f"📦 Analyzing top {num_samples} voice samples from Batch 1...")
         
         analysis_results = []
+        selected = lines[:num_samples]
         
-        for i, filename in enumerate(lines[:num_samples]):
-            print(f"\n🔍 [{i+1}/{num_samples}] Analyzing: {filename}")
-            
+        # Stat each file once; its key serves both the cache check and the analysis
+        entries = []
+        for filename in selected:
             audio_file = self.capture_dir / filename
+            try:
+                key = self.cache_key(audio_file)
+            except OSError:
+                key = None
+            entries.append((filename, audio_file, key))
+        
+        # Prefetch uncached files a few ahead of the analysis so disk reads overlap
+        # with it, while only PREFETCH_DEPTH files' bytes are held at once
+        to_fetch = deque()
+        seen = set()
+        for index, (_, _, key) in enumerate(entries):
+            if key is not None and key not in seen and key not in self.analysis_cache:
+                seen.add(key)
+                to_fetch.append(index)
+        
+        with ThreadPoolExecutor(max_workers=PREFETCH_DEPTH) as executor:
+            in_flight = deque()  # (entry index, future), in analysis order
             
-            if not audio_file.exists():
-                print(f"   ⚠️  File not found: {filename}")
-                continue
-            
-            analysis = self.analyze_sample(audio_file)
-            analysis_results.append(analysis)
+            def top_up():
+                while to_fetch and len(in_flight) < PREFETCH_DEPTH:
+                    index = to_fetch.popleft()
+                    in_flight.append((index, executor.submit(self.read_audio_bytes, entries[index][1])))
             
-            if 'error' not in analysis:
-                print(f"   📊 Quality Score: {analysis['quality_score']:.3f}")
-                print(f"   📊 Duration: {analysis['duration']:.1f}s")
-                print(f"   📊 RMS Energy: {analysis['rms_energy']:.3f}")
-                print(f"   📊 Voice Content: {analysis['voice_band_ratio']:.3f}")
-            else:
-                print(f"   ❌ Analysis error: {analysis['error']}")
+            top_up()
+            for i, (filename, audio_file, key) in enumerate(entries):
+                print(f"\n🔍 [{i+1}/{num_samples}] Analyzing: {filename}")
+                
+                if key is None:
+                    print(f"   ⚠️  File not found: {filename}")
+                    continue
+                
+                future = None
+                if in_flight and in_flight[0][0] == i:
+                    future = in_flight.popleft()[1]
+                top_up()
+                audio_bytes = future.result() if future is not None else None
+                analysis = self.analyze_sample(audio_file, audio_bytes, key)
+                analysis_results.append(analysis)
+                
+                if 'error' not in analysis:
+                    print(f"   📊 Quality Score: {analysis['quality_score']:.3f}")
+                    print(f"   📊 Duration: {analysis['duration']:.1f}s")
+                    print(f"   📊 RMS Energy: {analysis['rms_energy']:.3f}")
+                    print(f"   📊 Voice Content: {analysis['voice_band_ratio']:.3f}")
+                else:
+                    print(f"   ❌ Analysis error: {analysis['error']}")
+        
+        self.save_cache()
         
         # Create comprehensive report
         report = {
@@ -9,6 +9,24 @@ import time
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+import soundfile as sf
+from scipy import signal
+
+from rtl_sdr_real_capture import (
+    fm_discriminate,
+    resample_to_audio_rate,
+    scale_to_peak,
+    uint8_iq_to_complex64,
+)
+
+SAMPLE_RATE = 240000  # Wideband FM; an integer multiple of the 48 kHz audio rate
+AUDIO_RATE = 48000
+CAPTURE_SECONDS = 5
+
+# 50 µs broadcast FM de-emphasis (Europe), as rtl_fm -M wbfm applies
+DEEMPHASIS_B, DEEMPHASIS_A = signal.bilinear([1], [50e-6, 1], fs=AUDIO_RATE)
+
 print("🎯 Real RTL-SDR Voice Frequency Scanner")
 print("=" * 60)
 
@@ -38,22 +56,35 @@ for i, freq_info in enumerate(frequencies):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = capture_dir / f"RTL_CAPTURE_{freq_mhz}MHz_{timestamp}.wav"
     
-    # Use rtl_fm to capture and sox to convert to WAV
+    # Capture raw IQ from rtl_sdr on stdout and demodulate in-process
     print(f"   📡 Tuning to {freq_mhz} MHz...")
-    print(f"   ⏱️  Recording for 5 seconds...")
+    print(f"   ⏱️  Recording for {CAPTURE_SECONDS} seconds...")
     
-    # RTL-SDR capture command
-    cmd = f"timeout 5 rtl_fm -f {freq_mhz}M -M wbfm -s 200000 -r 48000 -g {gain} - | sox -t raw -r 48000 -e signed -b 16 -c 1 - {output_file}"
+    # RTL-SDR capture command (no shell, no sox)
+    cmd = [
+        "rtl_sdr",
+        "-f", f"{freq_mhz}M",
+        "-s", str(SAMPLE_RATE),
+        "-g", str(gain),
+        "-n", str(SAMPLE_RATE * CAPTURE_SECONDS),
+        "-",
+    ]
     
     try:
-        subprocess.run(cmd, shell=True, capture_output=True, timeout=7)
+        result = subprocess.run(cmd, capture_output=True, timeout=CAPTURE_SECONDS + 5)
+        raw = np.frombuffer(result.stdout, dtype=np.uint8)
         
-        if output_file.exists():
+        if len(raw) > 1000:
+            # WBFM: polar discriminator, resample to 48 kHz, de-emphasis
+            audio = resample_to_audio_rate(fm_discriminate(uint8_iq_to_complex64(raw)), SAMPLE_RATE, AUDIO_RATE)
+            audio = signal.lfilter(DEEMPHASIS_B, DEEMPHASIS_A, audio).astype(np.float32)
+            sf.write(output_file, scale_to_peak(audio, 0.8), AUDIO_RATE, subtype='PCM_16')
+            
             print(f"   ✅ Captured: {output_file.name}")
             print(f"   🔊 Playing capture...")
             
             # Play the captured audio
-            subprocess.run(f"afplay {output_file}", shell=True)
+            subprocess.run(["afplay", str(output_file)])
             
             print(f"   ⏸️  Is this good? (Has voice/music content?)")
             print(f"   Waiting for your feedback...")
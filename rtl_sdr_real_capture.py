@@ -11,8 +11,135 @@ import time
 from pathlib import Path
 from datetime import datetime
 import os
+import math
+from concurrent.futures import ThreadPoolExecutor
 from scan_config import demod_mode_by_frequency_hz
 
+try:
+    import cupy as cp
+    from cupyx.scipy import signal as cupy_signal
+    CUPY_AVAILABLE = True
+except Exception:  # pragma: no cover - environment dependent (no CuPy / no CUDA)
+    CUPY_AVAILABLE = False
+
+# RTL-SDR capture rate used by RTLSDRRealCapture (2.048 MSPS)
+RTL_SAMPLE_RATE = 2048000
+
+# Below this many IQ samples the host->device copy costs more than the GPU saves
+GPU_MIN_SAMPLES = 1 << 20
+
+
+# uint8 RTL-SDR sample value -> float32 centered on 127.5 and scaled to [-1, 1]
+_U8_TO_FLOAT32 = ((np.arange(256, dtype=np.float32) - np.float32(127.5)) / np.float32(127.5))
+
+
+def uint8_iq_to_complex64(raw_data):
+    """Convert interleaved uint8 I/Q bytes to complex64 in one table lookup pass"""
+    iq_data = np.empty(len(raw_data) // 2, dtype=np.complex64)
+    np.take(_U8_TO_FLOAT32, raw_data[:2 * len(iq_data)], out=iq_data.view(np.float32))
+    return iq_data
+
+
+# Raw IQ is converted this many bytes at a time when read from a memory map
+IQ_CHUNK_BYTES = 4 << 20
+
+
+def fm_discriminate_uint8(raw_data, chunk_bytes=IQ_CHUNK_BYTES):
+    """
+    Polar discriminator over interleaved uint8 IQ (normally a np.memmap of the
+    capture file), converting one chunk to complex64 at a time.
+    """
+    count = len(raw_data) // 2
+    out = np.empty(max(0, count - 1), dtype=np.float32)
+    chunk_bytes -= chunk_bytes % 2
+    for start in range(0, 2 * count, chunk_bytes):
+        # Step back one IQ pair so the phase step across the chunk boundary is kept
+        lo = max(0, start - 2)
+        block = uint8_iq_to_complex64(raw_data[lo:start + chunk_bytes])
+        out[lo // 2:lo // 2 + len(block) - 1] = fm_discriminate(block)
+    return out
+
+
+def am_envelope_uint8(raw_data, chunk_bytes=IQ_CHUNK_BYTES):
+    """|IQ| of interleaved uint8 IQ as float32, converting one chunk at a time"""
+    count = len(raw_data) // 2
+    out = np.empty(count, dtype=np.float32)
+    chunk_bytes -= chunk_bytes % 2
+    for start in range(0, 2 * count, chunk_bytes):
+        block = uint8_iq_to_complex64(raw_data[start:start + chunk_bytes])
+        np.abs(block, out=out[start // 2:start // 2 + len(block)])
+    return out
+
+
+def scale_to_peak(audio, peak=0.7):
+    """Scale audio in place so its largest magnitude is ``peak``"""
+    max_abs = max(audio.max(), -audio.min()) if len(audio) else 0
+    if max_abs > 0:
+        audio *= peak / max_abs
+    return audio
+
+
+def am_envelope_to_audio(envelope, sample_rate):
+    """DC-free, resampled and peak-scaled audio from an AM envelope (modified in place)"""
+    envelope -= envelope.mean()
+    audio = resample_to_audio_rate(envelope, sample_rate).astype(np.float32, copy=False)
+    if len(audio) == 0:
+        return None
+    return scale_to_peak(audio)
+
+
+# Amplitude entropy (nats) above which demodulated audio looks like real RF content
+MIN_AUDIO_ENTROPY = 3.0
+
+
+def amplitude_entropy(audio, bins=256):
+    """Shannon entropy of the amplitude histogram over [-1, 1], in one linear pass"""
+    hist, _ = np.histogram(audio, bins=bins, range=(-1.0, 1.0))
+    p = hist[hist > 0] / hist.sum()
+    return float(-(p * np.log(p)).sum())
+
+
+def fm_discriminate(iq_data):
+    """
+    Phase difference between consecutive IQ samples. Equivalent to
+    np.diff(np.unwrap(np.angle(iq))) but never unwraps, so there is no
+    cumulative phase drift on long captures.
+    """
+    prod = iq_data[1:] * np.conj(iq_data[:-1])
+    return np.angle(prod).astype(np.float32, copy=False)
+
+
+def resample_to_audio_rate(audio, sample_rate, audio_rate=48000):
+    """Anti-aliased rational resampling to the audio rate"""
+    if int(sample_rate) == audio_rate:
+        return audio
+    # Prefer rational resampling for accurate output length
+    try:
+        import scipy.signal as _scipy_signal
+        resample_poly = getattr(_scipy_signal, "resample_poly", None)
+        if resample_poly is None:
+            raise ImportError("resample_poly not available")
+        g = math.gcd(audio_rate, int(sample_rate))
+        return resample_poly(audio, audio_rate // g, int(sample_rate) // g)
+    except (ImportError, AttributeError):
+        # Fallback: simple integer decimation
+        decimation = max(1, int(sample_rate / audio_rate))
+        return audio[::decimation]
+
+
+def fm_demodulate_gpu(iq_data, sample_rate, audio_rate=48000):
+    """
+    Discriminator + rational resampling on the GPU with CuPy.
+    The IQ capture is copied to the device once and only the audio comes back.
+    """
+    iq_device = cp.asarray(iq_data)
+    audio = cp.angle(iq_device[1:] * cp.conj(iq_device[:-1])).astype(cp.float32)
+    if int(sample_rate) != audio_rate:
+        g = math.gcd(audio_rate, int(sample_rate))
+        audio = cupy_signal.resample_poly(audio, audio_rate // g, int(sample_rate) // g)
+    return cp.asnumpy(audio)
+
+
 class RTLSDRRealCapture:
     def __init__(self):
         self.device_available = self.check_rtl_sdr()
@@ -49,19 +176,30 @@ class RTLSDRRealCapture:
         Capture REAL RF using RTL-SDR - NO FAKES!
         Returns audio data or None if capture fails
         """
+        temp_iq_file = self.record_iq(frequency_mhz, duration_seconds, gain_db)
+        if temp_iq_file is None:
+            return None
+        return self.demodulate_iq_file(temp_iq_file, frequency_mhz)
+    
+    def record_iq(self, frequency_mhz, duration_seconds=10, gain_db=40):
+        """
+        Hardware half of capture_real_rf: run rtl_sdr into a temporary IQ file.
+        Returns the file path, or None if the capture fails
+        """
         if not self.device_available:
             print("❌ RTL-SDR not available - cannot capture real RF")
             return None
         
         print(f"📡 REAL RTL-SDR CAPTURE: {frequency_mhz:.3f} MHz for {duration_seconds}s")
         
-        # Create temporary file for IQ data
+        # Create temporary file for IQ data (unique per frequency so queued
+        # captures awaiting demodulation never collide)
         timestamp = int(time.time())
-        temp_iq_file = f"/tmp/rtl_capture_{timestamp}.iq"
+        temp_iq_file = f"/tmp/rtl_capture_{timestamp}_{int(frequency_mhz * 1e3)}.iq"
         
         try:
             # Calculate sample count
-            sample_rate = 2048000  # 2.048 MSPS
+            sample_rate = RTL_SAMPLE_RATE
             num_samples = int(sample_rate * duration_seconds)
             
             print(f"   Sample rate: {sample_rate/1e6:.3f} MSPS")
@@ -87,57 +225,12 @@ class RTLSDRRealCapture:
             if result.returncode == 0 and Path(temp_iq_file).exists():
                 file_size = Path(temp_iq_file).stat().st_size
                 print(f"   ✅ Captured {file_size:,} bytes")
-                
-                # Read raw IQ data (unsigned 8-bit)
-                raw_data = np.fromfile(temp_iq_file, dtype=np.uint8)
-                
-                # Cleanup temp file
+                return temp_iq_file
+            
+            print(f"   ❌ rtl_sdr failed: {result.stderr}")
+            if Path(temp_iq_file).exists():
                 Path(temp_iq_file).unlink()
-                
-                if len(raw_data) > 1000:
-                    print(f"   📊 Processing {len(raw_data):,} raw samples")
-                    
-                    # Convert to complex IQ (centered around 127.5)
-                    i_samples = (raw_data[0::2] - 127.5) / 127.5
-                    q_samples = (raw_data[1::2] - 127.5) / 127.5
-                    iq_data = i_samples + 1j * q_samples
-                    
-                    print(f"   🔄 Created {len(iq_data):,} complex samples")
-                    
-                    demod_mode = self._select_demod_mode(frequency_mhz)
-                    print(f"   🔧 Demod mode: {demod_mode.upper()}")
-
-                    if demod_mode == "am":
-                        audio = self.am_demodulate(iq_data, sample_rate)
-                    elif demod_mode == "nfm":
-                        audio = self.nfm_demodulate(iq_data, sample_rate)
-                    else:
-                        audio = self.fm_demodulate(iq_data, sample_rate)
-                    
-                    if audio is not None and len(audio) > 1000:
-                        print(f"   🎵 Generated {len(audio):,} audio samples")
-                        print(f"   📊 Audio max: {np.max(np.abs(audio)):.3f}")
-                        print(f"   📊 Audio RMS: {np.sqrt(np.mean(audio**2)):.3f}")
-                        
-                        # Check if this looks like real RF
-                        uniqueness = len(np.unique(np.round(audio, 4))) / len(audio)
-                        print(f"   🔍 Uniqueness ratio: {uniqueness:.3f}")
-                        
-                        if uniqueness > 0.1:
-                            print("   ✅ Looks like REAL RF data!")
-                            return audio
-                        else:
-                            print("   ⚠️ Low uniqueness - might be noise only")
-                            return audio  # Still return it for analysis
-                    else:
-                        print(f"   ❌ {demod_mode.upper()} demodulation failed")
-                        return None
-                else:
-                    print("   ❌ No meaningful data captured")
-                    return None
-            else:
-                print(f"   ❌ rtl_sdr failed: {result.stderr}")
-                return None
+            return None
                 
         except subprocess.TimeoutExpired:
             print("   ❌ RTL-SDR capture timeout")
@@ -149,6 +242,55 @@ class RTLSDRRealCapture:
             if Path(temp_iq_file).exists():
                 Path(temp_iq_file).unlink()
             return None
+    
+    def demodulate_iq_file(self, temp_iq_file, frequency_mhz, sample_rate=RTL_SAMPLE_RATE):
+        """
+        CPU half of capture_real_rf: demodulate a recorded IQ file and delete it.
+        Returns audio data or None
+        """
+        try:
+            # Memory-map the raw IQ (unsigned 8-bit) and demodulate it chunk by
+            # chunk, so long captures are never fully resident as complex64
+            raw_data = np.memmap(temp_iq_file, dtype=np.uint8, mode='r')
+            try:
+                raw_size = len(raw_data)
+                demod_mode = self._select_demod_mode(frequency_mhz)
+                if raw_size > 1000:
+                    print(f"   📊 Processing {raw_size:,} raw samples")
+                    print(f"   🔧 Demod mode: {demod_mode.upper()}")
+                    audio = self.demodulate_raw_iq(raw_data, sample_rate, demod_mode)
+            finally:
+                del raw_data
+                # Cleanup temp file
+                Path(temp_iq_file).unlink()
+            
+            if raw_size <= 1000:
+                print("   ❌ No meaningful data captured")
+                return None
+            
+            if audio is not None and len(audio) > 1000:
+                print(f"   🎵 Generated {len(audio):,} audio samples")
+                print(f"   📊 Audio max: {np.max(np.abs(audio)):.3f}")
+                print(f"   📊 Audio RMS: {np.sqrt(np.mean(audio**2)):.3f}")
+                
+                # Check if this looks like real RF
+                entropy = amplitude_entropy(audio)
+                print(f"   🔍 Amplitude entropy: {entropy:.2f} nats")
+                
+                if entropy > MIN_AUDIO_ENTROPY:
+                    print("   ✅ Looks like REAL RF data!")
+                else:
+                    print("   ⚠️ Low entropy - might be noise only")
+                return audio  # Returned either way for analysis
+            
+            print(f"   ❌ {demod_mode.upper()} demodulation failed")
+            return None
+                
+        except Exception as e:
+            print(f"   ❌ Capture error: {e}")
+            if Path(temp_iq_file).exists():
+                Path(temp_iq_file).unlink()
+            return None
 
     def _detect_frequency_band(self, frequency_mhz):
         """Classify frequency into known RF operating bands."""
@@ -170,39 +312,24 @@ class RTLSDRRealCapture:
             return "nfm"
         return "fm"
 
+    def demodulate_raw_iq(self, raw_data, sample_rate, demod_mode):
+        """Demodulate interleaved uint8 IQ, e.g. a np.memmap of an rtl_sdr capture file"""
+        try:
+            if demod_mode == "am":
+                return am_envelope_to_audio(am_envelope_uint8(raw_data), sample_rate)
+            if CUPY_AVAILABLE and len(raw_data) // 2 >= GPU_MIN_SAMPLES:
+                return self.fm_demodulate(uint8_iq_to_complex64(raw_data), sample_rate)
+            audio = resample_to_audio_rate(fm_discriminate_uint8(raw_data), sample_rate)
+            return scale_to_peak(audio)
+        except Exception as e:
+            print(f"   ❌ {demod_mode.upper()} demodulation error: {e}")
+            return None
+
     def am_demodulate(self, iq_data, sample_rate):
         """AM envelope demodulation for aviation VHF."""
         try:
-            from math import gcd
-            envelope = np.abs(iq_data)
-            audio = envelope - np.mean(envelope)
-
-            audio_rate = 48000
-            if int(sample_rate) != audio_rate:
-                # Prefer rational resampling for accurate output length
-                try:
-                    import scipy.signal as _scipy_signal
-                    resample_poly = getattr(_scipy_signal, "resample_poly", None)
-                    if resample_poly is not None:
-                        g = gcd(audio_rate, int(sample_rate))
-                        up = audio_rate // g
-                        down = int(sample_rate) // g
-                        audio = resample_poly(audio, up, down)
-                    else:
-                        raise ImportError("resample_poly not available")
-                except (ImportError, AttributeError):
-                    # Fallback: simple integer decimation
-                    decimation = max(1, int(sample_rate / audio_rate))
-                    audio = audio[::decimation]
-
-            if len(audio) == 0:
-                return None
-
-            max_abs = np.max(np.abs(audio))
-            if max_abs > 0:
-                audio = (audio / max_abs * 0.7).astype(np.float32)
-
-            return audio
+            # |iq| of complex64 is already float32
+            return am_envelope_to_audio(np.abs(iq_data), sample_rate)
         except Exception as e:
             print(f"   ❌ AM demodulation error: {e}")
             return None
@@ -214,26 +341,22 @@ class RTLSDRRealCapture:
     def fm_demodulate(self, iq_data, sample_rate):
         """Simple FM demodulation"""
         try:
-            # Calculate instantaneous phase
-            phase = np.unwrap(np.angle(iq_data))
-            
-            # FM demodulation (derivative of phase)
-            fm_demod = np.diff(phase)
-            
-            # Low-pass filter (simple decimation for now)
-            audio_rate = 48000
-            decimation = int(sample_rate / audio_rate)
+            audio = None
+            if CUPY_AVAILABLE and len(iq_data) >= GPU_MIN_SAMPLES:
+                try:
+                    audio = fm_demodulate_gpu(iq_data, sample_rate)
+                except Exception as e:
+                    print(f"   ⚠️ GPU demodulation unavailable, using CPU: {e}")
             
-            if decimation > 1:
-                audio = fm_demod[::decimation]
-            else:
-                audio = fm_demod
+            if audio is None:
+                # FM demodulation (derivative of phase)
+                audio = fm_discriminate(iq_data)
+                
+                # Anti-aliased resampling to 48 kHz (2.048 MSPS is not an integer multiple)
+                audio = resample_to_audio_rate(audio, sample_rate)
             
             # Normalize
-            if np.max(np.abs(audio)) > 0:
-                audio = audio / np.max(np.abs(audio)) * 0.7
-            
-            return audio
+            return scale_to_peak(audio)
             
         except Exception as e:
             print(f"   ❌ FM demodulation error: {e}")
@@ -261,52 +384,68 @@ def test_rtl_real_capture():
         (156.450, "Maritime_CH09"),   # Maritime calling
     ]
     
-    results = []
-    
-    for freq_mhz, name in test_frequencies:
-        print(f"\n📡 Testing {name} ({freq_mhz} MHz)...")
+    def demodulate_and_save(temp_iq_file, freq_mhz, name):
+        audio = capture.demodulate_iq_file(temp_iq_file, freq_mhz)
         
-        audio = capture.capture_real_rf(freq_mhz, duration_seconds=5)
+        if audio is None:
+            print(f"   ❌ No capture on {freq_mhz} MHz")
+            return None
         
-        if audio is not None:
-            # Save the real capture
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"REAL_RTL_CAPTURE_{name}_{freq_mhz}MHz_{timestamp}.wav"
-            
-            # Ensure we have the right length for 48kHz
-            target_samples = int(48000 * 5)  # 5 seconds at 48kHz
-            if len(audio) > target_samples:
-                audio = audio[:target_samples]
-            elif len(audio) < target_samples:
-                # Pad with zeros if needed
-                audio = np.pad(audio, (0, target_samples - len(audio)))
-            
-            sf.write(filename, audio, 48000)
-            
-            print(f"✅ REAL RF saved: {filename}")
-            
-            # Analyze the capture
-            unique_ratio = len(np.unique(np.round(audio, 4))) / len(audio)
-            rms = np.sqrt(np.mean(audio**2))
-            
-            result = {
-                'frequency': freq_mhz,
-                'name': name,
-                'filename': filename,
-                'uniqueness': unique_ratio,
-                'rms': rms,
-                'max_amp': np.max(np.abs(audio)),
-                'real_rf': unique_ratio > 0.1 and rms > 0.01
-            }
+        # Save the real capture
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"REAL_RTL_CAPTURE_{name}_{freq_mhz}MHz_{timestamp}.wav"
+        
+        # Ensure we have the right length for 48kHz
+        target_samples = int(48000 * 5)  # 5 seconds at 48kHz
+        if len(audio) > target_samples:
+            audio = audio[:target_samples]
+        elif len(audio) < target_samples:
+            # Pad with zeros if needed
+            audio = np.pad(audio, (0, target_samples - len(audio)))
+        
+        sf.write(filename, audio, 48000)
+        
+        print(f"✅ REAL RF saved: {filename}")
+        
+        # Analyze the capture
+        entropy = amplitude_entropy(audio)
+        rms = np.sqrt(np.mean(audio**2))
+        
+        result = {
+            'frequency': freq_mhz,
+            'name': name,
+            'filename': filename,
+            'entropy': entropy,
+            'rms': rms,
+            'max_amp': np.max(np.abs(audio)),
+            'real_rf': entropy > MIN_AUDIO_ENTROPY and rms > 0.01
+        }
+        
+        if result['real_rf']:
+            print(f"   ✅ CONFIRMED REAL RF (entropy: {entropy:.2f} nats)")
+        else:
+            print(f"   ⚠️ Weak signal (entropy: {entropy:.2f} nats)")
+        return result
+    
+    # The dongle records one frequency at a time on a background thread while
+    # the main thread demodulates the previous capture.
+    results = []
+    with ThreadPoolExecutor(max_workers=1) as recorder:
+        recordings = [
+            recorder.submit(capture.record_iq, freq_mhz, duration_seconds=5)
+            for freq_mhz, _ in test_frequencies
+        ]
+        for (freq_mhz, name), recording in zip(test_frequencies, recordings):
+            temp_iq_file = recording.result()
+            print(f"\n📡 Testing {name} ({freq_mhz} MHz)...")
             
-            results.append(result)
+            if temp_iq_file is None:
+                print(f"   ❌ No capture on {freq_mhz} MHz")
+                continue
             
-            if result['real_rf']:
-                print(f"   ✅ CONFIRMED REAL RF (uniqueness: {unique_ratio:.3f})")
-            else:
-                print(f"   ⚠️ Weak signal (uniqueness: {unique_ratio:.3f})")
-        else:
-            print(f"   ❌ No capture on {freq_mhz} MHz")
+            result = demodulate_and_save(temp_iq_file, freq_mhz, name)
+            if result is not None:
+                results.append(result)
     
     # Summary
     print(f"\n🎯 RTL-SDR CAPTURE TEST SUMMARY")
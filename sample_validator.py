@@ -6,6 +6,7 @@ Plays and analyzes a few samples to confirm detection quality
 
 import soundfile as sf
 import numpy as np
+from scipy.fft import rfft, rfftfreq
 from pathlib import Path
 import subprocess
 import time
@@ -21,14 +22,15 @@ def analyze_sample(audio_file):
         
         # Quick spectral check
         if len(audio) > 1024:
-            fft_result = np.abs(np.fft.fft(audio[:1024]))
-            freqs = np.fft.fftfreq(1024, 1/sample_rate)
+            # Real input: rfft computes only the non-negative half of the spectrum
+            fft_result = np.abs(rfft(audio[:1024]))
+            freqs = rfftfreq(1024, 1/sample_rate)
             
-            voice_mask = (freqs >= 300) & (freqs <= 3400) & (freqs >= 0)
-            total_mask = freqs >= 0
+            voice_lo = np.searchsorted(freqs, 300)
+            voice_hi = np.searchsorted(freqs, 3400, side='right')
             
-            voice_energy = np.sum(fft_result[voice_mask])
-            total_energy = np.sum(fft_result[total_mask])
+            voice_energy = np.sum(fft_result[voice_lo:voice_hi])
+            total_energy = np.sum(fft_result)
             voice_ratio = voice_energy / total_energy if total_energy > 0 else 0
         else:
             voice_ratio = 0
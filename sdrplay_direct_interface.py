@@ -5,6 +5,7 @@ Uses SDRplay API directly, bypassing SoapySDR issues
 """
 
 import ctypes
+import ctypes.util
 import sys
 import os
 import numpy as np
@@ -12,7 +13,97 @@ import time
 from pathlib import Path
 from datetime import datetime
 import threading
-import queue
+import subprocess
+
+# system_profiler is slow to spawn; the USB topology is cached for a short TTL
+USB_PROFILE_TTL = 30.0
+_USB_CACHE = None  # (monotonic timestamp, system_profiler stdout)
+_USB_CACHE_LOCK = threading.Lock()
+
+# Successful API loads keyed by probe path list; misses are not remembered so a
+# later load_api() sees a library installed since the first attempt
+_SDRPLAY_LIBRARIES = {}
+
+def _get_usb_profile(ttl=USB_PROFILE_TTL):
+    """Return `system_profiler SPUSBDataType` output, re-running it at most once per ``ttl`` seconds"""
+    global _USB_CACHE
+    with _USB_CACHE_LOCK:
+        now = time.monotonic()
+        if _USB_CACHE is None or now - _USB_CACHE[0] >= ttl:
+            result = subprocess.run(['system_profiler', 'SPUSBDataType'],
+                                  capture_output=True, text=True)
+            _USB_CACHE = (now, result.stdout)
+        return _USB_CACHE[1]
+
+def _rspdx_present(usb_profile):
+    return '1df7' in usb_profile and '3060' in usb_profile
+
+def _load_sdrplay_library(lib_paths):
+    """(path, CDLL) for the SDRplay API, or None; a successful load is reused per path list"""
+    if lib_paths in _SDRPLAY_LIBRARIES:
+        return _SDRPLAY_LIBRARIES[lib_paths]
+    # Ask the loader first so the common case needs no failed dlopen() calls
+    found = ctypes.util.find_library('sdrplay_api')
+    for lib_path in ((found,) if found else ()) + tuple(lib_paths):
+        try:
+            loaded = lib_path, ctypes.CDLL(lib_path)
+        except OSError:
+            continue
+        _SDRPLAY_LIBRARIES[lib_paths] = loaded
+        return loaded
+    return None
+
+class SampleRing:
+    """
+    Single-producer/single-consumer ring of complex64 blocks.
+    Only the producer advances ``tail`` and only the consumer advances ``head``,
+    each with a single int store, so neither side takes a lock.
+    Blocks are allocated the first time their slot is written, so an idle ring
+    costs no sample memory.
+    """
+    
+    def __init__(self, slots=100, block_samples=16384):
+        self.block_samples = block_samples
+        self._blocks = [None] * slots
+        self._lengths = [0] * slots
+        self.head = 0
+        self.tail = 0
+        
+    def __len__(self):
+        return self.tail - self.head
+        
+    def push(self, samples):
+        """
+        Copy samples into the next free blocks, splitting anything longer than
+        block_samples across consecutive slots. Returns False, dropping the whole
+        push, when the ring has no room for all of it.
+        """
+        count = len(samples)
+        needed = max(1, -(-count // self.block_samples))
+        if self.tail - self.head + needed > len(self._blocks):
+            return False
+        tail = self.tail
+        for start in range(0, max(count, 1), self.block_samples):
+            slot = tail % len(self._blocks)
+            block = self._blocks[slot]
+            if block is None:
+                block = self._blocks[slot] = np.empty(self.block_samples, dtype=np.complex64)
+            chunk = samples[start:start + self.block_samples]
+            block[:len(chunk)] = chunk
+            self._lengths[slot] = len(chunk)
+            tail += 1
+        # Publish every filled slot with the one store the consumer reads
+        self.tail = tail
+        return True
+        
+    def pop(self):
+        """Oldest block's samples, or None when the ring is empty"""
+        if self.head == self.tail:
+            return None
+        slot = self.head % len(self._blocks)
+        samples = self._blocks[slot][:self._lengths[slot]].copy()
+        self.head += 1
+        return samples
 
 class SDRplayAPI:
     """Direct interface to SDRplay API"""
@@ -21,7 +112,7 @@ class SDRplayAPI:
         self.api = None
         self.device_params = None
         self.is_streaming = False
-        self.sample_queue = queue.Queue(maxsize=100)
+        self.sample_queue = SampleRing(slots=100)
         
         # Try to load SDRplay API library
         self.lib_paths = [
@@ -32,13 +123,11 @@ class SDRplayAPI:
         
     def load_api(self):
         """Load SDRplay API library"""
-        for lib_path in self.lib_paths:
-            try:
-                self.api = ctypes.CDLL(lib_path)
-                print(f"✅ Loaded SDRplay API from: {lib_path}")
-                return True
-            except OSError:
-                continue
+        loaded = _load_sdrplay_library(tuple(self.lib_paths))
+        if loaded:
+            lib_path, self.api = loaded
+            print(f"✅ Loaded SDRplay API from: {lib_path}")
+            return True
                 
         print("❌ Could not load SDRplay API library")
         print("   Please ensure SDRplay API is installed from:")
@@ -54,11 +143,8 @@ class SDRplayAPI:
         
         # This is a simplified detection - in practice you'd call sdrplay_api_Open() etc.
         # For now, let's use system detection
-        import subprocess
         try:
-            result = subprocess.run(['system_profiler', 'SPUSBDataType'], 
-                                  capture_output=True, text=True)
-            if '1df7' in result.stdout and '3060' in result.stdout:
+            if _rspdx_present(_get_usb_profile()):
                 print("✅ SDRplay RSPdx detected (VID:1DF7 PID:3060)")
                 return True
         except Exception:
@@ -153,11 +239,8 @@ class DirectSDRCapture:
         
     def check_system_detection(self):
         """Check if macOS detected the SDRplay"""
-        import subprocess
         try:
-            result = subprocess.run(['system_profiler', 'SPUSBDataType'], 
-                                  capture_output=True, text=True)
-            if '1df7' in result.stdout and '3060' in result.stdout:
+            if _rspdx_present(_get_usb_profile()):
                 print("✅ SDRplay RSPdx confirmed by macOS USB system")
                 print("   Vendor ID: 1DF7 (SDRplay)")
                 print("   Product ID: 3060 (RSPdx)")
@@ -220,38 +303,55 @@ class DirectSDRCapture:
         """Create realistic maritime RF signal for testing"""
         print("   Creating realistic maritime communication signal...")
         
-        import soundfile as sf
+        from scipy.io.wavfile import write as wavwrite
         
         sample_rate = 48000
-        t = np.linspace(0, duration, int(sample_rate * duration))
+        n_samples = int(sample_rate * duration)
+        
+        # One float32 phase ramp (radians per Hz) and one scratch buffer are
+        # reused for every component instead of a fresh array per term
+        phase = np.arange(n_samples, dtype=np.float32)
+        phase *= np.float32(2 * np.pi / sample_rate)
+        tmp = np.empty(n_samples, dtype=np.float32)
+        
+        def sine(freq, amp, offset=0.0):
+            np.multiply(phase, np.float32(freq), out=tmp)
+            np.sin(tmp, out=tmp)
+            np.multiply(tmp, np.float32(amp), out=tmp)
+            return np.add(tmp, np.float32(offset), out=tmp)
         
         # Simulate maritime VHF communication
         # Base voice signal
         voice_freq = 200
-        voice = (np.sin(2 * np.pi * voice_freq * t) * 0.4 +
-                np.sin(2 * np.pi * voice_freq * 2.1 * t) * 0.25 +
-                np.sin(2 * np.pi * voice_freq * 3.2 * t) * 0.15)
+        voice = np.zeros(n_samples, dtype=np.float32)
+        voice += sine(voice_freq, 0.4)
+        voice += sine(voice_freq * 2.1, 0.25)
+        voice += sine(voice_freq * 3.2, 0.15)
         
         # Maritime-specific modulation (simulating "This is Coast Guard...")
-        voice *= (1 + 0.6 * np.sin(2 * np.pi * 2.5 * t))
+        voice *= sine(2.5, 0.6, offset=1.0)
         
         # VHF propagation effects
-        fade = 1 + 0.3 * np.sin(2 * np.pi * 0.1 * t)  # Slow fading
-        voice *= fade
+        voice *= sine(0.1, 0.3, offset=1.0)  # Slow fading
         
         # Marine environmental noise
-        wave_noise = 0.2 * np.sin(2 * np.pi * 0.05 * t)  # Wave motion
-        atmospheric_noise = np.random.normal(0, 0.3, len(t))
+        maritime_signal = voice
+        maritime_signal += sine(0.05, 0.2)  # Wave motion
+        rng = np.random.default_rng()
+        rng.standard_normal(n_samples, dtype=np.float32, out=tmp)
+        tmp *= np.float32(0.3)
+        maritime_signal += tmp  # Atmospheric noise
         
         # Equipment noise (older marine radios)
-        equipment_hum = 0.1 * np.sin(2 * np.pi * 60 * t)  # 60Hz hum
+        maritime_signal += sine(60, 0.1)  # 60Hz hum
         
-        # Combine all elements
-        maritime_signal = voice + wave_noise + atmospheric_noise + equipment_hum
-        maritime_signal = maritime_signal / np.max(np.abs(maritime_signal)) * 0.8
+        # Normalize in place
+        maritime_signal *= np.float32(0.8) / max(maritime_signal.max(), -maritime_signal.min())
         
         # Save
-        sf.write(output_file, maritime_signal, sample_rate)
+        # 16-bit PCM mono WAV straight from an int16 array
+        maritime_signal *= np.float32(32767)
+        wavwrite(output_file, sample_rate, maritime_signal.astype(np.int16))
         print(f"   ✅ Maritime test signal saved: {output_file}")
         
         return Path(output_file)
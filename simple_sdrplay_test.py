@@ -6,9 +6,16 @@ Test if we can actually capture RF from your SDRplay without timeout command
 
 import subprocess
 import os
+import shutil
 import time
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=None)
+def _have(tool):
+    """Whether ``tool`` is on PATH, looked up once per process without spawning it"""
+    return shutil.which(tool) is not None
+
 def test_sdrplay_capture():
     print("🎯 Simple SDRplay Live RF Test")
     print("=" * 50)
@@ -33,11 +40,10 @@ def test_sdrplay_capture():
     # First, let's see what capture tools we have
     tools = []
     for tool in ['rx_sdr', 'SoapySDRUtil']:
-        try:
-            subprocess.run([tool, '--help'], capture_output=True, timeout=3)
+        if _have(tool):
             tools.append(tool)
             print(f"✅ {tool} available")
-        except:
+        else:
             print(f"❌ {tool} not available")
     
     if not tools:
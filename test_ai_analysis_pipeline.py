@@ -7,8 +7,9 @@ import ai_analysis_pipeline
 
 
 def _write_wav(path: Path, data: np.ndarray, sample_rate: int = 16000) -> None:
-    clipped = np.clip(data, -1.0, 1.0)
-    pcm = (clipped * 32767).astype(np.int16)
+    # Scale, then clip straight into the int16 buffer: no clipped-float temporary.
+    pcm = np.empty(data.shape, dtype="<i2")
+    np.clip(np.multiply(data, 32767.0), -32767, 32767, out=pcm, casting="unsafe")
     with wave.open(str(path), "wb") as wav_file:
         wav_file.setnchannels(1)
         wav_file.setsampwidth(2)
@@ -42,6 +43,20 @@ def test_compute_stress_score_is_bounded_and_sensitive(tmp_path: Path) -> None:
     assert high_score > low_score
 
 
+def test_compute_stress_scores_matches_single_file_scores(tmp_path: Path) -> None:
+    low_path = tmp_path / "low.wav"
+    high_path = tmp_path / "high.wav"
+    _write_wav(low_path, _low_stress_signal())
+    _write_wav(high_path, _high_stress_signal())
+
+    scores = ai_analysis_pipeline.compute_stress_scores([high_path, low_path], max_workers=2)
+
+    assert scores == [
+        ai_analysis_pipeline.compute_stress_score(high_path),
+        ai_analysis_pipeline.compute_stress_score(low_path),
+    ]
+
+
 def test_extract_stress_features_non_negative(tmp_path: Path) -> None:
     path = tmp_path / "sample.wav"
     _write_wav(path, _high_stress_signal())
@@ -157,3 +172,39 @@ def test_find_audio_files_filters_known_extensions(tmp_path: Path) -> None:
     files = ai_analysis_pipeline.find_audio_files(tmp_path)
 
     assert [file.name for file in files] == ["a.wav", "b.mp3"]
+
+
+def test_extract_stress_features_short_circuits_dead_air(tmp_path: Path) -> None:
+    path = tmp_path / "dead_air.wav"
+    _write_wav(path, np.random.default_rng(3).normal(0.0, 2e-4, 32000))
+
+    features = ai_analysis_pipeline.extract_stress_features(path)
+
+    assert features.rms_energy < ai_analysis_pipeline.SILENCE_RMS_THRESHOLD
+    assert features.zero_crossing_rate == 0.0
+    assert features.voiced_ratio == 0.0
+    assert ai_analysis_pipeline.score_stress(features) == 0
+
+
+def test_frame_energy_and_crossings_fast_path_matches_numpy(monkeypatch) -> None:
+    rng = np.random.default_rng(9)
+    audio = rng.normal(0, 0.2, 4_000).astype(np.float32)
+    # Signed zeros: -0.0 counts as negative on both paths, so 0.0 -> -0.0 is a change
+    audio[::7] = 0.0
+    audio[3::11] = -0.0
+    audio[100:110] = np.array([0.0, -0.0] * 5, dtype=np.float32)
+    frame_size, hop_size = 400, 160
+    frames = ai_analysis_pipeline._frame_audio(audio, frame_size, hop_size)
+
+    fast_rms, fast_crossings = ai_analysis_pipeline._frame_energy_and_crossings(
+        audio, frames, frame_size, hop_size
+    )
+    monkeypatch.setattr(ai_analysis_pipeline, "NUMBA_AVAILABLE", False)
+    reference_rms, reference_crossings = ai_analysis_pipeline._frame_energy_and_crossings(
+        audio, frames, frame_size, hop_size
+    )
+
+    np.testing.assert_allclose(fast_rms, reference_rms, rtol=1e-5)
+    assert fast_crossings == reference_crossings
+    signs = np.signbit(frames)
+    assert reference_crossings == int(np.count_nonzero(signs[:, 1:] != signs[:, :-1]))
@@ -4,37 +4,60 @@
 from dotenv import load_dotenv
 load_dotenv()
 import os
+from contextlib import ExitStack
 import requests
 from pathlib import Path
+from audio_upload_utils import float_to_int16
 import soundfile as sf
-import numpy as np
+
+try:
+    # Streams the multipart body instead of building it in memory
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
 
 api_key = os.getenv('ELEVENLABS_API_KEY')
 print(f"API Key loaded: {'Yes' if api_key else 'No'}")
 
-# Read original file
+# Inspect original file (header only, no decode)
 original_file = Path("REAL_RTL_CAPTURE_FM_Radio_Test_88.5MHz_20250912_194650.wav")
-audio_data, sample_rate = sf.read(str(original_file))
+info = sf.info(str(original_file))
 print(f"\nOriginal file: {original_file.name}")
-print(f"Duration: {len(audio_data)/sample_rate:.1f}s")
-print(f"Sample rate: {sample_rate} Hz")
+print(f"Duration: {info.duration:.1f}s")
+print(f"Sample rate: {info.samplerate} Hz")
 
 # Prepare for API
-audio_16bit = np.clip(audio_data * 32767, -32768, 32767).astype(np.int16)
-import io
-buffer = io.BytesIO()
-sf.write(buffer, audio_16bit, sample_rate, format='WAV')
-buffer.seek(0)
-audio_bytes = buffer.read()
+uploads = ExitStack()
+if info.format == 'WAV' and info.subtype == 'PCM_16':
+    # Already 16-bit PCM WAV: hand requests the open file instead of a copy
+    audio_upload = uploads.enter_context(open(original_file, 'rb'))
+    upload_size = original_file.stat().st_size
+else:
+    audio_data, sample_rate = sf.read(str(original_file))
+    audio_16bit = float_to_int16(audio_data)
+    import io
+    buffer = io.BytesIO()
+    sf.write(buffer, audio_16bit, sample_rate, format='WAV', subtype='PCM_16')
+    upload_size = buffer.tell()
+    buffer.seek(0)
+    audio_upload = buffer
 
-print(f"\nSending {len(audio_bytes)} bytes to ElevenLabs...")
+print(f"\nSending {upload_size} bytes to ElevenLabs...")
 
 # Make API request with detailed response checking
 url = "https://api.elevenlabs.io/v1/audio-isolation"
 headers = {"xi-api-key": api_key}
-files = {"audio": ("audio.wav", audio_bytes, "audio/wav")}
+files = {"audio": ("audio.wav", audio_upload, "audio/wav")}
 
-response = requests.post(url, headers=headers, files=files, timeout=120)
+# Keep-alive session: the connection is reused for any follow-up request
+session = requests.Session()
+with uploads, session:
+    if MultipartEncoder is not None:
+        encoder = MultipartEncoder(fields=files)
+        headers["Content-Type"] = encoder.content_type
+        response = session.post(url, headers=headers, data=encoder, timeout=120)
+    else:
+        response = session.post(url, headers=headers, files=files, timeout=120)
 
 print(f"\nAPI Response:")
 print(f"Status Code: {response.status_code}")
@@ -11,6 +11,7 @@ import soundfile as sf
 from pathlib import Path
 import tempfile
 import logging
+from functools import lru_cache
 
 # Add src to path
 sys.path.insert(0, 'src')
@@ -26,37 +27,62 @@ except ImportError as e:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Scratch WAVs go to RAM-backed storage when the platform has it
+RAM_TMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
 
+# Fixed noise seed so a given create_test_audio call always yields the same clip
+TEST_AUDIO_SEED = 0
+
+
+@lru_cache(maxsize=8)
 def create_test_audio(duration=6.0, sample_rate=44100, add_noise=True):
-    """Create synthetic test audio with voice-like signal + noise"""
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    """
+    Create synthetic test audio with voice-like signal + noise.
+    Cached per arguments and returned read-only; copy before mutating.
+    """
+    # float32 throughout: the audio ends up as 16-bit PCM anyway. Every term
+    # is built in one scratch buffer and accumulated in place.
+    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
+    tmp = np.empty_like(t)
+    
+    def sine(freq, amp):
+        np.multiply(t, np.float32(2 * np.pi * freq), out=tmp)
+        np.sin(tmp, out=tmp)
+        return np.multiply(tmp, np.float32(amp), out=tmp)
     
-    # Voice-like signal (fundamental + harmonics)
+    # Voice-like signal (fundamental + harmonics). The fundamental's phase is
+    # computed once; each harmonic scales it by k into the scratch buffer.
     voice_freq = 200
-    voice = (np.sin(2 * np.pi * voice_freq * t) * 0.3 +
-             np.sin(2 * np.pi * voice_freq * 2 * t) * 0.2 +
-             np.sin(2 * np.pi * voice_freq * 3 * t) * 0.1)
+    phase = np.multiply(t, np.float32(2 * np.pi * voice_freq))
+    audio = np.sin(phase)
+    audio *= np.float32(0.3)
+    for k, amp in ((2, 0.2), (3, 0.1)):
+        np.multiply(phase, np.float32(k), out=tmp)
+        np.sin(tmp, out=tmp)
+        tmp *= np.float32(amp)
+        audio += tmp
     
     # Add modulation
-    voice *= (1 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    modulation = sine(3, 0.5)
+    modulation += np.float32(1)
+    audio *= modulation
     
     if add_noise:
         # RF-style noise
-        rf_noise = np.random.normal(0, 0.4, len(t))
+        rf_noise = np.random.default_rng(TEST_AUDIO_SEED).standard_normal(len(t), dtype=np.float32)
+        rf_noise *= np.float32(0.4)
         
-        # Intermittent static bursts
-        for i in range(int(duration)):
-            start_idx = int(i * sample_rate)
-            burst_length = int(0.1 * sample_rate)
-            if i % 2 == 0:
-                rf_noise[start_idx:start_idx + burst_length] *= 3
+        # Intermittent static bursts: 0.1 s at the start of every even second
+        burst_length = int(0.1 * sample_rate)
+        burst_starts = np.arange(0, int(duration), 2) * int(sample_rate)
+        burst_idx = (burst_starts[:, None] + np.arange(burst_length)).ravel()
+        rf_noise[burst_idx[burst_idx < len(rf_noise)]] *= 3
         
-        audio = voice + rf_noise
-    else:
-        audio = voice
+        audio += rf_noise
     
     # Normalize
-    audio = audio / np.max(np.abs(audio)) * 0.8
+    audio *= np.float32(0.8) / np.max(np.abs(audio))
+    audio.setflags(write=False)
     return audio, sample_rate
 
 
@@ -66,42 +92,40 @@ def test_audio_preprocessor():
     
     try:
         # Create test audio
-        audio_data, sr = create_test_audio()
-        
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            sf.write(tmp.name, audio_data, sr)
-            test_file = Path(tmp.name)
-        
-        # Test preprocessor
-        preprocessor = AudioPreprocessor()
+        # One second is enough for a functional check (and the 1 s stream chunk)
+        audio_data, sr = create_test_audio(duration=1.0)
         
-        # Test file processing
-        result_path = preprocessor.process_file(test_file)
-        
-        if result_path.exists():
-            # Load and verify result
-            processed_data, processed_sr = sf.read(result_path)
-            
-            print(f"✅ File processing successful")
-            print(f"   Original: {len(audio_data)} samples @ {sr}Hz")
-            print(f"   Processed: {len(processed_data)} samples @ {processed_sr}Hz")
-            print(f"   Target SR: {preprocessor.config.target_sample_rate}Hz")
-            
-            # Test streaming chunk processing
-            chunk = audio_data[:sr]  # 1 second chunk
-            processed_chunk = preprocessor.process_stream_chunk(chunk, sr)
-            print(f"✅ Streaming chunk processing successful")
-            print(f"   Chunk: {len(chunk)} → {len(processed_chunk)} samples")
+        with tempfile.TemporaryDirectory(dir=RAM_TMP_DIR) as tmp_dir:
+            test_file = Path(tmp_dir) / "test_audio.wav"
+            sf.write(test_file, audio_data, sr, subtype='PCM_16')
             
-            # Cleanup
-            test_file.unlink()
-            result_path.unlink()
-            
-            return True
+            # Test preprocessor
+            preprocessor = AudioPreprocessor()
             
-        else:
-            print("❌ Preprocessor failed - no output file")
-            return False
+            # Test file processing
+            result_path = preprocessor.process_file(test_file)
+            try:
+                if not result_path.exists():
+                    print("❌ Preprocessor failed - no output file")
+                    return False
+                
+                # Verify result from the WAV header alone
+                processed = sf.info(str(result_path))
+                
+                print(f"✅ File processing successful")
+                print(f"   Original: {len(audio_data)} samples @ {sr}Hz")
+                print(f"   Processed: {processed.frames} samples @ {processed.samplerate}Hz")
+                print(f"   Target SR: {preprocessor.config.target_sample_rate}Hz")
+                
+                # Test streaming chunk processing
+                chunk = audio_data[:sr].copy()  # 1 second chunk, writable for the preprocessor
+                processed_chunk = preprocessor.process_stream_chunk(chunk, sr)
+                print(f"✅ Streaming chunk processing successful")
+                print(f"   Chunk: {len(chunk)} → {len(processed_chunk)} samples")
+                
+                return True
+            finally:
+                result_path.unlink(missing_ok=True)
             
     except Exception as e:
         print(f"❌ Preprocessor test failed: {e}")
@@ -169,7 +193,7 @@ def test_rf_processor():
             print(f"   Has ElevenLabs client: {processor.client is not None}")
             
             # Test streaming audio processing (preprocessing only)
-            audio_data, sr = create_test_audio(duration=2.0)
+            audio_data, sr = create_test_audio(duration=1.0)
             
             print("✅ Created test audio for streaming test")
             print(f"   Duration: {len(audio_data)/sr:.1f}s @ {sr}Hz")
@@ -190,39 +214,39 @@ def test_pipeline_integration():
     
     try:
         # Create test audio file
-        audio_data, sr = create_test_audio()
-        
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            sf.write(tmp.name, audio_data, sr)
-            test_file = Path(tmp.name)
-        
-        # Test preprocessing stage only
-        preprocessor = AudioPreprocessor()
-        processed_file = preprocessor.process_file(test_file)
+        # Full 6 s clip: the ElevenLabs minimum-duration check needs >= 5 s
+        audio_data, sr = create_test_audio(duration=6.0)
         
-        if processed_file.exists():
-            # Verify processed file
-            processed_data, processed_sr = sf.read(processed_file)
+        with tempfile.TemporaryDirectory(dir=RAM_TMP_DIR) as tmp_dir:
+            test_file = Path(tmp_dir) / "test_audio.wav"
+            sf.write(test_file, audio_data, sr, subtype='PCM_16')
             
-            print("✅ Pipeline preprocessing stage successful")
-            print(f"   Original: {len(audio_data)} samples @ {sr}Hz")
-            print(f"   Processed: {len(processed_data)} samples @ {processed_sr}Hz")
-            print(f"   Format: {processed_data.dtype}")
-            
-            # Verify it meets ElevenLabs requirements
-            duration = len(processed_data) / processed_sr
-            print(f"   Duration: {duration:.2f}s (min 5s required: {'✅' if duration >= 5.0 else '❌'})")
-            print(f"   Sample rate: {processed_sr}Hz ({'✅' if processed_sr in [16000, 44100] else '❌'})")
-            print(f"   Channels: {'mono' if processed_data.ndim == 1 else f'{processed_data.shape[1]}ch'}")
-            
-            # Cleanup
-            test_file.unlink()
-            processed_file.unlink()
-            
-            return duration >= 5.0 and processed_sr in [16000, 44100]
-        else:
-            print("❌ Pipeline preprocessing failed")
-            return False
+            # Test preprocessing stage only
+            preprocessor = AudioPreprocessor()
+            processed_file = preprocessor.process_file(test_file)
+            try:
+                if not processed_file.exists():
+                    print("❌ Pipeline preprocessing failed")
+                    return False
+                
+                # Verify processed file from its header; no samples are decoded
+                processed = sf.info(str(processed_file))
+                processed_sr = processed.samplerate
+                
+                print("✅ Pipeline preprocessing stage successful")
+                print(f"   Original: {len(audio_data)} samples @ {sr}Hz")
+                print(f"   Processed: {processed.frames} samples @ {processed_sr}Hz")
+                print(f"   Format: {processed.subtype}")
+                
+                # Verify it meets ElevenLabs requirements
+                duration = processed.frames / processed_sr
+                print(f"   Duration: {duration:.2f}s (min 5s required: {'✅' if duration >= 5.0 else '❌'})")
+                print(f"   Sample rate: {processed_sr}Hz ({'✅' if processed_sr in [16000, 44100] else '❌'})")
+                print(f"   Channels: {'mono' if processed.channels == 1 else f'{processed.channels}ch'}")
+                
+                return duration >= 5.0 and processed_sr in [16000, 44100]
+            finally:
+                processed_file.unlink(missing_ok=True)
             
     except Exception as e:
         print(f"❌ Pipeline integration test failed: {e}")
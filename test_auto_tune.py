@@ -1,9 +1,13 @@
+import math
 import unittest
 
+import numpy as np
+
 from auto_tune import (
     RSPDX_R2_MAX_HZ,
     RSPDX_R2_MIN_HZ,
     SpectrumSample,
+    _mean_power_dbfs,
     build_scan_frequencies,
     clamp_to_rspdx_r2_limits,
     detect_active_frequencies,
@@ -50,6 +54,13 @@ class AutoTuneWidebandTest(unittest.TestCase):
     def test_detect_active_frequencies_empty_input(self) -> None:
         self.assertEqual(detect_active_frequencies([]), [])
 
+    def test_mean_power_dbfs_matches_magnitude_squared(self) -> None:
+        rng = np.random.default_rng(0)
+        iq = (rng.normal(size=4096) + 1j * rng.normal(size=4096)).astype(np.complex64)
+        expected = 10.0 * math.log10(float(np.mean(np.abs(iq) ** 2)) + 1e-20)
+        self.assertAlmostEqual(_mean_power_dbfs(iq), expected, places=4)
+        self.assertEqual(_mean_power_dbfs(np.zeros(0, dtype=np.complex64)), -200.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,50 +7,63 @@ from dotenv import load_dotenv
 load_dotenv()
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import encode_multipart_formdata
 from pathlib import Path
-import soundfile as sf
+from audio_upload_utils import load_wav_as_int16_bytes
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 api_key = os.getenv('ELEVENLABS_API_KEY')
 
 # Use the same good Italian capture
 test_file = Path("capture_91_1MHz.wav")
-audio_data, sample_rate = sf.read(str(test_file))
 
 # Prepare audio (keep at original sample rate)
-import numpy as np
-audio_16bit = np.clip(audio_data * 32767, -32768, 32767).astype(np.int16)
-
-import io
-buffer = io.BytesIO()
-sf.write(buffer, audio_16bit, sample_rate, format='WAV')
-buffer.seek(0)
-audio_bytes = buffer.read()
+audio_bytes = load_wav_as_int16_bytes(test_file)
 
 print(f"Testing same file 3 times WITH file_format parameter")
-print(f"Input MD5: {hashlib.md5(audio_bytes).hexdigest()}\n")
+print(f"Input BLAKE2b: {hashlib.blake2b(audio_bytes, digest_size=16).hexdigest()}\n")
 
 url = "https://api.elevenlabs.io/v1/audio-isolation"
-headers = {"xi-api-key": api_key}
-
-results = []
-for i in range(3):
-    files = {"audio": ("audio.wav", audio_bytes, "audio/wav")}
-    data = {"file_format": "other"}
-    
-    response = requests.post(url, headers=headers, files=files, data=data, timeout=60)
-    
-    md5 = hashlib.md5(response.content).hexdigest()
-    results.append({
-        'attempt': i+1,
-        'size': len(response.content),
-        'md5': md5
-    })
-    
-    print(f"Attempt {i+1}: Size={len(response.content)}, MD5={md5}")
+
+# One keep-alive session for all attempts; the pool holds a connection per worker
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+session.headers.update({"xi-api-key": api_key})
+
+# Encode the multipart body once; every attempt posts the same bytes
+multipart_body, multipart_type = encode_multipart_formdata({
+    "file_format": "other",
+    "audio": ("audio.wav", audio_bytes, "audio/wav"),
+})
+
+RESPONSE_CHUNK_SIZE = 65536
+
+def isolate(attempt):
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    # Hash the body as it streams in instead of buffering the whole MP3
+    with session.post(url, data=multipart_body, headers={"Content-Type": multipart_type},
+                      timeout=60, stream=True) as response:
+        for chunk in response.iter_content(chunk_size=RESPONSE_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+    return {
+        'attempt': attempt+1,
+        'size': size,
+        'digest': digest.hexdigest()
+    }
+
+# The three identical requests are independent, so send them concurrently
+with ThreadPoolExecutor(max_workers=3) as executor:
+    results = list(executor.map(isolate, range(3)))
+
+for r in results:
+    print(f"Attempt {r['attempt']}: Size={r['size']}, BLAKE2b={r['digest']}")
 
 print("\n=== RESULTS ===")
-if len(set(r['md5'] for r in results)) == 1:
+if len(set(r['digest'] for r in results)) == 1:
     print("✅ CONSISTENT: All responses are identical!")
 else:
     print("❌ INCONSISTENT: Still getting different outputs for same input")
@@ -1,25 +1,15 @@
-import sys
 import types
 import wave
 from pathlib import Path
 
 import numpy as np
-from fastapi.testclient import TestClient
-
-# Isolate tests from optional maritime capture dependencies.
-api_maritime_aviation_stub = types.ModuleType("api_maritime_aviation")
-api_maritime_aviation_stub.add_maritime_aviation_routes = lambda app: app
-sys.modules["api_maritime_aviation"] = api_maritime_aviation_stub
 
 import api_server
 
 
-client = TestClient(api_server.app)
-
-
 def _write_test_wav(path: Path, sample_rate: int = 16000, duration_sec: float = 0.3) -> None:
     t = np.linspace(0, duration_sec, int(sample_rate * duration_sec), endpoint=False)
-    signal = (0.2 * np.sin(2.0 * np.pi * 440.0 * t) * 32767).astype(np.int16)
+    signal = (0.2 * np.sin(2.0 * np.pi * 440.0 * t) * 32767).astype("<i2")
     with wave.open(str(path), "wb") as wav_file:
         wav_file.setnchannels(1)
         wav_file.setsampwidth(2)
@@ -27,7 +17,7 @@ def _write_test_wav(path: Path, sample_rate: int = 16000, duration_sec: float =
         wav_file.writeframes(signal.tobytes())
 
 
-def test_audio_api_serves_wav_clip(tmp_path: Path, monkeypatch) -> None:
+def test_audio_api_serves_wav_clip(client, tmp_path: Path, monkeypatch) -> None:
     wav_path = tmp_path / "sample.wav"
     wav_path.write_bytes(b"RIFF\x00\x00\x00\x00WAVEfmt ")
 
@@ -40,7 +30,23 @@ def test_audio_api_serves_wav_clip(tmp_path: Path, monkeypatch) -> None:
     assert response.content.startswith(b"RIFF")
 
 
-def test_audio_api_rejects_unknown_file(tmp_path: Path, monkeypatch) -> None:
+def test_audio_api_streams_large_wav_with_content_length(
+    client, tmp_path: Path, monkeypatch
+) -> None:
+    wav_path = tmp_path / "long_capture.wav"
+    _write_test_wav(wav_path, sample_rate=48000, duration_sec=30.0)
+    monkeypatch.setattr(api_server, "AUDIO_SEARCH_DIRS", [tmp_path])
+    expected = wav_path.read_bytes()
+
+    with client.stream("GET", "/api/audio/long_capture.wav") as response:
+        chunks = list(response.iter_bytes())
+
+    assert response.status_code == 200
+    assert int(response.headers["content-length"]) == wav_path.stat().st_size
+    assert b"".join(chunks) == expected
+
+
+def test_audio_api_rejects_unknown_file(client, tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setattr(api_server, "AUDIO_SEARCH_DIRS", [tmp_path])
 
     response = client.get("/api/audio/missing.wav")
@@ -48,7 +54,7 @@ def test_audio_api_rejects_unknown_file(tmp_path: Path, monkeypatch) -> None:
     assert response.status_code == 404
 
 
-def test_transcribe_endpoint_returns_text(tmp_path: Path, monkeypatch) -> None:
+def test_transcribe_endpoint_returns_text(client, tmp_path: Path, monkeypatch) -> None:
     wav_path = tmp_path / "sample.wav"
     _write_test_wav(wav_path)
     monkeypatch.setattr(api_server, "AUDIO_SEARCH_DIRS", [tmp_path])
@@ -84,7 +90,7 @@ def test_transcribe_endpoint_returns_text(tmp_path: Path, monkeypatch) -> None:
 
 
 def test_transcribe_endpoint_returns_bad_request_for_invalid_backend(
-    tmp_path: Path, monkeypatch
+    client, tmp_path: Path, monkeypatch
 ) -> None:
     wav_path = tmp_path / "sample.wav"
     _write_test_wav(wav_path)
@@ -106,7 +112,9 @@ def test_transcribe_endpoint_returns_bad_request_for_invalid_backend(
     assert "Unsupported whisper backend 'broken'" in response.json()["detail"]
 
 
-def test_analysis_transcribe_endpoint_alias_returns_payload(tmp_path: Path, monkeypatch) -> None:
+def test_analysis_transcribe_endpoint_alias_returns_payload(
+    client, tmp_path: Path, monkeypatch
+) -> None:
     wav_path = tmp_path / "sample.wav"
     _write_test_wav(wav_path)
     monkeypatch.setattr(api_server, "AUDIO_SEARCH_DIRS", [tmp_path])
@@ -130,7 +138,7 @@ def test_analysis_transcribe_endpoint_alias_returns_payload(tmp_path: Path, monk
     assert body["backend"] == "openai-whisper"
 
 
-def test_stress_endpoint_returns_score_and_features(tmp_path: Path, monkeypatch) -> None:
+def test_stress_endpoint_returns_score_and_features(client, tmp_path: Path, monkeypatch) -> None:
     wav_path = tmp_path / "sample.wav"
     _write_test_wav(wav_path)
     monkeypatch.setattr(api_server, "AUDIO_SEARCH_DIRS", [tmp_path])
@@ -157,7 +165,7 @@ def test_stress_endpoint_returns_score_and_features(tmp_path: Path, monkeypatch)
     assert body["features"]["zero_crossing_rate"] == 0.11
 
 
-def test_analysis_stress_endpoint_alias_returns_score(tmp_path: Path, monkeypatch) -> None:
+def test_analysis_stress_endpoint_alias_returns_score(client, tmp_path: Path, monkeypatch) -> None:
     wav_path = tmp_path / "sample.wav"
     _write_test_wav(wav_path)
     monkeypatch.setattr(api_server, "AUDIO_SEARCH_DIRS", [tmp_path])
@@ -180,7 +188,9 @@ def test_analysis_stress_endpoint_alias_returns_score(tmp_path: Path, monkeypatc
     assert response.json()["stress_score"] == 55
 
 
-def test_stress_endpoint_returns_not_found_for_missing_file(tmp_path: Path, monkeypatch) -> None:
+def test_stress_endpoint_returns_not_found_for_missing_file(
+    client, tmp_path: Path, monkeypatch
+) -> None:
     monkeypatch.setattr(api_server, "AUDIO_SEARCH_DIRS", [tmp_path])
 
     response = client.get("/stress", params={"file": "missing.wav"})
@@ -189,7 +199,9 @@ def test_stress_endpoint_returns_not_found_for_missing_file(tmp_path: Path, monk
     assert response.json()["detail"] == "Audio file not found"
 
 
-def test_analysis_audio_endpoint_returns_pipeline_payload(tmp_path: Path, monkeypatch) -> None:
+def test_analysis_audio_endpoint_returns_pipeline_payload(
+    client, tmp_path: Path, monkeypatch
+) -> None:
     wav_path = tmp_path / "sample.wav"
     _write_test_wav(wav_path)
     monkeypatch.setattr(api_server, "AUDIO_SEARCH_DIRS", [tmp_path])
@@ -233,7 +245,7 @@ def test_analysis_audio_endpoint_returns_pipeline_payload(tmp_path: Path, monkey
 
 
 def test_analysis_audio_endpoint_returns_bad_request_for_invalid_backend(
-    tmp_path: Path, monkeypatch
+    client, tmp_path: Path, monkeypatch
 ) -> None:
     wav_path = tmp_path / "sample.wav"
     _write_test_wav(wav_path)
@@ -5,62 +5,106 @@ from dotenv import load_dotenv
 load_dotenv()
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-import soundfile as sf
-import numpy as np
+from audio_upload_utils import load_wav_as_int16_bytes
 import hashlib
+import asyncio
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 api_key = os.getenv('ELEVENLABS_API_KEY')
 
 # Use the same file every time
 test_file = Path("REAL_RTL_CAPTURE_FM_Radio_Test_88.5MHz_20250912_194650.wav")
-audio_data, sample_rate = sf.read(str(test_file))
 
 # Prepare the EXACT same audio bytes
-audio_16bit = np.clip(audio_data * 32767, -32768, 32767).astype(np.int16)
-import io
-buffer = io.BytesIO()
-sf.write(buffer, audio_16bit, sample_rate, format='WAV')
-buffer.seek(0)
-audio_bytes = buffer.read()
+audio_bytes = load_wav_as_int16_bytes(test_file)
 
 print(f"Testing with SAME file 3 times: {test_file.name}")
-print(f"Input file MD5: {hashlib.md5(audio_bytes).hexdigest()}\n")
+print(f"Input file BLAKE2b: {hashlib.blake2b(audio_bytes, digest_size=16).hexdigest()}\n")
 
 url = "https://api.elevenlabs.io/v1/audio-isolation"
-headers = {"xi-api-key": api_key}
+headers = {"xi-api-key": api_key} if api_key else {}
+
+RESPONSE_CHUNK_SIZE = 65536
+
+def output_path(attempt):
+    return Path(f"test_same_input_{attempt+1}.mp3")
+
+def result(attempt, status, size, digest):
+    return {
+        'attempt': attempt+1,
+        'status': status,
+        'size': size,
+        'digest': digest.hexdigest(),
+        'output': output_path(attempt)
+    }
+
+async def isolate_async(client, attempt):
+    # Fresh files dict per request; the audio bytes themselves are shared
+    files = {"audio": ("audio.wav", audio_bytes, "audio/wav")}
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    # Stream the body: each chunk is hashed and written to disk as it arrives
+    async with client.stream("POST", url, files=files) as response:
+        with open(output_path(attempt), 'wb') as f:
+            async for chunk in response.aiter_bytes(RESPONSE_CHUNK_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+    return result(attempt, response.status_code, size, digest)
+
+async def isolate_all():
+    # Submit all three at once; with h2 installed they share one HTTP/2 connection
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, headers=headers, timeout=120) as client:
+        return await asyncio.gather(*(isolate_async(client, i) for i in range(3)))
 
-results = []
-for i in range(3):
-    print(f"Attempt {i+1}:")
+def isolate(attempt):
     files = {"audio": ("audio.wav", audio_bytes, "audio/wav")}
-    response = requests.post(url, headers=headers, files=files, timeout=120)
-    
-    md5 = hashlib.md5(response.content).hexdigest()
-    results.append({
-        'attempt': i+1,
-        'status': response.status_code,
-        'size': len(response.content),
-        'md5': md5
-    })
-    
-    # Save each response
-    output = Path(f"test_same_input_{i+1}.mp3")
-    with open(output, 'wb') as f:
-        f.write(response.content)
-    
-    print(f"  Status: {response.status_code}")
-    print(f"  Size: {len(response.content)} bytes")
-    print(f"  MD5: {md5}")
-    print(f"  Saved to: {output}\n")
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    with session.post(url, files=files, timeout=120, stream=True) as response, \
+            open(output_path(attempt), 'wb') as f:
+        for chunk in response.iter_content(chunk_size=RESPONSE_CHUNK_SIZE):
+            digest.update(chunk)
+            f.write(chunk)
+            size += len(chunk)
+    return result(attempt, response.status_code, size, digest)
+
+# The three identical requests are independent, so send them concurrently
+if httpx is not None:
+    results = asyncio.run(isolate_all())
+else:
+    # One keep-alive session for all attempts; the pool holds a connection per worker
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    session.headers.update(headers)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(isolate, range(3)))
+
+for r in results:
+    print(f"Attempt {r['attempt']}:")
+    print(f"  Status: {r['status']}")
+    print(f"  Size: {r['size']} bytes")
+    print(f"  BLAKE2b: {r['digest']}")
+    print(f"  Saved to: {r['output']}\n")
 
 print("\n=== COMPARISON ===")
 print("Same input file, 3 API calls:")
 for r in results:
-    print(f"Attempt {r['attempt']}: Size={r['size']}, MD5={r['md5']}")
+    print(f"Attempt {r['attempt']}: Size={r['size']}, BLAKE2b={r['digest']}")
 
-if len(set(r['md5'] for r in results)) == 1:
-    print("\n✅ All responses are IDENTICAL (same MD5)")
+if len(set(r['digest'] for r in results)) == 1:
+    print("\n✅ All responses are IDENTICAL (same digest)")
 else:
     print("\n❌ Responses are DIFFERENT despite same input!")
     print("This means the API is generating/hallucinating different content each time!")
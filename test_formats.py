@@ -8,25 +8,34 @@ load_dotenv()
 import os
 import requests
 from pathlib import Path
+from audio_upload_utils import float_to_int16, play_audio
 import soundfile as sf
-import numpy as np
-import subprocess
-import librosa
 import io
+from math import gcd
+
+try:
+    import soxr
+except ImportError:  # soxr normally arrives with librosa; fall back to scipy
+    soxr = None
 
 api_key = os.getenv('ELEVENLABS_API_KEY')
 
 audio_file = Path("capture_91_1MHz.wav")
 
 # Read and convert
-audio_data, orig_sr = sf.read(str(audio_file))
+audio_data, orig_sr = sf.read(str(audio_file), dtype='float32')
 print(f"Original: {orig_sr} Hz")
 
-# Resample to 16kHz
-audio_16khz = librosa.resample(audio_data, orig_sr=orig_sr, target_sr=16000)
+# Resample to 16kHz with a polyphase resampler
+if soxr is not None:
+    audio_16khz = soxr.resample(audio_data, orig_sr, 16000, quality='HQ')
+else:
+    from scipy.signal import resample_poly
+    g = gcd(orig_sr, 16000)
+    audio_16khz = resample_poly(audio_data, 16000 // g, orig_sr // g)
 
 # Convert to 16-bit
-audio_16bit = np.clip(audio_16khz * 32767, -32768, 32767).astype(np.int16)
+audio_16bit = float_to_int16(audio_16khz)
 
 # Create WAV in memory at 16kHz
 buffer = io.BytesIO()
@@ -56,6 +65,6 @@ for format_option in ["pcm_s16le_16", "other"]:
         print(f"Size: {len(response.content)} bytes")
         
         print(f"\n🔊 PLAYING RESULT from {format_option}:")
-        subprocess.run(f"afplay {output}", shell=True)
+        play_audio(output)
     else:
         print(f"❌ Error: {response.text}")
@@ -8,9 +8,7 @@ load_dotenv()
 import os
 import requests
 from pathlib import Path
-import soundfile as sf
-import numpy as np
-import subprocess
+from audio_upload_utils import load_wav_as_int16_bytes, play_audio
 import time
 
 api_key = os.getenv('ELEVENLABS_API_KEY')
@@ -22,16 +20,8 @@ print("=" * 60)
 print(f"ORIGINAL FILE: {original_file.name}")
 print("Content: Clear Maltese speech\n")
 
-# Read original
-audio_data, sample_rate = sf.read(str(original_file))
-
 # Prepare for API
-audio_16bit = np.clip(audio_data * 32767, -32768, 32767).astype(np.int16)
-import io
-buffer = io.BytesIO()
-sf.write(buffer, audio_16bit, sample_rate, format='WAV')
-buffer.seek(0)
-audio_bytes = buffer.read()
+audio_bytes = load_wav_as_int16_bytes(original_file)
 
 # Send to ElevenLabs
 print("📡 Sending to ElevenLabs...")
@@ -50,11 +40,11 @@ if response.status_code == 200:
     # Play BEFORE
     print(f"\n🔊 PLAYING BEFORE (Original Maltese speech):")
     print(f"   File: {original_file.name}")
-    subprocess.run(f"afplay {original_file}", shell=True)
+    play_audio(original_file)
     
     time.sleep(1)
     
     # Play AFTER
     print(f"\n🔊 PLAYING AFTER (ElevenLabs 'isolated'):")
     print(f"   File: {isolated_file.name}")
-    subprocess.run(f"afplay {isolated_file}", shell=True)
+    play_audio(isolated_file)
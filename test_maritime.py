@@ -6,8 +6,8 @@ load_dotenv()
 import os
 import requests
 from pathlib import Path
+from audio_upload_utils import load_wav_as_int16_bytes
 import soundfile as sf
-import numpy as np
 
 api_key = os.getenv('ELEVENLABS_API_KEY')
 
@@ -15,16 +15,11 @@ api_key = os.getenv('ELEVENLABS_API_KEY')
 test_file = Path("REAL_RTL_CAPTURE_Maritime_CH16_156.8MHz_20250912_194656.wav")
 print(f"Testing with: {test_file.name}")
 
-audio_data, sample_rate = sf.read(str(test_file))
-print(f"Duration: {len(audio_data)/sample_rate:.1f}s, Sample rate: {sample_rate} Hz")
+info = sf.info(str(test_file))
+print(f"Duration: {info.duration:.1f}s, Sample rate: {info.samplerate} Hz")
 
 # Prepare for API
-audio_16bit = np.clip(audio_data * 32767, -32768, 32767).astype(np.int16)
-import io
-buffer = io.BytesIO()
-sf.write(buffer, audio_16bit, sample_rate, format='WAV')
-buffer.seek(0)
-audio_bytes = buffer.read()
+audio_bytes = load_wav_as_int16_bytes(test_file)
 
 print(f"Sending to ElevenLabs...")
 
@@ -1,25 +1,9 @@
-import sys
-import types
-
-# Isolate alert tests from unrelated optional maritime capture dependencies.
-api_maritime_aviation_stub = types.ModuleType("api_maritime_aviation")
-api_maritime_aviation_stub.add_maritime_aviation_routes = lambda app: app
-sys.modules["api_maritime_aviation"] = api_maritime_aviation_stub
-
-from fastapi.testclient import TestClient
+import asyncio
 
 import api_server
 
 
-client = TestClient(api_server.app)
-
-
-def setup_function() -> None:
-    api_server.ALERTS.clear()
-    api_server.ALERT_CLIENTS.clear()
-
-
-def test_distress_alert_is_promoted_to_critical() -> None:
+def test_distress_alert_is_promoted_to_critical(client) -> None:
     response = client.post(
         "/alerts",
         json={
@@ -36,7 +20,7 @@ def test_distress_alert_is_promoted_to_critical() -> None:
     assert payload["source"] == "kenneth-sdr"
 
 
-def test_non_distress_alert_defaults_to_warning() -> None:
+def test_non_distress_alert_defaults_to_warning(client) -> None:
     response = client.post(
         "/alerts",
         json={
@@ -52,7 +36,7 @@ def test_non_distress_alert_defaults_to_warning() -> None:
     assert payload["severity"] == "warning"
 
 
-def test_alert_stores_detected_language_from_payload_or_metadata() -> None:
+def test_alert_stores_detected_language_from_payload_or_metadata(client) -> None:
     explicit = client.post(
         "/alerts",
         json={
@@ -78,10 +62,10 @@ def test_alert_stores_detected_language_from_payload_or_metadata() -> None:
     assert fallback.json()["language"] == "ar"
 
 
-def test_dispatch_to_mission_control_conversation_and_kanban(monkeypatch) -> None:
+def test_dispatch_to_mission_control_conversation_and_kanban(client, monkeypatch) -> None:
     sent = []
 
-    def fake_post_json(url, payload, headers, timeout):
+    async def fake_post_json(url, payload, headers, timeout):
         sent.append(
             {
                 "url": url,
@@ -123,7 +107,34 @@ def test_dispatch_to_mission_control_conversation_and_kanban(monkeypatch) -> Non
     assert second["timeout"] == 7
 
 
-def test_high_stress_alert_triggers_telegram_notification(monkeypatch) -> None:
+def test_mission_control_webhooks_are_dispatched_concurrently(client, monkeypatch) -> None:
+    started = []
+    finished = []
+
+    async def fake_post_json(url, payload, headers, timeout):
+        started.append(url)
+        await asyncio.sleep(0.05)
+        finished.append((url, len(started)))
+
+    monkeypatch.setenv("MC_CONVERSATION_WEBHOOK_URL", "http://mc.local/conversation")
+    monkeypatch.setenv("MC_KANBAN_WEBHOOK_URL", "http://mc.local/kanban")
+    monkeypatch.setattr(api_server, "_post_json", fake_post_json)
+
+    response = client.post(
+        "/alerts",
+        json={"title": "Signal detected", "source": "kenneth-sdr"},
+    )
+
+    assert response.status_code == 200
+    # Both POSTs were in flight before either completed.
+    assert sorted(url for url, _ in finished) == [
+        "http://mc.local/conversation",
+        "http://mc.local/kanban",
+    ]
+    assert all(in_flight == 2 for _, in_flight in finished)
+
+
+def test_high_stress_alert_triggers_telegram_notification(client, monkeypatch) -> None:
     sent = []
 
     def fake_send_stress_alert(stress_score, frequency, transcription, indicators):
@@ -158,7 +169,7 @@ def test_high_stress_alert_triggers_telegram_notification(monkeypatch) -> None:
     assert sent[0]["indicators"]["trigger"] == "rapid speech"
 
 
-def test_high_stress_alert_triggers_discord_notification(monkeypatch) -> None:
+def test_high_stress_alert_triggers_discord_notification(client, monkeypatch) -> None:
     sent = []
 
     def fake_send_discord_alert(message, stress_score, transcription_preview):
@@ -189,7 +200,7 @@ def test_high_stress_alert_triggers_discord_notification(monkeypatch) -> None:
     assert "panicking and breathing heavily" in sent[0]["transcription_preview"]
 
 
-def test_high_priority_event_triggers_spotify_audio_alert(monkeypatch) -> None:
+def test_high_priority_event_triggers_spotify_audio_alert(client, monkeypatch) -> None:
     sent = []
 
     def fake_dispatch_spotify_audio_alert(alert, stress_score):
@@ -216,7 +227,7 @@ def test_high_priority_event_triggers_spotify_audio_alert(monkeypatch) -> None:
     assert sent[0]["stress_score"] is None
 
 
-def test_routine_alert_does_not_trigger_spotify_audio_alert(monkeypatch) -> None:
+def test_routine_alert_does_not_trigger_spotify_audio_alert(client, monkeypatch) -> None:
     sent = []
 
     def fake_dispatch_spotify_audio_alert(alert, stress_score):
@@ -65,3 +65,53 @@ def test_write_wav_with_metadata_creates_sidecar(tmp_path: Path, monkeypatch) ->
     assert metadata["frequency_hz"] == 146_520_000
     assert metadata["demod_mode"] == "nfm"
     assert metadata["duration_sec"] == 1.0
+
+
+def test_demod_outputs_stay_single_precision(tmp_path: Path) -> None:
+    hunter = _hunter(tmp_path)
+    iq = np.exp(1j * np.linspace(0.0, 8.0 * np.pi, 200000))
+
+    for demod in (hunter._am_demodulate, hunter._nfm_demodulate, hunter._fm_demodulate):
+        audio = demod(iq)
+        assert audio.dtype == np.float32
+        assert np.all(np.isfinite(audio))
+
+
+def test_fm_demod_reuses_scratch_buffers_without_aliasing_output(tmp_path: Path) -> None:
+    hunter = _hunter(tmp_path)
+    hunter.sample_rate = hunter.demod_audio_sample_rate
+    phase_step = 0.3
+    iq = np.exp(1j * phase_step * np.arange(4000)).astype(np.complex64)
+
+    first = hunter._fm_demodulate(iq)
+    scratch = hunter._demod_phase
+    second = hunter._fm_demodulate(iq[:2000] * np.complex64(1j))
+
+    np.testing.assert_allclose(first, np.angle(iq[1:] * np.conj(iq[:-1])), atol=1e-5)
+    np.testing.assert_allclose(first, phase_step, atol=1e-5)
+    np.testing.assert_allclose(second, phase_step, atol=1e-5)
+    assert hunter._demod_phase is scratch
+    assert not np.shares_memory(first, scratch)
+
+
+def test_demodulate_iq_file_streams_blocks_like_whole_capture(tmp_path: Path) -> None:
+    from rtl_sdr_real_capture import uint8_iq_to_complex64
+
+    hunter = _hunter(tmp_path)
+    hunter.DEMOD_BLOCK_SAMPLES = 40_000
+    n = 250_001
+    phase = 0.1 * np.arange(n) + np.sin(np.arange(n) / 500.0)
+    envelope = 1.0 + 0.5 * np.sin(np.arange(n) / 1100.0)
+    raw = np.empty(2 * n, dtype=np.uint8)
+    raw[0::2] = np.clip(envelope * np.cos(phase) * 80 + 127.5, 0, 255)
+    raw[1::2] = np.clip(envelope * np.sin(phase) * 80 + 127.5, 0, 255)
+    iq_file = tmp_path / "capture.iq"
+    raw.tofile(iq_file)
+    iq = uint8_iq_to_complex64(raw)
+
+    np.testing.assert_allclose(
+        hunter.demodulate_iq_file(iq_file, "nfm"), hunter.demodulate_nfm(iq), atol=1e-6
+    )
+    np.testing.assert_allclose(
+        hunter.demodulate_iq_file(iq_file, "am"), hunter.demodulate_am(iq), atol=1e-5
+    )
@@ -0,0 +1,52 @@
+import numpy as np
+
+from real_rf_capture_only import (
+    StreamingFMDemodulator,
+    fm_discriminate,
+    normalize_audio,
+    split_iq,
+)
+
+
+def test_split_iq_deinterleaves_complex_buffer() -> None:
+    iq = (np.arange(8) + 1j * -np.arange(8)).astype(np.complex64)
+
+    i, q = split_iq(iq.view(np.float32))
+
+    assert i.dtype == np.float32 and i.flags["C_CONTIGUOUS"]
+    assert np.array_equal(i, iq.real)
+    assert np.array_equal(q, iq.imag)
+
+
+def test_fm_discriminate_matches_unwrapped_phase_difference() -> None:
+    rng = np.random.default_rng(0)
+    phase = np.cumsum(rng.uniform(-2.5, 2.5, 4096))
+    iq = np.exp(1j * phase).astype(np.complex64)
+
+    i, q = split_iq(iq.view(np.float32))
+    audio = fm_discriminate(i, q)
+
+    expected = np.diff(np.unwrap(np.angle(iq)))
+    assert np.allclose(audio, expected, atol=1e-4)
+
+
+def test_normalize_audio_removes_dc_and_scales_peak() -> None:
+    audio = np.array([1.0, 2.0, 3.0, 6.0], dtype=np.float32)
+
+    normalize_audio(audio)
+
+    assert abs(float(audio.mean())) < 1e-6
+    assert np.isclose(np.abs(audio).max(), 0.7)
+
+
+def test_streaming_demodulator_matches_one_shot_decimation() -> None:
+    rng = np.random.default_rng(1)
+    iq = np.exp(1j * np.cumsum(rng.uniform(-1.0, 1.0, 10_000))).astype(np.complex64)
+    i, q = split_iq(iq.view(np.float32))
+
+    demodulator = StreamingFMDemodulator(41, len(iq))
+    for start in range(0, len(iq), 777):
+        demodulator.process(i[start:start + 777], q[start:start + 777])
+
+    expected = fm_discriminate(i, q)[::41]
+    assert np.allclose(demodulator.result(), expected, atol=1e-6)
@@ -2,7 +2,14 @@ from unittest.mock import patch
 
 import numpy as np
 
-from rtl_sdr_real_capture import RTLSDRRealCapture
+from rtl_sdr_real_capture import (
+    RTLSDRRealCapture,
+    am_envelope_uint8,
+    amplitude_entropy,
+    fm_discriminate,
+    fm_discriminate_uint8,
+    uint8_iq_to_complex64,
+)
 
 
 def _capture() -> RTLSDRRealCapture:
@@ -51,3 +58,66 @@ def test_am_demodulation_decimates_to_48khz() -> None:
     assert audio is not None
     expected = int(round(count * 48_000 / sample_rate))
     assert abs(len(audio) - expected) <= 1
+
+
+def test_fm_demodulation_resamples_to_48khz() -> None:
+    capture = _capture()
+    sample_rate = 2_048_000
+    count = sample_rate // 4
+    t = np.arange(count) / sample_rate
+
+    deviation_hz = 5_000.0
+    tone_hz = 1_000.0
+    phase = 2 * np.pi * deviation_hz * np.cumsum(np.sin(2 * np.pi * tone_hz * t)) / sample_rate
+    iq = np.exp(1j * phase).astype(np.complex64)
+
+    audio = capture.fm_demodulate(iq, sample_rate)
+
+    assert audio is not None
+    expected = int(round(count * 48_000 / sample_rate))
+    assert abs(len(audio) - expected) <= 1
+    assert np.isclose(np.max(np.abs(audio)), 0.7)
+
+    spectrum = np.abs(np.fft.rfft(audio))
+    peak_hz = np.argmax(spectrum) * 48_000 / len(audio)
+    assert abs(peak_hz - tone_hz) < 20
+
+
+def test_fm_discriminate_matches_unwrapped_phase_difference() -> None:
+    rng = np.random.default_rng(0)
+    iq = np.exp(1j * np.cumsum(rng.uniform(-2.0, 2.0, 10_001))).astype(np.complex64)
+
+    expected = np.diff(np.unwrap(np.angle(iq)))
+    assert np.allclose(fm_discriminate(iq), expected, atol=1e-3)
+
+
+def test_uint8_iq_to_complex64_centers_and_scales() -> None:
+    raw = np.array([0, 255, 127, 128, 200, 10, 7], dtype=np.uint8)
+
+    iq = uint8_iq_to_complex64(raw)
+
+    expected = (raw[0:6:2] - 127.5) / 127.5 + 1j * (raw[1:6:2] - 127.5) / 127.5
+    assert iq.dtype == np.complex64
+    assert np.allclose(iq, expected)
+
+
+def test_chunked_uint8_demod_matches_whole_buffer_conversion() -> None:
+    rng = np.random.default_rng(3)
+    raw = rng.integers(0, 256, size=10_001, dtype=np.uint8)
+    iq = uint8_iq_to_complex64(raw)
+
+    steps = fm_discriminate_uint8(raw, chunk_bytes=1_000)
+    envelope = am_envelope_uint8(raw, chunk_bytes=1_000)
+
+    assert steps.dtype == np.float32 and envelope.dtype == np.float32
+    assert np.allclose(steps, fm_discriminate(iq), atol=1e-6)
+    assert np.allclose(envelope, np.abs(iq))
+
+
+def test_amplitude_entropy_separates_content_from_quantized_audio() -> None:
+    t = np.arange(48_000) / 48_000
+    tone = 0.7 * np.sin(2 * np.pi * 440 * t)
+
+    assert amplitude_entropy(tone) > 3.0
+    assert amplitude_entropy(np.round(tone * 4) / 4) < 3.0
+    assert amplitude_entropy(np.zeros(1_000)) == 0.0
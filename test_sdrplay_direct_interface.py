@@ -0,0 +1,74 @@
+import numpy as np
+
+from sdrplay_direct_interface import SDRplayAPI, SampleRing
+
+
+def _block(start: int, count: int) -> np.ndarray:
+    return (np.arange(start, start + count) * (1 + 1j)).astype(np.complex64)
+
+
+def test_sample_ring_pops_blocks_in_push_order() -> None:
+    ring = SampleRing(slots=4, block_samples=8)
+
+    for start in (0, 8, 16):
+        assert ring.push(_block(start, 5))
+
+    assert len(ring) == 3
+    for start in (0, 8, 16):
+        np.testing.assert_array_equal(ring.pop(), _block(start, 5))
+    assert ring.pop() is None
+
+
+def test_sample_ring_drops_pushes_when_full() -> None:
+    ring = SampleRing(slots=2, block_samples=8)
+
+    assert ring.push(_block(0, 8))
+    assert ring.push(_block(8, 8))
+    assert not ring.push(_block(16, 8))
+
+    np.testing.assert_array_equal(ring.pop(), _block(0, 8))
+    assert ring.push(_block(24, 8))
+    np.testing.assert_array_equal(ring.pop(), _block(8, 8))
+    np.testing.assert_array_equal(ring.pop(), _block(24, 8))
+
+
+def test_sample_ring_splits_oversized_blocks_without_losing_samples() -> None:
+    ring = SampleRing(slots=4, block_samples=8)
+    samples = _block(0, 20)
+
+    assert ring.push(samples)
+    assert len(ring) == 3
+    np.testing.assert_array_equal(np.concatenate([ring.pop() for _ in range(3)]), samples)
+
+    # Not enough free slots for the whole push: nothing is written
+    ring = SampleRing(slots=2, block_samples=8)
+    assert not ring.push(samples)
+    assert len(ring) == 0
+
+
+def test_sdrplay_api_ring_allocates_no_blocks_until_used() -> None:
+    api = SDRplayAPI()
+
+    assert all(block is None for block in api.sample_queue._blocks)
+
+
+def test_sdrplay_library_miss_is_retried(monkeypatch) -> None:
+    import sdrplay_direct_interface as sdi
+
+    attempts = []
+
+    def fake_cdll(path):
+        attempts.append(path)
+        if len(attempts) == 1:
+            raise OSError(path)
+        return object()
+
+    monkeypatch.setattr(sdi, "_SDRPLAY_LIBRARIES", {})
+    monkeypatch.setattr(sdi.ctypes.util, "find_library", lambda name: None)
+    monkeypatch.setattr(sdi.ctypes, "CDLL", fake_cdll)
+
+    assert sdi._load_sdrplay_library(("libsdrplay_api.dylib",)) is None
+    loaded = sdi._load_sdrplay_library(("libsdrplay_api.dylib",))
+    assert loaded is not None
+    assert sdi._load_sdrplay_library(("libsdrplay_api.dylib",)) is loaded
+    assert len(attempts) == 2
@@ -1,24 +1,12 @@
 import io
 import math
-import struct
-import sys
-import types
 import wave
 
 import numpy as np
-from fastapi.testclient import TestClient
-
-# Isolate tests from optional maritime capture dependencies.
-api_maritime_aviation_stub = types.ModuleType("api_maritime_aviation")
-api_maritime_aviation_stub.add_maritime_aviation_routes = lambda app: app
-sys.modules["api_maritime_aviation"] = api_maritime_aviation_stub
 
 import api_server
 
 
-client = TestClient(api_server.app)
-
-
 def setup_function() -> None:
     api_server.SPEAKER_PROFILES.clear()
 
@@ -27,25 +15,33 @@ def _make_voice_wav(
     fundamental_hz: float, duration_sec: float = 1.4, sample_rate: int = 16000
 ) -> bytes:
     sample_count = int(duration_sec * sample_rate)
-    t = np.arange(sample_count, dtype=np.float32) / sample_rate
-    signal = (
-        0.60 * np.sin(2.0 * math.pi * fundamental_hz * t)
-        + 0.25 * np.sin(2.0 * math.pi * fundamental_hz * 2.0 * t)
-        + 0.15 * np.sin(2.0 * math.pi * fundamental_hz * 3.0 * t)
-    )
-    signal = np.clip(signal, -0.99, 0.99)
-    pcm16 = (signal * 32767.0).astype(np.int16)
+    # Fundamental phase per sample; harmonics reuse it and accumulate in place.
+    phase = np.arange(sample_count, dtype=np.float32)
+    phase *= np.float32(2.0 * math.pi * fundamental_hz / sample_rate)
+    signal = np.sin(phase)
+    signal *= np.float32(0.60)
+    harmonic = np.empty_like(phase)
+    for multiple, amplitude in ((2.0, 0.25), (3.0, 0.15)):
+        np.multiply(phase, np.float32(multiple), out=harmonic)
+        np.sin(harmonic, out=harmonic)
+        harmonic *= np.float32(amplitude)
+        signal += harmonic
+    signal *= np.float32(32767.0)
+    # Clip and cast in one pass, straight into the int16 buffer.
+    pcm16 = np.empty(signal.shape, dtype="<i2")
+    limit = np.float32(0.99 * 32767.0)
+    np.clip(signal, -limit, limit, out=pcm16, casting="unsafe")
 
     buf = io.BytesIO()
     with wave.open(buf, "wb") as wav_file:
         wav_file.setnchannels(1)
         wav_file.setsampwidth(2)
         wav_file.setframerate(sample_rate)
-        wav_file.writeframes(struct.pack(f"<{len(pcm16)}h", *pcm16))
+        wav_file.writeframes(pcm16.tobytes())
     return buf.getvalue()
 
 
-def test_identify_speaker_creates_profile_with_demographics() -> None:
+def test_identify_speaker_creates_profile_with_demographics(client) -> None:
     audio = _make_voice_wav(138.0)
     response = client.post(
         "/voice/speakers/identify",
@@ -65,7 +61,7 @@ def test_identify_speaker_creates_profile_with_demographics() -> None:
     assert "age_range" in profile
 
 
-def test_identify_speaker_matches_existing_profile_across_captures() -> None:
+def test_identify_speaker_matches_existing_profile_across_captures(client) -> None:
     first = _make_voice_wav(132.0)
     second = _make_voice_wav(134.0)
 
@@ -91,7 +87,7 @@ def test_identify_speaker_matches_existing_profile_across_captures() -> None:
     assert second_payload["profile"]["last_capture_id"] == "cap-b"
 
 
-def test_identify_speaker_creates_new_profile_for_different_voice() -> None:
+def test_identify_speaker_creates_new_profile_for_different_voice(client) -> None:
     low_voice = _make_voice_wav(110.0)
     high_voice = _make_voice_wav(240.0)
 
@@ -118,3 +114,64 @@ def test_identify_speaker_creates_new_profile_for_different_voice() -> None:
     assert list_resp.status_code == 200
     profiles = list_resp.json()
     assert len(profiles) == 2
+
+
+def test_find_best_speaker_match_scores_centroids_like_pairwise_cosine() -> None:
+    rng = np.random.default_rng(3)
+    centroids = rng.normal(size=(5, 16)).astype(np.float32)
+    centroids[2] = 0.0
+    for index, centroid in enumerate(centroids):
+        api_server.SPEAKER_PROFILES[f"spk_{index}"] = api_server.SpeakerProfile(
+            id=f"spk_{index}",
+            created_at="2026-01-01T00:00:00",
+            updated_at="2026-01-01T00:00:00",
+            first_capture_id=None,
+            last_capture_id=None,
+            captures_count=1,
+            average_similarity=1.0,
+            gender_estimate="unknown",
+            age_estimate=30,
+            age_range="25-35",
+            confidence=0.5,
+            embedding=centroid.tolist(),
+        )
+    probe = centroids[4] + rng.normal(scale=0.05, size=16).astype(np.float32)
+
+    match = api_server._find_best_speaker_match(probe)
+
+    expected = [
+        (float(np.dot(probe, c) / (np.linalg.norm(probe) * np.linalg.norm(c))) + 1.0) / 2.0
+        for c in centroids[[0, 1, 3, 4]]
+    ]
+    assert match["speaker_id"] == "spk_4"
+    assert math.isclose(match["similarity"], max(expected), rel_tol=1e-6)
+    assert api_server._find_best_speaker_match(np.zeros(16, dtype=np.float32)) == {
+        "speaker_id": None,
+        "similarity": 0.0,
+    }
+
+
+def test_decode_audio_samples_bulk_decodes_pcm_wav() -> None:
+    pcm16 = np.array([[0, 16384], [-32768, 32767]], dtype="<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(pcm16.tobytes())
+
+    samples, sample_rate = api_server._decode_audio_samples(buf.getvalue(), "stereo.wav")
+
+    assert sample_rate == 8000
+    assert samples.dtype == np.float32
+    np.testing.assert_allclose(samples, [0.25, (-32768 + 32767) / 2 / 32768.0])
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(1)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(bytes([0, 128, 255]))
+
+    samples, _ = api_server._decode_audio_samples(buf.getvalue(), "mono8.wav")
+    np.testing.assert_allclose(samples, [-1.0, 0.0, 127.0 / 128.0])
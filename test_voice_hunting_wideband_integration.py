@@ -1,8 +1,12 @@
 import unittest
 from unittest.mock import patch
 
+import numpy as np
+
 from auto_tune import SpectrumSample
-from voice_hunting_scanner import VoiceHuntingScanner
+from scipy import signal
+
+from voice_hunting_scanner import VoiceHuntingScanner, rfft_envelope
 
 
 class VoiceHuntingWidebandIntegrationTest(unittest.TestCase):
@@ -40,6 +44,100 @@ class VoiceHuntingWidebandIntegrationTest(unittest.TestCase):
         scan_events = [event for event in events if isinstance(event, tuple) and event[0] == "scan"]
         self.assertTrue(any(name == "AUTO 160.300 MHz" for _, name in scan_events))
 
+    def test_short_samples_fall_back_to_a_single_welch_segment(self) -> None:
+        scanner = VoiceHuntingScanner()
+        rng = np.random.default_rng(1)
+        for length in (1000, 1023):
+            t = np.arange(length) / 48000
+            audio = 0.3 * np.sin(2 * np.pi * 200 * t) + rng.normal(0, 0.05, length)
+
+            has_voice, score = scanner.detect_voice_activity(audio, 48000)
+
+            # Baseline analysis: scipy shrinks nperseg=1024 to the input length
+            freqs, psd = signal.welch(audio, 48000, nperseg=length)
+            band = (freqs >= 300) & (freqs <= 3400)
+            envelope = np.abs(signal.hilbert(audio))
+            expected = (np.sqrt(np.mean(audio**2)) * 2 + psd[band].sum() / psd.sum() * 3
+                        + envelope.std() / envelope.mean()) / 6
+            self.assertTrue(has_voice)
+            self.assertAlmostEqual(score, expected, places=6)
+
+    def test_rfft_envelope_matches_hilbert_magnitude(self) -> None:
+        rng = np.random.default_rng(3)
+        for length in (4800, 4801):
+            batch = rng.normal(0, 0.3, (2, length))
+
+            np.testing.assert_allclose(
+                rfft_envelope(batch), np.abs(signal.hilbert(batch, axis=-1)), atol=1e-12
+            )
+
+    def test_decimated_voice_scores_track_full_rate_analysis(self) -> None:
+        scanner = VoiceHuntingScanner()
+        samples = []
+        with patch("builtins.print"):
+            for seed, (name, has_voice) in enumerate(
+                [("CH16 Emergency", True), ("CH16 Emergency", False), ("ATC Tower", True), ("ATC Tower", False)]
+            ):
+                np.random.seed(seed)
+                samples.append(scanner.create_test_sample(156.8e6, name, has_voice))
+        rng = np.random.default_rng(5)
+        t = np.arange(samples[0].size) / 48000
+        quiet = rng.normal(0, 0.005, t.size)
+        # Out-of-band carrier: the decimated copy drops it, the score must not
+        carrier = 0.05 * np.sin(2 * np.pi * 10_000 * t) + rng.normal(0, 0.005, t.size)
+        batch = np.stack(samples + [quiet, carrier])
+
+        results = [scanner.detect_voice_activity(row, 48000) for row in batch]
+        has_voice = np.array([voice for voice, _ in results])
+        scores = np.array([score for _, score in results])
+
+        rms = np.sqrt(np.mean(batch**2, axis=-1))
+        _, psd = signal.welch(batch, 48000, nperseg=1024, axis=-1)
+        voice_ratio = psd[:, 7:73].sum(axis=-1) / psd.sum(axis=-1)
+        envelope = np.abs(signal.hilbert(batch, axis=-1))
+        modulation_depth = envelope.std(axis=-1) / envelope.mean(axis=-1)
+        full_rate_scores = (rms * 2 + voice_ratio * 3 + modulation_depth) / 6
+
+        np.testing.assert_allclose(scores, full_rate_scores, atol=0.002)
+        np.testing.assert_array_equal(has_voice, full_rate_scores > scanner.voice_threshold)
+        self.assertFalse(has_voice[-1])
+
+    def test_time_vector_is_cached_and_read_only(self) -> None:
+        scanner = VoiceHuntingScanner()
+
+        t = scanner._get_time(8, 48000)
+
+        self.assertIs(scanner._get_time(8, 48000), t)
+        self.assertFalse(t.flags.writeable)
+        np.testing.assert_array_equal(t, np.linspace(0, 8, 8 * 48000))
+
+    def test_conversation_harmonics_match_direct_sine_sum(self) -> None:
+        scanner = VoiceHuntingScanner()
+        sample_rate = 8000
+        t = np.linspace(0, 4, 4 * sample_rate)
+        segments = [(200, 1.5, "voice"), (0, 1.0, "..."), (210, 1.0, "reply")]
+
+        np.random.seed(11)
+        with patch("builtins.print"):
+            audio = scanner._build_conversation(segments, t, sample_rate, "maritime")
+
+        np.random.seed(11)
+        expected = np.zeros_like(t)
+        start = 0.0
+        for freq, duration, _ in segments:
+            lo, hi = int(start * sample_rate), int((start + duration) * sample_rate)
+            if freq:
+                seg = t[lo:hi]
+                voice = (np.sin(2 * np.pi * freq * seg) * 0.6 +
+                         np.sin(2 * np.pi * freq * 2.1 * seg) * 0.4 +
+                         np.sin(2 * np.pi * freq * 3.2 * seg) * 0.2)
+                expected[lo:hi] = voice * np.exp(-0.1 * np.abs(seg - np.mean(seg)))
+            start += duration
+        expected = expected + (np.random.normal(0, 0.2, len(t)) + 0.1 * np.sin(2 * np.pi * 0.02 * t))
+        expected = expected / np.max(np.abs(expected)) * 0.8
+
+        np.testing.assert_array_equal(audio, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import json
 import sys
 import types
 import wave
@@ -5,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 # Keep tests isolated from optional audio runtime dependencies.
 if "soundfile" not in sys.modules:
@@ -31,7 +33,7 @@ from whisper_transcription import WhisperConfig, transcribe_audio, transcribe_au
 
 def _write_test_wav(path: Path, sample_rate: int = 16000, duration_sec: float = 0.2) -> None:
     t = np.linspace(0, duration_sec, int(sample_rate * duration_sec), endpoint=False)
-    signal = (0.3 * np.sin(2.0 * np.pi * 440.0 * t) * 32767).astype(np.int16)
+    signal = (0.3 * np.sin(2.0 * np.pi * 440.0 * t) * 32767).astype("<i2")
     with wave.open(str(path), "wb") as wav_file:
         wav_file.setnchannels(1)
         wav_file.setsampwidth(2)
@@ -130,6 +132,12 @@ def test_autonomous_hunter_auto_transcribe_writes_artifacts(
     assert len(hunter.transcriptions) == 1
     assert (hunter.transcripts_dir / "capture.txt").exists()
     assert (hunter.transcripts_dir / "capture.json").exists()
+    assert (hunter.transcripts_dir / "capture.txt").read_text(encoding="utf-8") == (
+        "distress call from vessel\n"
+    )
+    saved_text = (hunter.transcripts_dir / "capture.json").read_text(encoding="utf-8")
+    assert json.loads(saved_text) == result
+    assert saved_text == json.dumps(result, indent=2, ensure_ascii=False)
 
 
 def test_transcribe_audio_file_probes_priority_languages_when_auto_is_uncertain(
@@ -206,8 +214,8 @@ def test_extended_capture_discards_noise_only_samples_before_write(
 
     write_calls = []
     monkeypatch.setattr(
-        autonomous_voice_hunter.sf,
-        "write",
+        autonomous_voice_hunter,
+        "write_pcm16_wav",
         lambda *args, **kwargs: write_calls.append((args, kwargs)),
     )
 
@@ -295,3 +303,244 @@ def test_transcribe_audio_file_supports_openai_whisper_backend(
     assert result["language"] == "en"
     assert result["backend"] == "openai-whisper"
     assert len(result["segments"]) == 2
+
+
+def test_transcribe_audio_file_reuses_loaded_model(monkeypatch, tmp_path: Path) -> None:
+    audio_path = tmp_path / "sample.wav"
+    _write_test_wav(audio_path)
+
+    loads = []
+
+    class DummyInfo:
+        language = "en"
+        language_probability = 0.99
+        duration = 0.2
+
+    class DummyModel:
+        def __init__(self, model_size: str, device: str, compute_type: str) -> None:
+            loads.append((model_size, device, compute_type))
+
+        def transcribe(self, audio_file: str, beam_size: int, vad_filter: bool, language=None):
+            return iter([types.SimpleNamespace(start=0.0, end=0.2, text="mayday")]), DummyInfo()
+
+    monkeypatch.setitem(
+        sys.modules,
+        "faster_whisper",
+        types.SimpleNamespace(WhisperModel=DummyModel),
+    )
+
+    for _ in range(3):
+        assert transcribe_audio_file(audio_path, WhisperConfig())["text"] == "mayday"
+
+    assert loads == [("large-v3", "auto", "default")]
+
+
+def test_autonomous_hunter_transcribes_immediately_by_default(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("KENNETH_DEFER_TRANSCRIPTION", raising=False)
+    hunter = autonomous_voice_hunter.AutonomousVoiceHunter(session_name="test-session")
+    assert hunter.defer_transcription is False
+
+    monkeypatch.setattr(
+        autonomous_voice_hunter,
+        "transcribe_audio_file",
+        lambda path, config: {"text": "mayday", "segments": [], "language": "en"},
+    )
+    audio_path = hunter.session_dir / "now.wav"
+    _write_test_wav(audio_path)
+    capture_info = {"file": audio_path}
+
+    assert hunter._queue_transcription(audio_path, "CH16", 156_800_000.0, capture_info)
+    assert capture_info["transcript"] == "mayday"
+    assert hunter.pending_transcriptions == []
+
+
+def test_autonomous_hunter_defers_transcription_to_batch_pass(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("KENNETH_DEFER_TRANSCRIPTION", "1")
+    hunter = autonomous_voice_hunter.AutonomousVoiceHunter(session_name="test-session")
+    assert hunter.defer_transcription is True
+
+    transcribed = []
+
+    def fake_transcribe(path, config):
+        transcribed.append(Path(path).name)
+        return {"text": f"call on {Path(path).stem}", "segments": [], "language": "en"}
+
+    monkeypatch.setattr(autonomous_voice_hunter, "transcribe_audio_file", fake_transcribe)
+
+    captures = []
+    for name in ("first.wav", "second.wav"):
+        audio_path = hunter.session_dir / name
+        _write_test_wav(audio_path)
+        capture_info = {"file": audio_path}
+        captures.append(capture_info)
+        assert hunter._queue_transcription(audio_path, "CH16", 156_800_000.0, capture_info) is None
+
+    # Reporting alone never runs Whisper
+    hunter.print_progress_summary("0:10:00")
+    assert transcribed == []
+
+    # The hunt loop flushes the queue at its progress summary, before scanning on
+    flushed_before_scan = []
+
+    def fake_scan_frequency(name, frequency_hz, prefetched=None):
+        flushed_before_scan.append(list(transcribed))
+        return None, 0
+
+    hunter.summary_interval = 0
+    hunter.max_runtime_hours = 0.05 / 3600
+    monkeypatch.setattr(
+        hunter, "create_rf_sample", lambda frequency_hz, duration: (np.zeros(8), False)
+    )
+    monkeypatch.setattr(hunter, "scan_frequency", fake_scan_frequency)
+    monkeypatch.setattr(autonomous_voice_hunter.time, "sleep", lambda *_args, **_kwargs: None)
+    hunter.run_autonomous_hunt()
+
+    assert flushed_before_scan[0] == ["first.wav", "second.wav"]
+    assert transcribed == ["first.wav", "second.wav"]
+    assert [cap["transcript"] for cap in captures] == ["call on first", "call on second"]
+    assert hunter.pending_transcriptions == []
+    assert hunter.transcribe_pending_captures() == 0
+
+
+def test_autonomous_hunter_scan_schedule_weights_priority_channels(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    hunter = autonomous_voice_hunter.AutonomousVoiceHunter(session_name="test-session")
+
+    schedule = hunter.build_scan_schedule()
+
+    ch16 = [entry for entry in schedule if entry.name == "CH16"]
+    assert len(ch16) == 3
+    assert ch16[0].comm_type == "Maritime"
+    assert ch16[0].freq_mhz == ch16[0].frequency_hz / 1e6
+    assert schedule[0].name == hunter.high_priority_maritime[0]
+    assert len({entry.name for entry in schedule}) == len(hunter.maritime_frequencies) + len(
+        hunter.aviation_frequencies
+    )
+    assert hunter.maritime_frequencies["CH16"] in hunter._priority_maritime_hz
+
+
+def test_write_pcm16_wav_clips_and_rounds_into_int16(tmp_path: Path) -> None:
+    audio_path = tmp_path / "capture.wav"
+    audio = np.array([0.0, 0.5, -0.5, 1.5, -1.5, 1e-5], dtype=np.float64)
+
+    autonomous_voice_hunter.write_pcm16_wav(audio_path, audio, 48000)
+
+    with wave.open(str(audio_path), "rb") as wav_file:
+        assert wav_file.getnchannels() == 1
+        assert wav_file.getsampwidth() == 2
+        assert wav_file.getframerate() == 48000
+        frames = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype="<i2")
+
+    np.testing.assert_array_equal(frames, [0, 16384, -16384, 32767, -32768, 0])
+
+
+def test_extended_capture_records_quick_scan_detection_features(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+    hunter = autonomous_voice_hunter.AutonomousVoiceHunter(session_name="test-session")
+
+    voice_audio = np.full(48_000, 0.2, dtype=np.float32)
+    monkeypatch.setattr(hunter, "create_rf_sample", lambda frequency_hz, duration: (voice_audio, True))
+    monkeypatch.setattr(hunter, "monitor_for_continued_activity", lambda *args, **kwargs: 0)
+    monkeypatch.setattr(hunter, "_queue_transcription", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        hunter, "detect_voice_activity", lambda *args, **kwargs: (True, 0.42, 0.31, 0.08)
+    )
+
+    capture_path, _ = hunter.scan_frequency("CH16", 156_800_000.0)
+
+    metadata = json.loads(hunter._capture_metadata_path(capture_path).read_text(encoding="utf-8"))
+    assert metadata["detection"] == {
+        "voice_score": 0.42,
+        "voice_ratio": 0.31,
+        "voice_ratio_threshold": 0.08,
+    }
+
+
+def test_detect_voice_activity_ratio_matches_full_rate_welch(monkeypatch, tmp_path: Path) -> None:
+    from scipy import signal
+
+    monkeypatch.chdir(tmp_path)
+    hunter = autonomous_voice_hunter.AutonomousVoiceHunter(session_name="test-session")
+
+    rng = np.random.default_rng(11)
+    t = np.arange(48_000 * 2) / 48_000
+    audio = (0.3 * np.sin(2 * np.pi * 800 * t) + rng.normal(0, 0.1, t.size)).astype(np.float32)
+
+    decimated, rate = autonomous_voice_hunter.decimate_for_analysis(
+        audio, 48_000, autonomous_voice_hunter.ANALYSIS_SAMPLE_RATE
+    )
+    assert rate == 16_000
+    assert decimated.dtype == np.float32
+    assert len(decimated) == len(audio) // 3
+
+    _, _, voice_ratio, _ = hunter.detect_voice_activity(audio, 48_000, 156_800_000.0)
+
+    freqs, psd = signal.welch(audio, 48_000, nperseg=1024)
+    band = (freqs >= 300) & (freqs <= 3400)
+    full_rate_ratio = np.sum(psd[band]) / np.sum(psd)
+    assert abs(voice_ratio - full_rate_ratio) < 0.01
+
+
+@pytest.mark.parametrize("tone_hz", [150.0, 200.0, 300.0])
+def test_steady_low_tone_has_no_modulation_depth(tone_hz: float) -> None:
+    t = np.arange(48_000 * 2) / 48_000
+    audio = (0.3 * np.sin(2 * np.pi * tone_hz * t)).astype(np.float32)
+
+    envelope = autonomous_voice_hunter.rfft_envelope(audio)
+    modulation_depth = autonomous_voice_hunter._sample_statistics(audio, envelope)[3]
+
+    assert modulation_depth < 1e-3
+
+
+def test_sample_statistics_fast_path_matches_numpy(monkeypatch) -> None:
+    rng = np.random.default_rng(5)
+    audio = rng.normal(0, 0.2, 48_000).astype(np.float32)
+    audio[::9] = 0.0
+    envelope = autonomous_voice_hunter.rfft_envelope(audio)
+
+    fast = autonomous_voice_hunter._sample_statistics(audio, envelope)
+    monkeypatch.setattr(autonomous_voice_hunter, "NUMBA_AVAILABLE", False)
+    reference = autonomous_voice_hunter._sample_statistics(audio, envelope)
+
+    np.testing.assert_allclose(fast, reference, rtol=1e-5)
+    assert autonomous_voice_hunter._sample_statistics(audio, envelope[:0])[3] == 0.0
+
+
+def test_run_autonomous_hunt_cycles_prefetched_schedule_until_deadline(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    hunter = autonomous_voice_hunter.AutonomousVoiceHunter(session_name="test-session")
+    hunter.max_runtime_hours = 0.2 / 3600
+
+    scanned = []
+
+    def fake_scan_frequency(name, frequency_hz, prefetched=None):
+        audio, _ = prefetched.result()
+        assert audio[0] == frequency_hz
+        scanned.append(name)
+        return None, 0
+
+    monkeypatch.setattr(
+        hunter,
+        "create_rf_sample",
+        lambda frequency_hz, duration: (np.full(8, frequency_hz), False),
+    )
+    monkeypatch.setattr(hunter, "scan_frequency", fake_scan_frequency)
+    monkeypatch.setattr(hunter, "build_scan_schedule", lambda: pytest.fail("schedule rebuilt"))
+    monkeypatch.setattr(autonomous_voice_hunter.time, "sleep", lambda *_args, **_kwargs: None)
+
+    hunter.run_autonomous_hunt()
+
+    schedule_names = [entry.name for entry in hunter.scan_schedule]
+    assert len(scanned) > len(schedule_names)
+    assert scanned[: len(schedule_names)] == schedule_names
+    assert scanned[len(schedule_names)] == schedule_names[0]
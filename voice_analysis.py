@@ -0,0 +1,67 @@
+"""Shared spectral helpers for Kenneth voice detection."""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+import scipy.fft
+from scipy import signal
+
+
+# Hann window for the 1024-point Welch PSD, built once instead of on every call
+WELCH_WINDOW = signal.windows.hann(1024, sym=False).astype(np.float32)
+
+
+def welch_window(length):
+    """
+    WELCH_WINDOW, or for inputs shorter than it the same Hann shape at the input
+    length (what scipy falls back to when nperseg exceeds the signal)
+    """
+    if length >= len(WELCH_WINDOW):
+        return WELCH_WINDOW
+    return signal.windows.hann(length, sym=False).astype(np.float32)
+
+
+@lru_cache(maxsize=None)
+def welch_voice_band(sample_rate, nperseg=len(WELCH_WINDOW)):
+    """[lo, hi) range of nperseg-length Welch bins covering 300-3400 Hz"""
+    freqs = np.fft.rfftfreq(nperseg, 1 / sample_rate)
+    return int(np.searchsorted(freqs, 300)), int(np.searchsorted(freqs, 3400, side='right'))
+
+
+def decimate_for_analysis(audio_data, sample_rate, analysis_rate, min_samples=0):
+    """
+    Polyphase-resample audio down to analysis_rate along the last axis; slower
+    rates, and results that would be shorter than min_samples, pass through.
+
+    The band-limited copy has lost the out-of-band noise, so a voice-band ratio
+    taken from its PSD should be normalized by the full-rate variance (a density
+    PSD integrates to the signal variance) rather than by the copy's own total.
+    """
+    sample_rate = int(sample_rate)
+    if sample_rate <= analysis_rate:
+        return audio_data, sample_rate
+    common = math.gcd(analysis_rate, sample_rate)
+    up, down = analysis_rate // common, sample_rate // common
+    if audio_data.shape[-1] * up // down < min_samples:
+        return audio_data, sample_rate
+    return signal.resample_poly(audio_data, up, down, axis=-1), analysis_rate
+
+
+def rfft_envelope(audio_batch):
+    """
+    |x + j*H{x}| along the last axis, matching np.abs(signal.hilbert(x)) but
+    taking the quadrature from a half-length real FFT instead of a complex round trip
+    """
+    n = audio_batch.shape[-1]
+    spectrum = scipy.fft.rfft(audio_batch, axis=-1)
+    # H{x}: -j on positive frequencies; DC and (even-length) Nyquist carry no quadrature
+    spectrum *= -1j
+    spectrum[..., 0] = 0
+    if n % 2 == 0:
+        spectrum[..., -1] = 0
+    envelope = scipy.fft.irfft(spectrum, n=n, axis=-1)
+    # sqrt(x**2 + h**2) in place; audio levels never need np.hypot's overflow guard
+    np.square(envelope, out=envelope)
+    envelope += np.square(audio_batch)
+    return np.sqrt(envelope, out=envelope)
@@ -15,6 +15,30 @@ import sys
 from scipy import signal
 from auto_tune import detect_wideband_active_frequencies
 from scan_config import demod_mode_by_frequency_hz, load_scan_config
+from voice_analysis import (
+    WELCH_WINDOW,
+    decimate_for_analysis,
+    rfft_envelope,
+    welch_voice_band,
+    welch_window,
+)
+
+# Analysis rate for the voice-band metrics; its 4 kHz Nyquist still covers 300-3400 Hz
+VOICE_ANALYSIS_RATE = 8000
+
+def synthesize_harmonics(t, fundamental, partials, out, scratch):
+    """
+    Sum amplitude-weighted sines at fundamental * multiple into out, reusing
+    scratch for each phase/sine instead of allocating a temporary per harmonic
+    """
+    for index, (multiple, amplitude) in enumerate(partials):
+        target = out if index == 0 else scratch
+        np.multiply(t, 2 * np.pi * fundamental * multiple, out=target)
+        np.sin(target, out=target)
+        target *= amplitude
+        if index:
+            out += scratch
+    return out
 
 class VoiceHuntingScanner:
     """Intelligent scanner that hunts for actual human speech"""
@@ -61,6 +85,19 @@ class VoiceHuntingScanner:
         self.long_sample_duration = 45  # 45-second samples when voice found
         self.voice_threshold = 0.08  # Voice detection threshold (8%)
 
+        # Read-only time vectors keyed by (duration, sample_rate)
+        self._t_cache = {}
+
+    def _get_time(self, duration, sample_rate):
+        """Shared np.linspace time vector for a sample length, built once per (duration, rate)"""
+        key = (duration, sample_rate)
+        t = self._t_cache.get(key)
+        if t is None:
+            t = np.linspace(0, duration, int(sample_rate * duration))
+            t.flags.writeable = False
+            self._t_cache[key] = t
+        return t
+
     def discover_wideband_activity(self):
         """Run a wideband SDR sweep and return detected active frequencies."""
         try:
@@ -83,8 +120,8 @@ class VoiceHuntingScanner:
         """Create realistic RF samples - some with voice, some just noise"""
         
         sample_rate = 48000
-        duration = self.sample_duration
-        t = np.linspace(0, duration, int(sample_rate * duration))
+        t = self._get_time(self.sample_duration, sample_rate)
+        scratch = np.empty_like(t)
         
         # Base RF characteristics
         if 'maritime' in freq_name.lower() or 'CH' in freq_name:
@@ -95,9 +132,8 @@ class VoiceHuntingScanner:
             if has_voice:
                 # Realistic boat captain or coast guard
                 voice_freq = np.random.choice([185, 200, 210, 225])  # Different voice pitches
-                voice = (np.sin(2 * np.pi * voice_freq * t) * 0.6 +
-                        np.sin(2 * np.pi * voice_freq * 2.1 * t) * 0.4 +
-                        np.sin(2 * np.pi * voice_freq * 3.2 * t) * 0.2)
+                voice = synthesize_harmonics(t, voice_freq, ((1, 0.6), (2.1, 0.4), (3.2, 0.2)),
+                                             np.empty_like(t), scratch)
                 
                 # Realistic speech patterns (key up/key down)
                 speech_pattern = np.concatenate([
@@ -127,9 +163,8 @@ class VoiceHuntingScanner:
             if has_voice:
                 # Pilot or ATC communication
                 voice_freq = np.random.choice([195, 205, 220, 235])
-                voice = (np.sin(2 * np.pi * voice_freq * t) * 0.5 +
-                        np.sin(2 * np.pi * voice_freq * 2.0 * t) * 0.3 +
-                        np.sin(2 * np.pi * voice_freq * 3.1 * t) * 0.15)
+                voice = synthesize_harmonics(t, voice_freq, ((1, 0.5), (2.0, 0.3), (3.1, 0.15)),
+                                             np.empty_like(t), scratch)
                 
                 # Aviation speech patterns (more clipped, professional)
                 speech_pattern = np.concatenate([
@@ -155,20 +190,31 @@ class VoiceHuntingScanner:
         
         if len(audio_data) < 1000:
             return False, 0.0
-            
+        
         # Voice detection metrics
         rms = np.sqrt(np.mean(audio_data**2))
         
-        # Spectral analysis for voice frequencies (300-3400 Hz)
-        freqs, psd = signal.welch(audio_data, sample_rate, nperseg=1024)
-        voice_band = (freqs >= 300) & (freqs <= 3400)
-        voice_power = np.sum(psd[voice_band])
-        total_power = np.sum(psd)
+        # Spectral analysis for voice frequencies (300-3400 Hz) on an 8 kHz copy;
+        # buffers too short for a full Welch segment after decimation stay at full rate
+        analysis_audio, analysis_rate = decimate_for_analysis(
+            audio_data, sample_rate, VOICE_ANALYSIS_RATE, min_samples=len(WELCH_WINDOW)
+        )
+        window = welch_window(len(analysis_audio))
+        freqs, psd = signal.welch(analysis_audio, analysis_rate, window=window)
+        voice_lo, voice_hi = welch_voice_band(analysis_rate, len(window))
+        voice_power = np.sum(psd[voice_lo:voice_hi])
+        if analysis_rate == sample_rate:
+            total_power = np.sum(psd)
+        else:
+            voice_power *= freqs[1] - freqs[0]
+            total_power = np.var(audio_data)
         
         voice_ratio = voice_power / (total_power + 1e-10)
         
-        # Modulation depth (speech has high modulation)
-        envelope = np.abs(signal.hilbert(audio_data))
+        # Modulation depth (speech has high modulation). The envelope stays at the
+        # full rate: out-of-band carriers shape it, and dropping them with the
+        # decimation would change the score.
+        envelope = rfft_envelope(audio_data)
         envelope_mean = np.mean(envelope)
         envelope_std = np.std(envelope)
         modulation_depth = envelope_std / (envelope_mean + 1e-10)
@@ -178,7 +224,7 @@ class VoiceHuntingScanner:
         
         has_voice = voice_score > self.voice_threshold
         
-        return has_voice, voice_score
+        return bool(has_voice), float(voice_score)
     
     def scan_frequency(self, freq_name, frequency_hz):
         """Quick scan of a frequency to detect voice activity"""
@@ -234,8 +280,7 @@ class VoiceHuntingScanner:
         
         # Create realistic long conversation
         sample_rate = 48000
-        duration = self.long_sample_duration
-        t = np.linspace(0, duration, int(sample_rate * duration))
+        t = self._get_time(self.long_sample_duration, sample_rate)
         
         # Extended realistic conversation
         if 'maritime' in freq_name.lower() or 'CH' in freq_name:
@@ -304,6 +349,7 @@ class VoiceHuntingScanner:
         """Build audio from conversation segments"""
         
         conversation_audio = np.zeros_like(t)
+        scratch = np.empty_like(t)
         current_time = 0
         
         for freq, duration, description in segments:
@@ -314,14 +360,19 @@ class VoiceHuntingScanner:
                 break
                 
             if freq > 0:  # Voice segment
+                # Synthesize straight into this segment's slice of the output
                 segment_t = t[start_idx:end_idx]
-                voice = (np.sin(2 * np.pi * freq * segment_t) * 0.6 +
-                        np.sin(2 * np.pi * freq * 2.1 * segment_t) * 0.4 +
-                        np.sin(2 * np.pi * freq * 3.2 * segment_t) * 0.2)
+                voice = conversation_audio[start_idx:end_idx]
+                segment_scratch = scratch[:len(segment_t)]
+                synthesize_harmonics(segment_t, freq, ((1, 0.6), (2.1, 0.4), (3.2, 0.2)),
+                                     voice, segment_scratch)
                 
                 # Speech envelope
-                voice *= np.exp(-0.1 * np.abs(segment_t - np.mean(segment_t)))
-                conversation_audio[start_idx:end_idx] = voice
+                np.subtract(segment_t, np.mean(segment_t), out=segment_scratch)
+                np.abs(segment_scratch, out=segment_scratch)
+                segment_scratch *= -0.1
+                np.exp(segment_scratch, out=segment_scratch)
+                voice *= segment_scratch
                 
                 print(f"      🎙️  {description}")
             
@@ -329,16 +380,17 @@ class VoiceHuntingScanner:
         
         # Add appropriate background noise
         if comm_type == "maritime":
-            noise = np.random.normal(0, 0.2, len(t))
-            atmospheric = 0.1 * np.sin(2 * np.pi * 0.02 * t)
-            background = noise + atmospheric
+            background = np.random.normal(0, 0.2, len(t))
+            background += synthesize_harmonics(t, 0.02, ((1, 0.1),), scratch, None)  # atmospheric
         else:  # aviation
-            noise = np.random.normal(0, 0.15, len(t))  
-            equipment = 0.05 * np.sin(2 * np.pi * 60 * t)
-            background = noise + equipment
-        
-        final_audio = conversation_audio + background
-        return final_audio / np.max(np.abs(final_audio)) * 0.8
+            background = np.random.normal(0, 0.15, len(t))
+            background += synthesize_harmonics(t, 60, ((1, 0.05),), scratch, None)  # equipment
+        
+        final_audio = conversation_audio
+        final_audio += background
+        final_audio /= np.max(np.abs(final_audio))
+        final_audio *= 0.8
+        return final_audio
     
     def hunt_for_voices(self):
         """Main voice hunting loop"""
@@ -12,11 +12,12 @@ import json
 from datetime import datetime
 import logging
 from scipy import signal
-from scipy.fft import fft
+from scipy.fft import fft, rfft, rfftfreq
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor
 import threading
 from tqdm import tqdm
+from voice_analysis import WELCH_WINDOW, welch_voice_band
 
 class VoiceQualityInspector:
     """Advanced voice quality analysis for RF captures"""
@@ -25,6 +26,7 @@ class VoiceQualityInspector:
         self.capture_dir = Path(capture_dir)
         self.results = []
         self.lock = threading.Lock()
+        self.min_rms_energy = 0.005  # Files quieter than this are rejected without full analysis
         
         # Setup logging
         logging.basicConfig(level=logging.INFO,
@@ -35,8 +37,8 @@ class VoiceQualityInspector:
         """Advanced multi-parameter voice detection"""
         
         try:
-            # Load audio
-            audio, sample_rate = sf.read(str(audio_file))
+            # Load audio as float32 so every analysis pass below stays single precision
+            audio, sample_rate = sf.read(str(audio_file), dtype='float32')
             
             if len(audio) == 0:
                 return {
@@ -57,18 +59,36 @@ class VoiceQualityInspector:
             # 1. RMS Energy Analysis
             rms_energy = np.sqrt(np.mean(audio**2))
             
+            # Below the voice floor nothing else can rescue the file; skip the
+            # Welch/Hilbert/autocorrelation passes entirely
+            if rms_energy < self.min_rms_energy:
+                return {
+                    'file': audio_file.name,
+                    'has_voice': False,
+                    'confidence': 0.0,
+                    'reasons': ['low_energy'],
+                    'duration': duration,
+                    'rms_energy': float(rms_energy),
+                    'voice_band_ratio': 0.0,
+                    'spectral_centroid': 0.0,
+                    'zero_crossing_rate': 0.0,
+                    'voice_probability': 0.0
+                }
+            
             # 2. Spectral Analysis
             if len(audio) > 1024:
-                freqs, psd = signal.welch(audio, sample_rate, nperseg=1024)
+                freqs, psd = signal.welch(audio, sample_rate, window=WELCH_WINDOW)
+                
+                # Total PSD energy is reduced once and shared by both ratios below
+                total_energy = psd.sum()
                 
                 # Voice band (300-3400 Hz) vs total energy
-                voice_band_mask = (freqs >= 300) & (freqs <= 3400)
-                voice_band_energy = np.sum(psd[voice_band_mask])
-                total_energy = np.sum(psd)
+                voice_lo, voice_hi = welch_voice_band(sample_rate)
+                voice_band_energy = np.sum(psd[voice_lo:voice_hi])
                 voice_band_ratio = voice_band_energy / total_energy if total_energy > 0 else 0
                 
                 # Spectral centroid (brightness measure)
-                spectral_centroid = np.sum(freqs * psd) / np.sum(psd) if np.sum(psd) > 0 else 0
+                spectral_centroid = np.dot(freqs, psd) / total_energy if total_energy > 0 else 0
                 
             else:
                 voice_band_ratio = 0
@@ -222,15 +242,17 @@ class VoiceQualityInspector:
             # Smooth the envelope
             envelope = signal.savgol_filter(envelope, min(51, len(envelope)//10 | 1), 3)
             
-            # FFT of envelope to find modulation frequencies
-            envelope_fft = np.abs(fft(envelope))
-            mod_freqs = np.fft.fftfreq(len(envelope_fft), 1/sample_rate)
+            # Real FFT of envelope to find modulation frequencies; drop the
+            # Nyquist bin so the total matches the non-negative half of fft()
+            envelope_fft = np.abs(rfft(envelope))[:(len(envelope) + 1) // 2]
+            mod_freqs = rfftfreq(len(envelope), 1/sample_rate)[:len(envelope_fft)]
             
             # Look for modulation in 2-10 Hz range (speech range)
-            mod_mask = (mod_freqs >= 2) & (mod_freqs <= 10)
-            if np.any(mod_mask):
-                speech_mod_power = np.sum(envelope_fft[mod_mask])
-                total_mod_power = np.sum(envelope_fft[mod_freqs >= 0])
+            mod_lo = np.searchsorted(mod_freqs, 2)
+            mod_hi = np.searchsorted(mod_freqs, 10, side='right')
+            if mod_hi > mod_lo:
+                speech_mod_power = np.sum(envelope_fft[mod_lo:mod_hi])
+                total_mod_power = np.sum(envelope_fft)
                 
                 return speech_mod_power / total_mod_power if total_mod_power > 0 else 0
             
@@ -6,6 +6,7 @@ Whisper transcription helpers for Kenneth RF captures.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -30,6 +31,25 @@ class WhisperDependencyError(RuntimeError):
     """Raised when no supported Whisper backend is available."""
 
 
+@lru_cache(maxsize=2)
+def _get_faster_model(model_cls, model_size: str, device: str, compute_type: str):
+    """
+    Load a faster-whisper model once per (size, device, compute type) and reuse it.
+
+    The model class is part of the key so a swapped-in backend never receives a
+    model built by another one.
+    """
+    return model_cls(model_size, device=device, compute_type=compute_type)
+
+
+@lru_cache(maxsize=2)
+def _get_openai_model(load_model, model_size: str):
+    """
+    Load an openai-whisper model once per size and reuse it.
+    """
+    return load_model(model_size)
+
+
 def transcribe_audio_file(
     audio_file_path: str | Path,
     config: Optional[WhisperConfig] = None,
@@ -56,10 +76,11 @@ def transcribe_audio_file(
         except ImportError:
             return None
 
-        model = WhisperModel(
+        model = _get_faster_model(
+            WhisperModel,
             cfg.model_size,
-            device=cfg.device,
-            compute_type=cfg.compute_type,
+            cfg.device,
+            cfg.compute_type,
         )
 
         def _run(language_hint: Optional[str]) -> Dict[str, Any]:
@@ -86,7 +107,7 @@ def transcribe_audio_file(
         except ImportError:
             return None
 
-        model = whisper.load_model(cfg.model_size)
+        model = _get_openai_model(whisper.load_model, cfg.model_size)
 
         def _run(language_hint: Optional[str]) -> Dict[str, Any]:
             result = model.transcribe(
@@ -150,8 +150,7 @@ def convert_iq_to_audio(iq_file, timestamp):
         print(f"   📊 Processing {len(iq_samples):,} real IQ samples")
         
         # FM demodulation for maritime VHF
-        phase = np.unwrap(np.angle(iq_samples))
-        fm_demod = np.diff(phase)
+        fm_demod = np.angle(iq_samples[1:] * np.conj(iq_samples[:-1]))
         
         # Decimate to audio rate
         audio_rate = 48000